@@ -3,6 +3,7 @@
 See also test_cellbudgetfile.py for similar tests.
 """
 
+import shutil
 from itertools import repeat
 
 import numpy as np
@@ -10,7 +11,7 @@ import pandas as pd
 import pytest
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
-from modflow_devtools.markers import requires_exe
+from modflow_devtools.markers import requires_exe, requires_pkg
 
 import flopy
 from flopy.utils import (
@@ -21,7 +22,7 @@ from flopy.utils import (
     UcnFile,
     Util2d,
 )
-from flopy.utils.binaryfile import get_headfile_precision
+from flopy.utils.binaryfile import _read_index_cache, get_headfile_precision
 
 
 @pytest.fixture
@@ -39,6 +40,17 @@ def zonbud_model_path(example_data_path):
     return example_data_path / "zonbud_examples"
 
 
+@pytest.fixture
+def tidal_hds_path(example_data_path):
+    return (
+        example_data_path
+        / "mf6"
+        / "test005_advgw_tidal"
+        / "expected_output"
+        / "AdvGW_tidal.hds"
+    )
+
+
 def test_binaryread(example_data_path):
     # test low-level binaryread() method
     pth = example_data_path / "freyberg" / "freyberg.githds"
@@ -197,6 +209,183 @@ def test_concentration_build_index(example_data_path):
     )
 
 
+@pytest.mark.parametrize(
+    "cls, relpath",
+    [
+        (HeadFile, "mf6-freyberg/freyberg.hds"),
+        (HeadFile, "freyberg/freyberg.githds"),
+        (UcnFile, "mt3d_test/mf2005mt3d/P07/MT3D001.UCN"),
+        (HeadUFile, "unstructured/headu.githds"),
+    ],
+)
+def test_build_index_strided(example_data_path, cls, relpath, monkeypatch):
+    # the memory-mapped index must match the record-by-record scan
+    pth = example_data_path / relpath
+    with cls(pth) as strided:
+        pass
+    monkeypatch.setattr(cls, "_build_index_strided", lambda self, header: False)
+    with cls(pth) as scanned:
+        pass
+    assert strided.recordarray.dtype == scanned.recordarray.dtype
+    np.testing.assert_array_equal(strided.recordarray, scanned.recordarray)
+    np.testing.assert_array_equal(strided.iposarray, scanned.iposarray)
+    assert strided.iposarray.dtype == np.int64
+    assert strided.times == scanned.times
+    assert strided.kstpkper == scanned.kstpkper
+    assert strided.nlay == scanned.nlay
+    pd.testing.assert_frame_equal(strided.headers, scanned.headers)
+
+
+def test_build_index_strided_fallback(example_data_path):
+    # layers of an unstructured head file differ in size, so strided
+    # indexing must decline and leave the index to the full scan
+    pth = example_data_path / "unstructured" / "headu.githds"
+    with HeadUFile(pth) as hds:
+        assert not hds._build_index_strided(hds.recordarray[0])
+        assert len(hds) == 15
+
+
+def test_headfile_cache_index(tidal_hds_path, function_tmpdir, monkeypatch):
+    pth = function_tmpdir / "AdvGW_tidal.hds"
+    shutil.copy(tidal_hds_path, pth)
+    sidecar = function_tmpdir / "AdvGW_tidal.hds.flopyidx"
+
+    with HeadFile(pth, cache_index=True) as hds:
+        expected = hds.get_data(idx=len(hds) - 1)
+    assert sidecar.is_file()
+
+    # the sidecar is only valid for the reader and options that wrote it
+    kind = hds._index_cache_kind()
+    assert _read_index_cache(pth, kind) is not None
+    assert _read_index_cache(pth, kind.replace("HEAD", "DRAWDOWN")) is None
+
+    # the sidecar is loaded instead of rescanning the file
+    def fail(*args, **kwargs):
+        raise AssertionError("index was rebuilt")
+
+    monkeypatch.setattr(HeadFile, "_build_index_strided", fail)
+    monkeypatch.setattr(HeadFile, "_build_index_scan", fail)
+    with HeadFile(pth, cache_index=True) as cached:
+        data = cached.get_data(idx=len(cached) - 1)
+    np.testing.assert_array_equal(cached.recordarray, hds.recordarray)
+    np.testing.assert_array_equal(cached.iposarray, hds.iposarray)
+    assert cached.times == hds.times
+    assert cached.kstpkper == hds.kstpkper
+    assert cached.nlay == hds.nlay
+    pd.testing.assert_frame_equal(cached.headers, hds.headers)
+    np.testing.assert_array_equal(data, expected)
+
+    # a truncated file invalidates the sidecar and the index is rebuilt
+    monkeypatch.undo()
+    with open(pth, "r+b") as f:
+        f.truncate(hds.iposarray[-3] - hds.header_dtype.itemsize)
+    with HeadFile(pth, cache_index=True) as hds:
+        assert len(hds) == len(cached) - 3
+
+
+def test_binary_layer_array(tidal_hds_path):
+    from flopy.utils.binaryfile import _BinaryLayerArray
+
+    with HeadFile(tidal_hds_path) as hds:
+        alldata = hds.get_alldata(nodata=np.nan)
+        ipos = hds._get_record_positions()
+        array = _BinaryLayerArray(hds.filename, hds.realtype, alldata.shape, ipos)
+    assert array.shape == alldata.shape
+    np.testing.assert_array_equal(array[...], alldata)
+    np.testing.assert_array_equal(array[5], alldata[5])
+    np.testing.assert_array_equal(
+        array[10:20:3, 1:, 2, ::2], alldata[10:20:3, 1:, 2, ::2]
+    )
+    np.testing.assert_array_equal(array[-1, ..., 4], alldata[-1, ..., 4])
+
+    # layers that were not saved are nan
+    ipos[3, 1] = -1
+    array = _BinaryLayerArray(hds.filename, hds.realtype, alldata.shape, ipos)
+    assert np.isnan(array[3, 1]).all()
+    np.testing.assert_array_equal(array[3, 0], alldata[3, 0])
+
+
+@requires_pkg("dask")
+def test_headfile_as_dask(tidal_hds_path):
+    with HeadFile(tidal_hds_path) as hds:
+        alldata = hds.get_alldata(nodata=np.nan)
+        data = hds.as_dask()
+        assert data.shape == alldata.shape
+        assert data.chunksize == (1,) + alldata.shape[1:]
+        np.testing.assert_array_equal(data.compute(), alldata)
+        np.testing.assert_allclose(data.max(axis=0).compute(), alldata.max(axis=0))
+        data = hds.as_dask(chunks=(50, 1, 5, 5), nodata=alldata[0, 0, 0, 0])
+        expected = alldata.copy()
+        expected[expected == alldata[0, 0, 0, 0]] = np.nan
+        np.testing.assert_array_equal(data.compute(), expected)
+
+
+@requires_pkg("dask")
+def test_headufile_as_dask(example_data_path):
+    with HeadUFile(example_data_path / "unstructured" / "headu.githds") as hds:
+        with pytest.raises(ValueError, match="nrow, ncol"):
+            hds.as_dask()
+
+
+@requires_pkg("dask", "xarray")
+def test_headfile_to_xarray(tidal_hds_path):
+    with HeadFile(tidal_hds_path) as hds:
+        alldata = hds.get_alldata(nodata=np.nan)
+        da = hds.to_xarray(chunks={0: 100})
+        assert da.dims == ("time", "layer", "row", "column")
+        assert da.name == "head"
+        np.testing.assert_array_equal(da.time, hds.times)
+        assert list(zip(da.kstp.values, da.kper.values)) == hds.get_kstpkper()
+        np.testing.assert_array_equal(da.isel(time=7, layer=2).values, alldata[7, 2])
+        np.testing.assert_array_equal(da.values, alldata)
+
+
+@pytest.mark.parametrize("mflay", [None, 1])
+@pytest.mark.parametrize("chunk_records", [None, 1, 7])
+def test_headfile_reduce(tidal_hds_path, mflay, chunk_records):
+    ops = [
+        "min",
+        "max",
+        "sum",
+        "mean",
+        "count",
+        "exceedance_count",
+        "first_exceedance",
+    ]
+    with HeadFile(tidal_hds_path) as hds:
+        alldata = hds.get_alldata(mflay=mflay, nodata=np.nan)
+        threshold = np.median(alldata)
+        nodata = alldata[0].flat[0]
+        stats = hds.reduce(
+            ops,
+            mflay=mflay,
+            threshold=threshold,
+            nodata=nodata,
+            chunk_records=chunk_records,
+        )
+        times = np.array(hds.times)
+
+    alldata[alldata == nodata] = np.nan
+    assert set(stats) == set(ops)
+    np.testing.assert_array_equal(stats["min"], np.nanmin(alldata, axis=0))
+    np.testing.assert_array_equal(stats["max"], np.nanmax(alldata, axis=0))
+    np.testing.assert_allclose(stats["sum"], np.nansum(alldata, axis=0))
+    np.testing.assert_allclose(stats["mean"], np.nanmean(alldata, axis=0))
+    np.testing.assert_array_equal(stats["count"], (~np.isnan(alldata)).sum(axis=0))
+    above = alldata > threshold
+    np.testing.assert_array_equal(stats["exceedance_count"], above.sum(axis=0))
+    first = np.where(above.any(axis=0), times[above.argmax(axis=0)], np.nan)
+    np.testing.assert_array_equal(stats["first_exceedance"], first)
+
+
+def test_headfile_reduce_errors(tidal_hds_path):
+    with HeadFile(tidal_hds_path) as hds:
+        with pytest.raises(ValueError, match="unknown op"):
+            hds.reduce("median")
+        with pytest.raises(ValueError, match="threshold"):
+            hds.reduce(["max", "exceedance_count"])
+
+
 def test_binaryfile_writeread(function_tmpdir, nwt_model_path):
     model = "Pr3_MFNWT_lower.nam"
     ml = flopy.modflow.Modflow.load(model, version="mfnwt", model_ws=nwt_model_path)
@@ -422,6 +611,30 @@ def test_binaryfile_read_context(freyberg_model_path):
     assert str(e.value) == "seek of closed file", str(e.value)
 
 
+@pytest.mark.parametrize("use_memmap", [True, False])
+def test_headfile_get_ts(tidal_hds_path, use_memmap, monkeypatch):
+    hds = HeadFile(tidal_hds_path)
+    if not use_memmap:
+
+        def no_memmap(*args, **kwargs):
+            raise OSError("memory mapping unavailable")
+
+        monkeypatch.setattr(np, "memmap", no_memmap)
+
+    cells = [(0, 0, 0), (2, 14, 9), (1, 10, 5), (0, 10, 5), (2, 0, 3)]
+    ts = hds.get_ts(cells)
+    alldata = hds.get_alldata(nodata=np.nan)
+    assert ts.shape == (len(hds.times), len(cells) + 1)
+    np.testing.assert_array_equal(ts[:, 0], hds.times)
+    for istat, (k, i, j) in enumerate(cells, start=1):
+        np.testing.assert_array_equal(ts[:, istat], alldata[:, k, i, j])
+
+    # a single cell returns a single data column
+    ts1 = hds.get_ts((1, 10, 5))
+    np.testing.assert_array_equal(ts1, ts[:, [0, 3]])
+    hds.close()
+
+
 @pytest.fixture
 @pytest.mark.mf6
 @requires_exe("mf6")
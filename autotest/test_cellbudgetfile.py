@@ -1,4 +1,7 @@
 import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -6,7 +9,7 @@ import pytest
 
 from autotest.conftest import get_example_data_path
 from flopy.mf6.modflow.mfsimulation import MFSimulation
-from flopy.utils.binaryfile import CellBudgetFile
+from flopy.utils.binaryfile import CellBudgetFile, _read_index_cache
 
 # test low-level CellBudgetFile._build_index() method
 
@@ -357,6 +360,138 @@ def test_budgetfile_detect_precision_double(path):
     assert file.realtype == np.float64
 
 
+@pytest.mark.parametrize(
+    "relpath",
+    [
+        "mf2005_test/test1tr.gitcbc",
+        "mf6/create_tests/test028_sfr/expected_output/test1tr.cbc",
+    ],
+)
+def test_cellbudgetfile_cache_index(example_data_path, function_tmpdir, relpath):
+    pth = function_tmpdir / Path(relpath).name
+    shutil.copy(example_data_path / relpath, pth)
+    sidecar = pth.with_name(pth.name + ".flopyidx")
+
+    with CellBudgetFile(pth, cache_index=True) as cbc:
+        expected = cbc.get_data(idx=len(cbc) - 1)
+    assert sidecar.is_file()
+
+    # the sidecar is loaded instead of rescanning the file
+    with patch.object(CellBudgetFile, "_build_index_scan", side_effect=AssertionError):
+        with CellBudgetFile(pth, cache_index=True) as cached:
+            actual = cached.get_data(idx=len(cached) - 1)
+    np.testing.assert_array_equal(cached.recordarray, cbc.recordarray)
+    np.testing.assert_array_equal(cached.iposheader, cbc.iposheader)
+    np.testing.assert_array_equal(cached.iposarray, cbc.iposarray)
+    assert cached.realtype == cbc.realtype
+    assert cached.times == cbc.times
+    assert cached.kstpkper == cbc.kstpkper
+    assert cached.textlist == cbc.textlist
+    assert cached.imethlist == cbc.imethlist
+    assert cached.paknamlist_from == cbc.paknamlist_from
+    assert cached.paknamlist_to == cbc.paknamlist_to
+    assert (cached.nrow, cached.ncol, cached.nlay) == (cbc.nrow, cbc.ncol, cbc.nlay)
+    assert cached.nper == cbc.nper
+    pd.testing.assert_frame_equal(cached.headers, cbc.headers)
+    for a, b in zip(actual, expected):
+        np.testing.assert_array_equal(a, b)
+
+    # a stale sidecar is rebuilt, after which it is valid again
+    stat = pth.stat()
+    os.utime(pth, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _read_index_cache(pth, "CellBudgetFile") is None
+    with CellBudgetFile(pth, cache_index=True):
+        pass
+    assert _read_index_cache(pth, "CellBudgetFile") is not None
+    with patch.object(CellBudgetFile, "_build_index_scan", side_effect=AssertionError):
+        with CellBudgetFile(pth, cache_index=True):
+            pass
+
+
+@pytest.mark.parametrize(
+    "relpath",
+    [
+        "mf2005_test/test1tr.gitcbc",
+        "mf6/create_tests/test028_sfr/expected_output/test1tr.cbc",
+    ],
+)
+def test_cellbudgetfile_record_cache(example_data_path, relpath):
+    with CellBudgetFile(example_data_path / relpath) as cbc:
+        expected = [cbc.get_record(idx) for idx in range(len(cbc))]
+
+    nbytes = sum(
+        sum(a.nbytes for a in rec) if isinstance(rec, list) else rec.nbytes
+        for rec in expected[:3]
+    )
+    with CellBudgetFile(
+        example_data_path / relpath, cache_size=nbytes, memmap=True
+    ) as cbc:
+        for idx, exp in enumerate(expected):
+            rec = cbc.get_record(idx)
+            if isinstance(exp, list):
+                for a, b in zip(rec, exp):
+                    np.testing.assert_array_equal(a, b)
+            else:
+                np.testing.assert_array_equal(rec, exp)
+            assert cbc._record_cache_nbytes <= nbytes
+        assert len(cbc._record_cache) > 0
+
+        # cached records are returned again and cannot be modified
+        idx = len(cbc) - 1
+        rec = cbc.get_record(idx)
+        assert cbc.get_record(idx) is rec
+        with pytest.raises(ValueError):
+            rec[...] = 0
+
+        cbc.clear_cache()
+        assert len(cbc._record_cache) == 0
+        assert cbc._record_cache_nbytes == 0
+
+
+def test_cellbudgetfile_memmap(example_data_path):
+    pth = example_data_path / "mf6" / "create_tests" / "test028_sfr"
+    pth = pth / "expected_output" / "test1tr.cbc"
+    with CellBudgetFile(pth) as cbc:
+        expected = cbc.get_data(text="SFR")
+        expected3d = cbc.get_data(text="SFR", full3D=True)
+    with CellBudgetFile(pth, memmap=True) as cbc:
+        actual = cbc.get_data(text="SFR")
+        actual3d = cbc.get_data(text="SFR", full3D=True)
+        assert cbc._mmap is not None
+    assert cbc._mmap is None
+    assert len(actual) == len(expected)
+    for a, b in zip(actual, expected):
+        assert isinstance(a, np.recarray)
+        assert not a.flags.writeable
+        assert a.dtype == b.dtype
+        np.testing.assert_array_equal(a, b)
+    for a, b in zip(actual3d, expected3d):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_cellbudgetfile_get_data_stacked(example_data_path):
+    pth = example_data_path / "mf2005_test" / "test1tr.gitcbc"
+    with CellBudgetFile(pth) as cbc:
+        # array records are read straight into the stacked array
+        expected = cbc.get_data(text="FLOW RIGHT FACE")
+        stacked = cbc.get_data(text="FLOW RIGHT FACE", stacked=True)
+        assert isinstance(stacked, np.ndarray)
+        assert stacked.shape == (len(expected),) + expected[0].shape
+        np.testing.assert_array_equal(stacked, np.stack(expected))
+
+        # list records are stacked after conversion to full 3D arrays
+        expected = cbc.get_data(text="WELLS", full3D=True)
+        stacked = cbc.get_data(text="WELLS", full3D=True, stacked=True)
+        assert isinstance(stacked, np.ma.MaskedArray)
+        np.testing.assert_array_equal(stacked, np.ma.stack(expected))
+        np.testing.assert_array_equal(
+            np.ma.getmaskarray(stacked), np.ma.getmaskarray(np.ma.stack(expected))
+        )
+
+        with pytest.raises(ValueError):
+            cbc.get_data(text="WELLS", stacked=True)
+
+
 def test_cellbudgetfile_position(function_tmpdir, zonbud_model_path):
     fpth = zonbud_model_path / "freyberg.gitcbc"
     v = CellBudgetFile(fpth)
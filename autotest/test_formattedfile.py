@@ -75,6 +75,17 @@ def test_formattedfile_reference(example_data_path):
     plt.close()
 
 
+def test_formattedfile_reduce(example_data_path):
+    h = FormattedHeadFile(example_data_path / "mf2005_test" / "test1tr.githds")
+    alldata = h.get_alldata(nodata=np.nan)
+    stats = h.reduce(["min", "max", "mean", "count"])
+    np.testing.assert_array_equal(stats["min"], alldata.min(axis=0))
+    np.testing.assert_array_equal(stats["max"], alldata.max(axis=0))
+    np.testing.assert_allclose(stats["mean"], alldata.mean(axis=0, dtype=np.float64))
+    np.testing.assert_array_equal(stats["count"], len(h.times))
+    h.close()
+
+
 def test_formattedfile_read(function_tmpdir, example_data_path):
     mf2005_model_path = example_data_path / "mf2005_test"
     h = FormattedHeadFile(mf2005_model_path / "test1tr.githds")
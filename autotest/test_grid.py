@@ -347,6 +347,47 @@ def test_structured_xyz_intersect(example_data_path):
             raise AssertionError("Structured grid intersection failed")
 
 
+@pytest.mark.parametrize("angrot", [0.0, 30.0])
+def test_structured_intersect_points(angrot):
+    nlay, nrow, ncol = 3, 4, 5
+    delr = np.array([1.0, 2.0, 1.5, 3.0, 1.0])
+    delc = np.array([2.0, 1.0, 1.0, 2.5])
+    top = np.full((nrow, ncol), 10.0)
+    botm = np.stack([np.full((nrow, ncol), z) for z in (5.0, 0.0, -5.0)])
+    mg = StructuredGrid(delc, delr, top, botm, xoff=100.0, yoff=200.0, angrot=angrot)
+
+    # cell centers, a shared cell edge and a point outside the grid
+    xc, yc, zc = mg.xyzcellcenters
+    k, i, j = np.indices((nlay, nrow, ncol)).reshape(3, -1)
+    x = np.tile(xc.ravel(), nlay)
+    y = np.tile(yc.ravel(), nlay)
+    lay, row, col = mg.intersect(x, y, zc.ravel())
+    np.testing.assert_array_equal(lay, k)
+    np.testing.assert_array_equal(row, i)
+    np.testing.assert_array_equal(col, j)
+
+    xl = np.array([delr[0], 0.5, -1.0])
+    yl = np.array([delc.sum() - 0.5, delc.sum() - delc[0], 0.5])
+    x, y = mg.get_coords(xl, yl)
+    row, col = mg.intersect(x, y, forgive=True)
+    np.testing.assert_array_equal(row, [0, 0, np.nan])
+    np.testing.assert_array_equal(col, [0, 0, np.nan])
+    row, col = mg.intersect(xl[:2], yl[:2], local=True)
+    np.testing.assert_array_equal(row, [0, 0])
+    np.testing.assert_array_equal(col, [0, 0])
+    for xp, yp, r, c in zip(x[:2], y[:2], row, col):
+        assert mg.intersect(xp, yp) == (r, c)
+    with pytest.raises(Exception, match="outside of the model area"):
+        mg.intersect(x, y)
+
+    # points below the bottom of the grid
+    lay, row, col = mg.intersect(x[:2], y[:2], [7.0, -7.0], forgive=True)
+    np.testing.assert_array_equal(lay, [0, np.nan])
+    np.testing.assert_array_equal(row, [0, np.nan])
+    with pytest.raises(Exception, match="outside the model area"):
+        mg.intersect(x[:2], y[:2], [7.0, -7.0])
+
+
 def test_vertex_xyz_intersect(example_data_path):
     sim = MFSimulation.load(sim_ws=example_data_path / "mf6" / "test003_gwfs_disv")
     ml = sim.get_model(next(iter(sim.model_names)))
@@ -419,6 +460,66 @@ def test_unstructured_xyz_intersect(example_data_path):
             raise AssertionError("Unstructured grid intersection failed")
 
 
+def test_vertex_intersect_points(example_data_path):
+    sim = MFSimulation.load(sim_ws=example_data_path / "mf6" / "test003_gwfs_disv")
+    ml = sim.get_model(next(iter(sim.model_names)))
+    mg = ml.modelgrid
+    xc, yc, zc = mg.xyzcellcenters
+
+    # cell centers, cell vertices and points outside the grid
+    xv, yv, _ = mg.xyzvertices
+    x = np.concatenate((xc, [xv[0][0], xv[5][1]], [-1e6]))
+    y = np.concatenate((yc, [yv[0][0], yv[5][1]], [-1e6]))
+    expected = [mg.intersect(xp, yp, forgive=True) for xp, yp in zip(x, y)]
+    icell2d = mg.intersect(x, y, forgive=True)
+    np.testing.assert_array_equal(icell2d, expected)
+    np.testing.assert_array_equal(icell2d[: mg.ncpl], np.arange(mg.ncpl))
+    assert np.isnan(icell2d[-1])
+    with pytest.raises(Exception, match="outside of the model area"):
+        mg.intersect(x, y)
+
+    lay, icell2d = mg.intersect(np.tile(xc, mg.nlay), np.tile(yc, mg.nlay), zc.ravel())
+    np.testing.assert_array_equal(lay, np.repeat(np.arange(mg.nlay), mg.ncpl))
+    np.testing.assert_array_equal(icell2d, np.tile(np.arange(mg.ncpl), mg.nlay))
+
+    # the spatial index is rebuilt after the grid coordinates change
+    mg.set_coord_info(xoff=1000.0, yoff=500.0, angrot=30.0)
+    xc, yc = mg.xcellcenters, mg.ycellcenters
+    np.testing.assert_array_equal(mg.intersect(xc, yc), np.arange(mg.ncpl))
+    np.testing.assert_array_equal(
+        mg.intersect(*mg.get_local_coords(xc, yc), local=True), np.arange(mg.ncpl)
+    )
+
+
+def test_unstructured_intersect_points(example_data_path):
+    ws = example_data_path / "unstructured"
+    verts = load_verts(ws / "ugrid_verts.dat")
+    iverts, xc, yc = load_iverts(ws / "ugrid_iverts.dat")
+    ncpl = np.array(3 * [len(iverts)])
+    top = np.repeat([100.0, 0.0, -100.0], ncpl[0])
+    botm = np.repeat([0.0, -100.0, -200.0], ncpl[0])
+    mg = UnstructuredGrid(
+        vertices=verts,
+        iverts=iverts,
+        xcenters=xc,
+        ycenters=yc,
+        top=top,
+        botm=botm,
+        ncpl=ncpl,
+    )
+
+    x = np.append(xc, 1e6)
+    y = np.append(yc, 1e6)
+    icell2d = mg.intersect(x, y, forgive=True)
+    np.testing.assert_array_equal(icell2d[:-1], np.arange(ncpl[0]))
+    assert np.isnan(icell2d[-1])
+
+    z = np.repeat([50.0, -50.0, -150.0], ncpl[0])
+    nodes = mg.intersect(np.tile(xc, 3), np.tile(yc, 3), z)
+    np.testing.assert_array_equal(nodes, np.arange(mg.nnodes))
+    assert mg.intersect(xc[3], yc[3], -150.0) == 2 * ncpl[0] + 3
+
+
 @pytest.mark.parametrize("spc_file", ["grd.spc", "grdrot.spc"])
 def test_structured_from_gridspec(example_data_path, spc_file):
     fn = example_data_path / "specfile" / spc_file
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import flopy
+
+
+def import_modules(statement):
+    # import in a fresh interpreter, flopy is already imported in this one
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(flopy.__file__).parents[1],
+        text=True,
+    )
+    return set(out.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import flopy",
+        "from flopy.utils import HeadFile",
+        "from flopy.utils import CellBudgetFile",
+    ],
+)
+def test_import_is_lazy(statement):
+    modules = import_modules(statement)
+    assert "flopy" in modules
+    for name in ("matplotlib", "flopy.mf6", "flopy.plot", "flopy.export"):
+        assert name not in modules, f"{statement!r} imports {name}"
+
+
+def test_submodules_on_access():
+    modules = import_modules(
+        "import flopy; flopy.mf6.MFSimulation; flopy.modflow.Modflow"
+    )
+    assert {"flopy.mf6", "flopy.modflow"} <= modules
+    assert "flopy.seawat" not in modules
+
+    with pytest.raises(AttributeError):
+        flopy.not_a_submodule
+    assert {"mf6", "modflow", "plot", "utils"} <= set(dir(flopy))
+
+
+def import_time(statement):
+    # best of a few runs in fresh interpreters
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - t)"
+    )
+    times = []
+    for _ in range(3):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=Path(flopy.__file__).parents[1],
+            text=True,
+        )
+        times.append(float(out.stdout.split()[-1]))
+    return min(times)
+
+
+@pytest.mark.slow
+def test_import_time(benchmark):
+    # the model and plotting subpackages are not imported with flopy
+    heavy = {"flopy.mf6", "flopy.modflow", "flopy.mt3d", "flopy.seawat"}
+    heavy |= {"flopy.modpath", "flopy.plot", "flopy.export", "matplotlib"}
+    modules = benchmark(lambda: import_modules("import flopy"))
+    assert not heavy & modules
+
+    # and importing flopy is faster than importing all of its subpackages
+    eager = "import flopy; " + "; ".join(
+        f"import flopy.{name}" for name in flopy._submodules
+    )
+    assert import_time("import flopy") < 0.75 * import_time(eager)
@@ -1,5 +1,7 @@
 import os
 import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import copytree, which
 
@@ -57,7 +59,12 @@ from flopy.mf6.coordinates.modeldimensions import (
     PackageDimensions,
 )
 from flopy.mf6.data.mffileaccess import MFFileAccessArray
-from flopy.mf6.data.mfstructure import MFDataItemStructure, MFDataStructure
+from flopy.mf6.data.mfstructure import (
+    MFDataItemStructure,
+    MFDataStructure,
+    MFStructure,
+    MFStructureDict,
+)
 from flopy.mf6.mfsimbase import MFSimulationData
 from flopy.mf6.modflow import (
     mfgwf,
@@ -2384,3 +2391,444 @@ def test_flopy_2283(function_tmpdir):
     assert gwf.modelgrid.xoffset == disv.xorigin.get_data()
     assert gwf.modelgrid.yoffset == disv.yorigin.get_data()
     assert gwf.modelgrid.angrot == disv.angrot.get_data()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1.0 2.0 3.0 4.0\n5.0 6.0\n",
+        "1.0,2.0,3.0\n4.0,5.0,6.0\n",
+        "# comment\n1.0 2.0 3.0 4.0 5.0 6.0\n",
+    ],
+)
+def test_load_text_array(function_tmpdir, text):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="model")
+    ModflowGwfdis(gwf, nlay=1, nrow=2, ncol=3)
+    ModflowGwfic(gwf, strt={"data": 1.0, "filename": "strt.txt"})
+    ModflowGwfnpf(gwf, k=1.0)
+    sim.write_simulation()
+
+    # external array, read as a whole file
+    with open(function_tmpdir / "strt.txt", "w") as f:
+        f.write(text)
+    # internal array, read from the package file
+    npf_file = function_tmpdir / "model.npf"
+    npf_text = npf_file.read_text().replace(
+        "CONSTANT       1.00000000", f"INTERNAL\n{text}"
+    )
+    npf_file.write_text(npf_text)
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    gwf = sim.get_model("model")
+    expected = np.arange(1.0, 7.0).reshape((1, 2, 3))
+    assert np.array_equal(gwf.ic.strt.array, expected)
+    assert np.array_equal(gwf.npf.k.array, expected)
+    assert gwf.npf.icelltype.array.shape == (1, 2, 3)
+
+
+@pytest.mark.parametrize("n_workers", [2, 4])
+def test_load_sim_n_workers(function_tmpdir, example_data_path, n_workers):
+    ws = example_data_path / "mf6" / "test005_advgw_tidal"
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    sim_par = MFSimulation.load(sim_ws=ws, verbosity_level=0, n_workers=n_workers)
+
+    # packages, including child packages, are registered in the same order
+    gwf = sim.get_model()
+    gwf_par = sim_par.get_model()
+    assert [p.path for p in gwf_par.packagelist] == [p.path for p in gwf.packagelist]
+    assert [p.filename for p in gwf_par.packagelist] == [
+        p.filename for p in gwf.packagelist
+    ]
+    assert np.array_equal(gwf_par.npf.k.array, gwf.npf.k.array)
+    spd = gwf.get_package("wel").stress_period_data.get_data()
+    spd_par = gwf_par.get_package("wel").stress_period_data.get_data()
+    assert spd.keys() == spd_par.keys()
+    for key in spd:
+        assert spd[key].tolist() == spd_par[key].tolist()
+
+    # written files are identical
+    sim.set_sim_path(function_tmpdir / "seq")
+    sim_par.set_sim_path(function_tmpdir / "par")
+    sim.write_simulation(silent=True)
+    sim_par.write_simulation(silent=True)
+    for fpth in (function_tmpdir / "seq").glob("*"):
+        lines = fpth.read_text().splitlines()[1:]
+        lines_par = (function_tmpdir / "par" / fpth.name).read_text().splitlines()[1:]
+        assert lines == lines_par, fpth.name
+
+
+def test_write_simulation_only_modified(function_tmpdir, example_data_path):
+    ws = example_data_path / "mf6" / "test005_advgw_tidal"
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    sim.set_sim_path(function_tmpdir)
+    sim.write_simulation(silent=True)
+
+    # nothing is modified after a load
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    gwf = sim.get_model()
+    assert not sim.name_file.modified
+    assert not sim.tdis.modified
+    assert not any(p.modified for p in gwf.packagelist)
+
+    # set_data marks the data and its package as modified
+    gwf.npf.k.set_data(gwf.npf.k.array * 2.0)
+    assert gwf.npf.k.modified
+    assert gwf.npf.modified
+    assert not gwf.dis.modified
+
+    mtimes = {f.name: f.stat().st_mtime_ns for f in function_tmpdir.iterdir()}
+    (function_tmpdir / "AdvGW_tidal.ic").unlink()
+    sim.write_simulation(silent=True, only_modified=True)
+    written = [
+        f.name
+        for f in function_tmpdir.iterdir()
+        if f.stat().st_mtime_ns != mtimes.get(f.name)
+    ]
+    assert sorted(written) == ["AdvGW_tidal.ic", "AdvGW_tidal.npf"]
+    assert not gwf.npf.modified
+
+    # all files are written when the simulation path changes
+    ws = function_tmpdir / "moved"
+    sim.set_sim_path(ws)
+    sim.write_simulation(silent=True, only_modified=True, n_workers=2)
+    assert sorted(f.name for f in ws.iterdir()) == sorted(mtimes)
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    assert np.array_equal(sim.get_model().npf.k.array, gwf.npf.k.array)
+
+
+@pytest.mark.parametrize("n_workers", [2, 4])
+def test_write_simulation_n_workers(function_tmpdir, example_data_path, n_workers):
+    ws = example_data_path / "mf6" / "test005_advgw_tidal"
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    sim.set_sim_path(function_tmpdir / "seq")
+    sim.write_simulation(silent=True)
+    sim.set_sim_path(function_tmpdir / "par")
+    sim.write_simulation(silent=True, n_workers=n_workers)
+    for fpth in (function_tmpdir / "seq").glob("*"):
+        lines = fpth.read_text().splitlines()[1:]
+        lines_par = (function_tmpdir / "par" / fpth.name).read_text().splitlines()[1:]
+        assert lines == lines_par, fpth.name
+
+
+def test_load_sim_lazy_io(function_tmpdir, example_data_path):
+    ws = example_data_path / "mf6" / "test045_lake2tr"
+    copytree(ws, function_tmpdir, dirs_exist_ok=True)
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    sim_lazy = MFSimulation.load(
+        sim_ws=function_tmpdir, verbosity_level=0, lazy_io=True
+    )
+
+    # internal arrays and stress period data are read when accessed
+    lazy_data = sim_lazy.simulation_data.mfpath.lazy_data_dict
+    assert str(function_tmpdir / "lakeex2a.npf") in lazy_data
+    assert str(function_tmpdir / "lakeex2a.chd") in lazy_data
+    gwf = sim.get_model()
+    gwf_lazy = sim_lazy.get_model()
+    assert np.array_equal(gwf_lazy.npf.wetdry.array, gwf.npf.wetdry.array)
+    assert np.array_equal(gwf_lazy.dis.botm.array, gwf.dis.botm.array)
+    spd = gwf.chd.stress_period_data.get_data()
+    spd_lazy = gwf_lazy.chd.stress_period_data.get_data()
+    assert spd.keys() == spd_lazy.keys()
+    for key in spd:
+        assert spd[key].tolist() == spd_lazy[key].tolist()
+    # storages are no longer registered once their data are read
+    assert str(function_tmpdir / "lakeex2a.npf") not in lazy_data
+    assert str(function_tmpdir / "lakeex2a.chd") not in lazy_data
+
+    # data not read yet are kept when a package file is rewritten
+    sim_lazy = MFSimulation.load(
+        sim_ws=function_tmpdir, verbosity_level=0, lazy_io=True
+    )
+    gwf_lazy = sim_lazy.get_model()
+    gwf_lazy.npf.k.set_data(gwf.npf.k.array * 2.0)
+    sim_lazy.write_simulation(silent=True, only_modified=True)
+    sim_lazy = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    gwf_lazy = sim_lazy.get_model()
+    assert np.allclose(gwf_lazy.npf.k.array, gwf.npf.k.array * 2.0)
+    assert np.array_equal(gwf_lazy.npf.wetdry.array, gwf.npf.wetdry.array)
+
+
+def test_set_sim_path_keep_external(function_tmpdir, example_data_path):
+    ws = example_data_path / "mf6" / "test006_gwf3"
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    area = sim.get_model().disu.area.array
+    sim.set_sim_path(function_tmpdir, keep_external=True)
+    sim.write_simulation(silent=True)
+
+    # external files are copied as they are and stay external
+    for fname in ("flow.disu.area.dat", "flow.disu.iac.dat", "flow.disu.ja.dat"):
+        assert (function_tmpdir / fname).read_bytes() == (ws / fname).read_bytes()
+    assert (
+        "OPEN/CLOSE  'flow.disu.area.dat'"
+        in (function_tmpdir / "flow.disu").read_text()
+    )
+
+    # data changed after the move are written to the new path only
+    disu = sim.get_model().disu
+    disu.area.set_data(area * 2.0)
+    sim.write_simulation(silent=True)
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    assert np.allclose(sim.get_model().disu.area.array, area * 2.0)
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    assert np.array_equal(sim.get_model().disu.area.array, area)
+
+
+def test_structure_built_on_access():
+    built = []
+
+    def builder(name):
+        built.append(name)
+        return name.upper()
+
+    struct_objs = MFStructureDict()
+    struct_objs.add_builder("chd", builder, "chd")
+    struct_objs.add_builder("wel", builder, "wel")
+    assert "chd" in struct_objs and len(struct_objs) == 2
+    assert not built
+    assert struct_objs["chd"] == "CHD" and struct_objs["chd"] == "CHD"
+    assert built == ["chd"]
+    assert struct_objs.is_built("chd") and not struct_objs.is_built("wel")
+    assert list(struct_objs.values()) == ["CHD", "WEL"]
+    assert built == ["chd", "wel"]
+
+    gwf_struct = MFStructure().sim_struct.model_struct_objs["gwf6"]
+    assert gwf_struct.package_struct_objs["rcha"].read_as_arrays
+    assert not gwf_struct.package_struct_objs["rch"].read_as_arrays
+
+
+def test_structure_built_once_threads():
+    built = []
+
+    def builder(name):
+        built.append(name)
+        time.sleep(0.01)
+        return name.upper()
+
+    struct_objs = MFStructureDict()
+    for name in ("chd", "wel", "ghb"):
+        struct_objs.add_builder(name, builder, name)
+    keys = ["chd", "wel", "ghb"] * 8
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(struct_objs.__getitem__, keys))
+    assert values == [key.upper() for key in keys]
+    assert sorted(built) == ["chd", "ghb", "wel"]
+
+
+def test_load_list_comments(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=2)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=3, ncol=4)
+    ModflowGwfic(gwf)
+    ModflowGwfnpf(gwf)
+    spd = {
+        0: [((0, 0, 1), -1.5, 0.25, "w1"), ((1, 2, 3), -2.5e-3, 1.0, "w2")],
+        1: [((0, 1, 2), "q_ts", 0.5, "w3")],
+    }
+    ModflowGwfwel(gwf, stress_period_data=spd, auxiliary=["conc"], boundnames=True)
+    sim.write_simulation(silent=True)
+
+    # comments and blank lines within the list data
+    wel_file = function_tmpdir / "gwf.wel"
+    lines = []
+    for line in wel_file.read_text().splitlines():
+        if line.strip().startswith("1 1 2"):
+            lines += ["# first well", "", f"{line}  # inline comment"]
+        else:
+            lines.append(line)
+    wel_file.write_text("\n".join(lines) + "\n")
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    wel = sim.get_model().wel
+    data = wel.stress_period_data.get_data(0)
+    assert data["cellid"].tolist() == [(0, 0, 1), (1, 2, 3)]
+    assert np.allclose(data["q"], [-1.5, -2.5e-3])
+    assert np.allclose(data["conc"], [0.25, 1.0])
+    assert data["boundname"].tolist() == ["w1", "w2"]
+
+    # time series names are kept as strings
+    data = wel.stress_period_data.get_data(1)
+    assert data["cellid"].tolist() == [(0, 1, 2)]
+    assert data["q"].tolist() == ["q_ts"]
+
+
+def test_transient_list_shared_periods(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=4)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=3, ncol=4)
+    ModflowGwfic(gwf)
+    ModflowGwfnpf(gwf)
+    wells = [((0, 0, 1), -1.5), ((1, 2, 3), -2.5)]
+    spd = {0: wells, 1: list(wells), 2: [((0, 1, 2), -0.5)], 3: list(wells)}
+    wel = ModflowGwfwel(gwf, stress_period_data=spd)
+
+    # identical stress periods share their data
+    storage = wel.stress_period_data._data_storage
+    assert storage[0].internal_data is storage[1].internal_data
+    assert storage[0].internal_data is storage[3].internal_data
+    assert storage[0].internal_data is not storage[2].internal_data
+
+    # changing one stress period leaves the others unchanged
+    wel.stress_period_data.set_data([((0, 2, 2), -3.0)], key=3)
+    data = wel.stress_period_data.get_data(3)
+    assert data["cellid"].tolist() == [(0, 2, 2)]
+    for kper in (0, 1):
+        data = wel.stress_period_data.get_data(kper)
+        assert data["cellid"].tolist() == [(0, 0, 1), (1, 2, 3)]
+        assert np.allclose(data["q"], [-1.5, -2.5])
+
+    sim.write_simulation(silent=True)
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    wel = sim.get_model().wel
+    storage = wel.stress_period_data._data_storage
+    assert storage[0].internal_data is storage[1].internal_data
+    data = wel.stress_period_data.get_data()
+    assert data[0]["cellid"].tolist() == [(0, 0, 1), (1, 2, 3)]
+    assert np.allclose(data[1]["q"], [-1.5, -2.5])
+    assert data[2]["cellid"].tolist() == [(0, 1, 2)]
+    assert data[3]["cellid"].tolist() == [(0, 2, 2)]
+
+    # identical stress periods are stored in one external file
+    wel.stress_period_data.store_as_external_file("wel_spd.txt")
+    sim.write_simulation(silent=True)
+    assert (function_tmpdir / "wel_spd_1.txt").is_file()
+    assert not (function_tmpdir / "wel_spd_2.txt").exists()
+    assert (function_tmpdir / "wel_spd_3.txt").is_file()
+    assert (function_tmpdir / "gwf.wel").read_text().count("wel_spd_1.txt") == 2
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    data = sim.get_model().wel.stress_period_data.get_data()
+    assert np.allclose(data[1]["q"], [-1.5, -2.5])
+    assert data[2]["cellid"].tolist() == [(0, 1, 2)]
+
+
+def test_transient_list_shared_external_file(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=3)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=1, nrow=3, ncol=3)
+    ModflowGwfic(gwf)
+    ModflowGwfnpf(gwf)
+    wells = [((0, 1, 1), -1.0)]
+    wel = ModflowGwfwel(gwf, stress_period_data={0: wells, 1: wells, 2: wells})
+    wel.stress_period_data.store_as_external_file("wel_spd.txt")
+    sim.write_simulation(silent=True)
+
+    # a stress period that shares a file is written to a file of its own
+    # when it is changed
+    wel.stress_period_data.set_data([((0, 2, 2), -3.0)], key=1)
+    sim.write_simulation(silent=True)
+    wel_text = (function_tmpdir / "gwf.wel").read_text()
+    assert wel_text.count("wel_spd_1.txt") == 2
+    assert wel_text.count("wel_spd_2.txt") == 1
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    spd = sim.get_model().wel.stress_period_data
+    data = spd.get_data()
+    assert data[0]["cellid"].tolist() == [(0, 1, 1)]
+    assert data[1]["cellid"].tolist() == [(0, 2, 2)]
+    assert data[2]["cellid"].tolist() == [(0, 1, 1)]
+
+    # also for the stress period the shared file is named after
+    spd.set_data([((0, 0, 0), -2.0)], key=0)
+    sim.write_simulation(silent=True)
+    sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+    data = sim.get_model().wel.stress_period_data.get_data()
+    assert data[0]["cellid"].tolist() == [(0, 0, 0)]
+    assert data[1]["cellid"].tolist() == [(0, 2, 2)]
+    assert data[2]["cellid"].tolist() == [(0, 1, 1)]
+    assert np.allclose(data[2]["q"], [-1.0])
+
+
+@pytest.mark.parametrize("use_pandas", [True, False])
+def test_set_all_data_external_binary(function_tmpdir, use_pandas):
+    sim = MFSimulation(sim_ws=function_tmpdir, use_pandas=use_pandas)
+    ModflowTdis(sim, nper=2)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=3, ncol=4)
+    ModflowGwfic(gwf, strt=np.linspace(1.0, 2.0, 24).reshape(2, 3, 4))
+    ModflowGwfnpf(gwf)
+    ModflowGwfwel(
+        gwf,
+        stress_period_data={
+            0: [((0, 0, 1), -1.5, 0.25), ((1, 2, 3), -2.5, 1.0)],
+            1: [((0, 1, 2), -0.5, 0.5)],
+        },
+        auxiliary=["conc"],
+    )
+    ModflowGwfchd(gwf, stress_period_data=[((0, 0, 0), 1.0, "c1")], boundnames=True)
+    sim.set_all_data_external(binary=True)
+    sim.write_simulation(silent=True)
+
+    # lists with boundnames are text, everything else binary
+    assert (function_tmpdir / "gwf.ic_strt_layer1.bin").is_file()
+    assert (function_tmpdir / "gwf.wel_stress_period_data_1.bin").is_file()
+    assert (function_tmpdir / "gwf.wel_stress_period_data_2.bin").is_file()
+    assert (function_tmpdir / "gwf.chd_stress_period_data_1.txt").is_file()
+
+    sim = MFSimulation.load(
+        sim_ws=function_tmpdir, verbosity_level=0, use_pandas=use_pandas
+    )
+    gwf = sim.get_model()
+    assert np.allclose(gwf.ic.strt.array.ravel(), np.linspace(1.0, 2.0, 24))
+    data = gwf.wel.stress_period_data.get_data()
+    assert data[0]["cellid"].tolist() == [(0, 0, 1), (1, 2, 3)]
+    assert np.allclose(data[0]["q"], [-1.5, -2.5])
+    assert np.allclose(data[0]["conc"], [0.25, 1.0])
+    assert data[1]["cellid"].tolist() == [(0, 1, 2)]
+    data = gwf.chd.stress_period_data.get_data(0)
+    assert data["boundname"].tolist() == ["c1"]
+
+
+def get_perftest_sim(ws):
+    nlay, nrow, ncol, nper, nwel = 5, 200, 200, 4, 50000
+    sim = MFSimulation(sim_ws=ws)
+    ModflowTdis(sim, nper=nper)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    rng = np.random.default_rng(0)
+    ModflowGwfic(gwf, strt=rng.random((nlay, nrow, ncol)))
+    ModflowGwfnpf(gwf, k=rng.random((nlay, nrow, ncol)))
+    spd = {}
+    for kper in range(nper):
+        nodes = rng.choice(nlay * nrow * ncol, nwel, replace=False)
+        cellids = zip(*np.unravel_index(nodes, (nlay, nrow, ncol)))
+        spd[kper] = list(zip(cellids, rng.random(nwel), rng.random(nwel)))
+    ModflowGwfwel(gwf, stress_period_data=spd, auxiliary=["conc"])
+    return sim
+
+
+def write_external(sim, binary):
+    sim.set_all_data_external(binary=binary)
+    sim.write_simulation(silent=True)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("binary", [False, True])
+def test_external_write_time(function_tmpdir, benchmark, binary):
+    benchmark.pedantic(
+        write_external,
+        setup=lambda: ((get_perftest_sim(function_tmpdir), binary), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("binary", [False, True])
+def test_external_load_time(function_tmpdir, benchmark, binary):
+    write_external(get_perftest_sim(function_tmpdir), binary)
+
+    def load():
+        sim = MFSimulation.load(sim_ws=function_tmpdir, verbosity_level=0)
+        gwf = sim.get_model()
+        gwf.npf.k.array
+        gwf.wel.stress_period_data.get_data()
+
+    benchmark(load)
@@ -2,6 +2,9 @@ import glob
 import inspect
 import os
 import shutil
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
 
 import numpy as np
@@ -30,6 +33,7 @@ from flopy.modflow import (
 from flopy.mt3d import Mt3dBtn, Mt3dms
 from flopy.seawat import Seawat
 from flopy.utils import Util2d
+from flopy.utils.flopy_io import ulstrd
 
 _example_data_path = get_example_data_path()
 
@@ -684,6 +688,67 @@ def test_mf2005_test_models_loadonly(example_data_path, namfile):
     ).load_fail
 
 
+def test_modflow_load_n_workers(function_tmpdir, example_data_path):
+    mpath = example_data_path / "freyberg_multilayer_transient"
+    kwargs = {"model_ws": mpath, "check": False, "forgive": True}
+    m1 = Modflow.load("freyberg.nam", **kwargs)
+    m4 = Modflow.load("freyberg.nam", n_workers=4, **kwargs)
+    assert m4.get_package_list() == m1.get_package_list()
+    assert m4.output_fnames == m1.output_fnames
+    assert m4.output_units == m1.output_units
+
+    # packages read concurrently write the same files
+    for ws, m in [(function_tmpdir / "serial", m1), (function_tmpdir / "n4", m4)]:
+        m.change_model_ws(ws)
+        m.write_input()
+    for fpth in sorted((function_tmpdir / "serial").iterdir()):
+        assert (function_tmpdir / "n4" / fpth.name).read_text() == fpth.read_text()
+
+
+def test_modflow_load_n_workers_warnings(example_data_path):
+    # warning filters are process wide, reading packages in threads does
+    # not change them
+    filters = list(warnings.filters)
+    mpath = example_data_path / "freyberg_multilayer_transient"
+    for _ in range(3):
+        Modflow.load(
+            "freyberg.nam", model_ws=mpath, check=False, forgive=True, n_workers=8
+        )
+    assert warnings.filters == filters
+
+    text = "\n".join(" ".join(["1"] * 200) for _ in range(200)) + "\n"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(
+            lambda dtype: Util2d.load_txt((200, 200), StringIO(text), dtype, "(FREE)"),
+            [np.int32, np.float32] * 32,
+        ):
+            pass
+    assert warnings.filters == filters
+
+
+def test_modflow_load_n_workers_forgive(function_tmpdir, example_data_path):
+    mpath = example_data_path / "freyberg_multilayer_transient"
+    for fpth in mpath.glob("freyberg.*"):
+        shutil.copy(fpth, function_tmpdir)
+    (function_tmpdir / "freyberg.wel").write_text("bad well file\n")
+
+    m = Modflow.load(
+        "freyberg.nam",
+        model_ws=function_tmpdir,
+        check=False,
+        forgive=True,
+        n_workers=4,
+    )
+    assert m.load_fail
+    assert m.get_package("WEL") is None
+    assert m.get_package_list() == ["DIS", "NWT", "BAS6", "OC", "UPW", "DRN"]
+
+    with pytest.raises(ValueError):
+        Modflow.load(
+            "freyberg.nam", model_ws=function_tmpdir, load_only=["wel"], n_workers=4
+        )
+
+
 @pytest.mark.slow
 def test_write_irch(function_tmpdir, example_data_path):
     mpath = example_data_path / "freyberg_multilayer_transient"
@@ -839,6 +904,45 @@ def test_manual_check(function_tmpdir, str_path):
     assert summary_path.is_file()
 
 
+def test_check_n_workers():
+    for namfile_path in _mf2005_namfiles:
+        model = Modflow.load(namfile_path, model_ws=namfile_path.parent, check=False)
+        chk1 = model.check(verbose=False)
+        chk4 = model.check(verbose=False, n_workers=4)
+        assert chk4.passed == chk1.passed
+        assert np.array_equal(chk4.summary_array, chk1.summary_array)
+
+
+def test_check_neighbors():
+    mf = Modflow()
+    dis = ModflowDis(mf, nlay=2, nrow=3, ncol=4)
+    bas = ModflowBas(mf)
+    chk = bas.check(verbose=False)
+
+    indptr, indices = chk.get_neighbor_csr()
+    assert indptr.size == 2 * 3 * 4 + 1
+    # corner cell (0, 0, 0) and interior cell (1, 1, 1)
+    assert indices[indptr[0] : indptr[1]].tolist() == [12, 4, 1]
+    assert indices[indptr[17] : indptr[18]].tolist() == [5, 13, 21, 16, 18]
+    # connections are computed once for the model grid
+    assert bas.check(verbose=False).get_neighbor_csr()[1] is indices
+
+    a = np.arange(24, dtype=float).reshape(2, 3, 4)
+    neighbors = chk.get_neighbors(a)
+    assert neighbors.shape == (6, 2, 3, 4)
+    assert np.isnan(neighbors[:, 0, 0, 0]).tolist() == [1, 0, 1, 0, 1, 0]
+    assert np.array_equal(
+        neighbors[:, 1, 1, 1], [5, np.nan, 13, 21, 16, 18], equal_nan=True
+    )
+
+    active = np.zeros((2, 3, 4), dtype=bool)
+    active[0, 1, 1] = True
+    has_neighbor = chk.has_neighbor(active)
+    assert has_neighbor.sum() == 5
+    assert has_neighbor[1, 1, 1] and has_neighbor[0, 0, 1]
+    assert not has_neighbor[0, 1, 1]
+
+
 def test_bcs_check(function_tmpdir):
     mf = Modflow(version="mf2005", model_ws=function_tmpdir)
 
@@ -1218,6 +1322,61 @@ def test_load_with_list_reader(function_tmpdir):
     assert np.array_equal(originalwelra, m2.wel.stress_period_data[0])
 
 
+@pytest.mark.parametrize("free", [True, False])
+def test_ulstrd_text(free):
+    ra = ModflowGhb.get_empty(4)
+    ra[:] = [
+        (0, 1, 2, 10.5, 1.0e-3),
+        (1, 0, 9, -2.25, 100.0),
+        (2, 4, 4, 0.0, 1.0e10),
+        (0, 9, 0, 3.0, 0.5),
+    ]
+    m = Modflow()
+    m.free_format_input = free
+    if free:
+        lines = [f"{k + 1} {i + 1},{j + 1} {s} {c}" for k, i, j, s, c in ra]
+        lines[1] += " # comment"
+        lines[2] += " 7.0 extra values"
+    else:
+        lines = [
+            f"{k + 1:10d}{i + 1:10d}{j + 1:10d}{s:10.4g}{c:10.3e}"
+            for k, i, j, s, c in ra
+        ]
+        # a blank field is zero
+        lines[2] = lines[2][:30] + " " * 10 + lines[2][40:]
+    text = "\n".join(["sfac 2.0"] + lines + ["next line"])
+
+    f = StringIO(text)
+    data = ulstrd(f, 4, ModflowGhb.get_empty(4), m, ["cond"], None)
+    assert f.readline() == "next line"
+    ra["cond"] *= 2.0
+    for name in ("k", "i", "j"):
+        assert np.array_equal(data[name], ra[name] + 1)
+    assert np.allclose(data["bhead"], ra["bhead"])
+    assert np.allclose(data["cond"], ra["cond"])
+
+    # a value that does not match its field type is reported
+    lines[0] = lines[0].replace(f"{ra['i'][0] + 1}", " x", 1)
+    f = StringIO("\n".join(lines))
+    with pytest.raises(ValueError):
+        ulstrd(f, 4, ModflowGhb.get_empty(4), m, [], None)
+
+    # as is an integer that does not fit its field
+    ra = np.recarray(1, dtype=[("k", np.int32), ("i", np.int32), ("q", np.float32)])
+    if free:
+        line = "3000000000 1 1.0"
+    else:
+        line = f"{3000000000:10d}{1:10d}{1.0:10.3f}"
+    with pytest.raises(OverflowError):
+        ulstrd(StringIO(line), 1, ra, m, [], None)
+
+    # and a fixed format field with more than one value
+    if not free:
+        f = StringIO("    2    3         4      1.00       2.0")
+        with pytest.raises(ValueError):
+            ulstrd(f, 1, ModflowGhb.get_empty(1), m, [], None)
+
+
 @requires_exe("mf2005")
 @pytest.mark.parametrize(
     "container",
@@ -17849,6 +17849,21 @@ def test_mt3dms_load_when_nam_dne():
         Mt3dms.load("nonexistent.nam")
 
 
+def test_mt3dms_load_n_workers(function_tmpdir, mf2005mt3d_model_path):
+    pth = mf2005mt3d_model_path / "P07"
+    mf = Modflow.load("p7mf2005.nam", model_ws=pth, check=False)
+    mt1 = Mt3dms.load("p7mt.nam", model_ws=pth, modflowmodel=mf)
+    mt4 = Mt3dms.load("p7mt.nam", model_ws=pth, modflowmodel=mf, n_workers=4)
+    assert mt4.get_package_list() == mt1.get_package_list()
+
+    # packages read concurrently write the same files
+    for ws, mt in [(function_tmpdir / "serial", mt1), (function_tmpdir / "n4", mt4)]:
+        mt.change_model_ws(ws)
+        mt.write_input()
+    for fpth in sorted((function_tmpdir / "serial").iterdir()):
+        assert (function_tmpdir / "n4" / fpth.name).read_text() == fpth.read_text()
+
+
 @requires_exe("mf2005")
 def test_mt3d_ssm_with_nodata_in_1st_sp(function_tmpdir):
     nlay, nrow, ncol = 3, 5, 5
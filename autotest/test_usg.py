@@ -89,6 +89,33 @@ def test_usg_sms_load(function_tmpdir, mfusg_01A_nestedgrid_nognc_model_path):
         )
 
 
+def test_usg_check_neighbors():
+    m = MfUsg(structured=False)
+    kwargs = {"nodes": 3, "njag": 7, "cl12": np.ones(7), "fahl": np.ones(7)}
+    # nodes 1 - 2 - 3 in a row
+    MfUsgDisU(m, iac=[2, 3, 2], ja=[1, 2, 2, 1, 3, 3, 2], **kwargs)
+    bas = ModflowBas(m)
+    indptr, indices = bas.check(verbose=False).get_neighbor_csr()
+    assert indptr.tolist() == [0, 1, 3, 4]
+    assert indices.tolist() == [1, 0, 2, 1]
+    # the connections are computed once for the DISU package
+    assert bas.check(verbose=False).get_neighbor_csr()[1] is indices
+
+    # and again when the connections change, node 1 connected to nodes 2
+    # and 3
+    m.disu.iac[:] = [3, 2, 2]
+    m.disu.ja[:] = [1, 2, 3, 2, 1, 3, 1]
+    indptr, indices = bas.check(verbose=False).get_neighbor_csr()
+    assert indptr.tolist() == [0, 2, 3, 4]
+    assert indices.tolist() == [1, 2, 0, 0]
+
+    # or the DISU package is replaced
+    m.remove_package("DISU")
+    MfUsgDisU(m, iac=[2, 3, 2], ja=[1, 2, 2, 1, 3, 3, 2], **kwargs)
+    indptr, indices = bas.check(verbose=False).get_neighbor_csr()
+    assert indptr.tolist() == [0, 1, 3, 4]
+
+
 @requires_exe("mfusg")
 def test_usg_model(function_tmpdir):
     mf = MfUsg(
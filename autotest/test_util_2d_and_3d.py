@@ -1,4 +1,5 @@
 import os
+from io import StringIO
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,7 @@ from flopy.modflow import (
     Modflow,
     ModflowBas,
     ModflowDis,
+    ModflowGhb,
     ModflowLpf,
     ModflowRiv,
     ModflowWel,
@@ -562,6 +564,64 @@ def test_mflist(function_tmpdir, example_data_path):
     assert df.groupby(["k", "i", "j"])["rbot"].count()[(1, 2, 4)] == 10
 
 
+def test_mflist_to_array_all():
+    model = Modflow()
+    dis = ModflowDis(model, 2, 3, 4, nper=4)
+    sp_data = {
+        1: [[0, 1, 1, 1.0, 10.0], [0, 1, 1, 3.0, 20.0], [1, 2, 3, 5.0, 1.0]],
+        3: 0,
+    }
+    ghb = ModflowGhb(model, stress_period_data=sp_data)
+    spd = ghb.stress_period_data
+
+    arrays = spd.to_array_all()
+    assert arrays["bhead"].shape == (4, 2, 3, 4)
+    # bhead is averaged and cond is summed for repeated cells
+    assert arrays["bhead"][1, 0, 1, 1] == 2.0
+    assert arrays["cond"][1, 0, 1, 1] == 30.0
+    assert arrays["cond"][2, 1, 2, 3] == 1.0
+    assert not arrays["cond"][0].any() and not arrays["cond"][3].any()
+    for kper in range(4):
+        for name, arr in spd.to_array(kper).items():
+            assert np.array_equal(arr, arrays[name][kper])
+
+    arrays = spd.to_array_all(kpers=[2, 0], mask=True)
+    assert arrays["cond"].shape == (2, 2, 3, 4)
+    assert np.isnan(arrays["cond"]).sum() == 2 * 24 - 2
+    assert np.isnan(arrays["cond"][1]).all()
+    assert arrays["cond"][0, 0, 1, 1] == 30.0
+
+    # selected fields only, as they are yielded by masked_4D_arrays_itr
+    arrays = spd.to_array_all(mask=True, names=["cond"])
+    assert list(arrays) == ["cond"]
+    for name, ma in spd.masked_4D_arrays_itr():
+        expected = spd.to_array_all(mask=True)[name]
+        assert np.array_equal(ma, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("free", [True, False])
+def test_mflist_write_transient(function_tmpdir, free):
+    model = Modflow()
+    dis = ModflowDis(model, 2, 3, 4, nper=2)
+    model.array_free_format = free
+    bas = ModflowBas(model, ifrefm=free)
+    sp_data = {0: [[0, 1, 1, 0.1, 1e-7], [1, 2, 3, -5.25, 123456789.0]]}
+    ghb = ModflowGhb(model, stress_period_data=sp_data)
+    spd = ghb.stress_period_data
+
+    fpth = function_tmpdir / "test.ghb"
+    with open(fpth, "w") as f:
+        spd.write_transient(f)
+    lines = fpth.read_text().splitlines()
+    d = spd[0].copy()
+    for idx in ["k", "i", "j"]:
+        d[idx] += 1
+    expected = StringIO()
+    np.savetxt(expected, d, fmt=spd.fmt_string, delimiter="")
+    assert lines[1:3] == expected.getvalue().splitlines()
+    assert lines[3].split()[0] == "-1"
+
+
 def test_how(function_tmpdir):
     ml = Modflow(model_ws=function_tmpdir)
     ml.array_free_format = False
@@ -5,6 +5,7 @@ from tempfile import TemporaryFile
 from textwrap import dedent
 
 import numpy as np
+import pytest
 
 from flopy.utils.util_array import Util2d
 
@@ -86,6 +87,72 @@ def test_load_txt_fixed():
     assert fa.dtype == a.dtype
 
 
+def test_load_txt_position():
+    # the file is left at the line after each array, values after the end
+    # of an array on its last line are not used
+    fp = StringIO(
+        dedent(
+            """\
+        1.5 2.5 3.5
+        4.5 5.5 6.5 extra text
+          10  20  30
+          40      50
+          60
+        7 8 9
+    """
+        )
+    )
+    fa = Util2d.load_txt((5,), fp, np.float32, "(FREE)")
+    np.testing.assert_equal(fa, [1.5, 2.5, 3.5, 4.5, 5.5])
+    # blank fields are skipped
+    fa = Util2d.load_txt((2, 3), fp, np.int32, "(3I4)")
+    np.testing.assert_equal(fa, [[10, 20, 30], [40, 50, 60]])
+    assert fp.readline() == "7 8 9\n"
+
+
+def test_load_txt_fixed_wide():
+    a = np.arange(-12.5, 12.5, 0.5, dtype=np.float32).reshape((5, 10)) * 1e4
+    text = Util2d.array2string(a.shape, a, fortran_format="(7E10.3)")
+    fa = Util2d.load_txt(a.shape, StringIO(text), a.dtype, "(7E10.3)")
+    np.testing.assert_allclose(fa, a)
+    assert fa.dtype == a.dtype
+
+
+def test_load_txt_bad_value():
+    fp = StringIO("1 2 x 4\n")
+    with pytest.raises(ValueError, match="could not convert"):
+        Util2d.load_txt((4,), fp, np.float32, "(FREE)")
+
+    fp = StringIO("   1   2  x3   4\n")
+    with pytest.raises(ValueError, match="invalid literal"):
+        Util2d.load_txt((4,), fp, np.int32, "(4I4)")
+
+    fp = StringIO("   1   2   3   4\n")
+    with pytest.raises(ValueError, match="no data found"):
+        Util2d.load_txt((5,), fp, np.int32, "(4I4)")
+
+
+@pytest.mark.parametrize(
+    "text, fmtin",
+    [
+        ("1 99999999999\n", "(FREE)"),
+        ("1 -3000000000\n", "(FREE)"),
+        ("1 2\n3 99999999999999999999\n", "(FREE)"),
+        (f"{1:12d}{99999999999:12d}\n", "(2I12)"),
+    ],
+)
+def test_load_txt_int_overflow(text, fmtin):
+    # integers that do not fit the array dtype are reported
+    shape = (2, 2) if text.count("\n") == 2 else (1, 2)
+    with pytest.raises(OverflowError):
+        Util2d.load_txt(shape, StringIO(text), np.int32, fmtin)
+
+    # and are read when they do
+    if "99999999999999999999" not in text:
+        fa = Util2d.load_txt(shape, StringIO(text), np.int64, fmtin)
+        assert fa.ravel()[1] == int(text.split()[1])
+
+
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
     fp = StringIO(
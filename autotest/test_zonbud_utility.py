@@ -6,7 +6,8 @@ import pytest
 from modflow_devtools.markers import requires_exe, requires_pkg
 
 from flopy.mf6 import MFSimulation
-from flopy.utils import ZoneBudget, ZoneBudget6, ZoneFile6
+from flopy.modflow import Modflow, ModflowDis
+from flopy.utils import CellBudgetFile, ZoneBudget, ZoneBudget6, ZoneFile6
 
 
 @pytest.fixture
@@ -237,6 +238,101 @@ def test_zonbud_active_areas_zone_zero(loadpth, cbc_f, rtol):
     assert allclose, s
 
 
+def test_zonbud_all_times(example_data_path):
+    cbc = CellBudgetFile(example_data_path / "mp6" / "EXAMPLE.BUD")
+    zon = np.ones((5, 25, 25), dtype=int)
+    zon[:, :, 12:] = 2
+    zon[2:, 10:, :] = 3
+    zon[4, :5, :5] = 0
+    kstpkper = cbc.get_kstpkper()
+    zb = ZoneBudget(cbc, zon)
+    budget = zb.get_budget()
+    assert len(budget) == len(kstpkper) * len(zb.get_record_names())
+    zones = ["ZONE_0", "ZONE_1", "ZONE_2", "ZONE_3"]
+
+    for kk, totim in zip(kstpkper, cbc.get_times()):
+        rows = budget[
+            (budget["time_step"] == kk[0]) & (budget["stress_period"] == kk[1])
+        ]
+        rows = {r["name"]: r for r in rows}
+
+        # flow between zones is the same seen from both zones
+        for a in zones[1:]:
+            for b in zones[1:]:
+                assert rows[f"FROM_{a}"][b] == pytest.approx(rows[f"TO_{b}"][a])
+            assert rows[f"FROM_{a}"][a] == 0.0
+        assert rows["FROM_ZONE_1"]["ZONE_2"] > 0.0
+
+        # source/sink terms are summed by zone
+        recharge = cbc.get_data(text="RECHARGE", kstpkper=kk)[0]
+        recharge = np.ma.filled(recharge, 0.0)
+        for z in (1, 2):
+            expected = recharge[zon[0] == z].sum()
+            assert rows["FROM_RECHARGE"][f"ZONE_{z}"] == pytest.approx(expected, 1e-5)
+        assert rows["FROM_RECHARGE"]["ZONE_0"] == 0.0
+
+        # the same budget is computed for a single time
+        single = ZoneBudget(cbc, zon, totim=[totim]).get_budget()
+        assert np.all(single["name"] == np.array(list(rows)))
+        for z in zones:
+            np.testing.assert_allclose(
+                single[z], [r[z] for r in rows.values()], rtol=1e-6
+            )
+
+
+@pytest.mark.parametrize("n_workers", [2, 3])
+def test_zonbud_n_workers(example_data_path, n_workers):
+    cbc = CellBudgetFile(example_data_path / "mp6" / "EXAMPLE.BUD")
+    zon = np.ones((5, 25, 25), dtype=int)
+    zon[:, :, 12:] = 2
+    zon[2:, 10:, :] = 3
+    aliases = {1: "North", 2: "South"}
+    expected = ZoneBudget(cbc, zon, aliases=aliases)._budget
+    actual = ZoneBudget(cbc, zon, aliases=aliases, n_workers=n_workers)._budget
+    assert actual.dtype == expected.dtype
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(actual[name], expected[name])
+
+    totim = cbc.get_times()[3:8]
+    expected = ZoneBudget(cbc, zon, totim=totim)._budget
+    actual = ZoneBudget(cbc, zon, totim=totim, n_workers=n_workers)._budget
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(actual[name], expected[name])
+
+
+def test_zonbud_n_workers_dis(function_tmpdir):
+    # the times of a non-compact budget file come from the dis package
+    fpth = function_tmpdir / "noncompact.cbc"
+    header = np.dtype(
+        [
+            ("kstp", "<i4"),
+            ("kper", "<i4"),
+            ("text", "S16"),
+            ("ncol", "<i4"),
+            ("nrow", "<i4"),
+            ("nlay", "<i4"),
+        ]
+    )
+    rng = np.random.default_rng(0)
+    with open(fpth, "wb") as f:
+        for kstp in range(1, 4):
+            for text in ("STORAGE", "FLOW RIGHT FACE", "FLOW FRONT FACE"):
+                np.array([(kstp, 1, f"{text:>16}", 3, 3, 1)], dtype=header).tofile(f)
+                rng.random(9).astype(np.float32).tofile(f)
+
+    ml = Modflow()
+    ModflowDis(ml, nlay=1, nrow=3, ncol=3, nper=1, perlen=3.0, nstp=3)
+    cbc = CellBudgetFile(fpth, model=ml)
+    assert not cbc.compact
+    zon = np.ones((1, 3, 3), dtype=int)
+    zon[:, :, 2] = 2
+    expected = ZoneBudget(cbc, zon)._budget
+    actual = ZoneBudget(cbc, zon, n_workers=2)._budget
+    assert np.unique(actual["totim"]).tolist() == [1.0, 2.0, 3.0]
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(actual[name], expected[name])
+
+
 def test_read_zone_file(function_tmpdir):
     zf = (
         "2    2    4\n"
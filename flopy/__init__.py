@@ -23,23 +23,40 @@ contribute.
 # See CITATION.cff for authors
 __author__ = "FloPy Team"
 
+import importlib
+
 from .version import __version__  # isort:skip
-from . import (
-    discretization,
-    export,
-    mf6,
-    mfusg,
-    modflow,
-    modflowlgr,
-    modpath,
-    mt3d,
-    pest,
-    plot,
-    seawat,
-    utils,
-)
 from .mbase import run_model, which
 
+# subpackages are imported when first accessed, so that importing a single
+# module (e.g. flopy.utils.binaryfile) does not load matplotlib or the
+# generated MODFLOW 6 classes
+_submodules = (
+    "discretization",
+    "export",
+    "mf6",
+    "mfusg",
+    "modflow",
+    "modflowlgr",
+    "modpath",
+    "mt3d",
+    "pest",
+    "plot",
+    "seawat",
+    "utils",
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_submodules))
+
+
 __all__ = [
     "__author__",
     "__version__",
@@ -15,6 +15,7 @@ except ImportError:
 
 from ..utils import geometry
 from ..utils.crs import get_crs
+from ..utils.geometry import is_clockwise
 from ..utils.gridutil import get_lni
 
 
@@ -957,6 +958,149 @@ class Grid:
         else:
             return x, y
 
+    def _get_cell_index(self, ncells):
+        """
+        Get a bucket index of the bounding boxes of the first ncells cell
+        polygons. The index is built once and rebuilt after the grid
+        coordinates change.
+
+        Parameters
+        ----------
+        ncells : int
+            Number of cells with polygons in xyzvertices to index.
+
+        Returns
+        -------
+        index : dict
+            Cell vertices, bounding boxes and the cells that overlap each
+            bucket of a regular grid of buckets covering the cells.
+
+        """
+        cache_index = "cell_index"
+        if (
+            cache_index in self._cache_dict
+            and not self._cache_dict[cache_index].out_of_date
+            and self._cache_dict[cache_index].data_nocopy["ncells"] == ncells
+        ):
+            return self._cache_dict[cache_index].data_nocopy
+
+        self._copy_cache = False
+        xv, yv, _ = self.xyzvertices
+        self._copy_cache = True
+        nverts = np.array([len(xv[i]) for i in range(ncells)], dtype=int)
+        offsets = np.concatenate(([0], np.cumsum(nverts)))
+        xv = np.concatenate([np.asarray(xv[i], dtype=float) for i in range(ncells)])
+        yv = np.concatenate([np.asarray(yv[i], dtype=float) for i in range(ncells)])
+        xmin = np.minimum.reduceat(xv, offsets[:-1])
+        xmax = np.maximum.reduceat(xv, offsets[:-1])
+        ymin = np.minimum.reduceat(yv, offsets[:-1])
+        ymax = np.maximum.reduceat(yv, offsets[:-1])
+
+        # regular grid of about one bucket per cell
+        x0, y0 = xmin.min(), ymin.min()
+        width = max(xmax.max() - x0, 0.0)
+        height = max(ymax.max() - y0, 0.0)
+        if width > 0 and height > 0:
+            nbx = max(1, int(np.ceil(np.sqrt(ncells * width / height))))
+        else:
+            nbx = max(1, ncells) if width > 0 else 1
+        nby = max(1, int(np.ceil(ncells / nbx))) if height > 0 else 1
+        dx = width / nbx if width > 0 else 1.0
+        dy = height / nby if height > 0 else 1.0
+
+        # buckets overlapped by each cell, padded so cells sharing a
+        # bucket edge are found from either side
+        pad = 1e-6
+        ix0 = np.clip(np.floor((xmin - x0) / dx - pad), 0, nbx - 1).astype(int)
+        ix1 = np.clip(np.floor((xmax - x0) / dx + pad), 0, nbx - 1).astype(int)
+        iy0 = np.clip(np.floor((ymin - y0) / dy - pad), 0, nby - 1).astype(int)
+        iy1 = np.clip(np.floor((ymax - y0) / dy + pad), 0, nby - 1).astype(int)
+        nx = ix1 - ix0 + 1
+        count = nx * (iy1 - iy0 + 1)
+        cells = np.repeat(np.arange(ncells), count)
+        k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        buckets = (iy0[cells] + k // nx[cells]) * nbx + ix0[cells] + k % nx[cells]
+        order = np.lexsort((cells, buckets))
+        starts = np.searchsorted(buckets[order], np.arange(nbx * nby + 1))
+
+        index = {
+            "ncells": ncells,
+            "offsets": offsets,
+            "xv": xv,
+            "yv": yv,
+            "bbox": (xmin, xmax, ymin, ymax),
+            "buckets": (x0, y0, dx, dy, nbx, nby),
+            "starts": starts,
+            "cells": cells[order],
+        }
+        self._cache_dict[cache_index] = CachedData(index)
+        return index
+
+    def _intersect_cells(self, x, y, ncells):
+        """
+        Find the cell polygons that contain points in the xy plane. Points
+        on the edge of a cell are considered to be in the cell.
+
+        Parameters
+        ----------
+        x, y : ndarray
+            Real-world coordinates of the points.
+        ncells : int
+            Number of cells with polygons in xyzvertices to search.
+
+        Returns
+        -------
+        ipt, icell : ndarray
+            Point and cell number of each point in a cell, sorted by point
+            and then by cell number.
+
+        """
+        from matplotlib.path import Path
+
+        index = self._get_cell_index(ncells)
+        x0, y0, dx, dy, nbx, nby = index["buckets"]
+        starts = index["starts"]
+        ix = np.clip(np.floor((x - x0) / dx), 0, nbx - 1)
+        iy = np.clip(np.floor((y - y0) / dy), 0, nby - 1)
+        valid = np.isfinite(ix) & np.isfinite(iy)
+        bucket = np.zeros(len(x), dtype=int)
+        bucket[valid] = iy[valid].astype(int) * nbx + ix[valid].astype(int)
+        count = np.where(valid, starts[bucket + 1] - starts[bucket], 0)
+
+        # candidate cells of each point, the points have to be within the
+        # bounding box of the cell
+        ipt = np.repeat(np.arange(len(x)), count)
+        k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        icell = index["cells"][starts[bucket[ipt]] + k]
+        xmin, xmax, ymin, ymax = index["bbox"]
+        xp, yp = x[ipt], y[ipt]
+        inbox = (
+            (xp >= xmin[icell])
+            & (xp <= xmax[icell])
+            & (yp >= ymin[icell])
+            & (yp <= ymax[icell])
+        )
+        ipt, icell = ipt[inbox], icell[inbox]
+
+        # point in polygon test, once per candidate cell
+        inside = np.zeros(len(ipt), dtype=bool)
+        order = np.argsort(icell, kind="stable")
+        cells, first = np.unique(icell[order], return_index=True)
+        offsets = index["offsets"]
+        for cell, i0, i1 in zip(cells, first, np.append(first[1:], len(order))):
+            xa = index["xv"][offsets[cell] : offsets[cell + 1]]
+            ya = index["yv"][offsets[cell] : offsets[cell + 1]]
+            # use a small radius, so that the edge of the cell is included
+            radius = -1e-9 if is_clockwise(xa, ya) else 1e-9
+            path = Path(np.stack((xa, ya)).transpose())
+            sel = order[i0:i1]
+            inside[sel] = path.contains_points(
+                np.stack((x[ipt[sel]], y[ipt[sel]])).transpose(), radius=radius
+            )
+        ipt, icell = ipt[inside], icell[inside]
+        order = np.lexsort((icell, ipt))
+        return ipt[order], icell[order]
+
     def set_coord_info(
         self,
         xoff=None,
@@ -876,11 +876,11 @@ class StructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float
+        x : float or array_like
+            The x-coordinate of the requested point, or of several points
+        y : float or array_like
+            The y-coordinate of the requested point, or of several points
+        z : float or array_like
             Optional z-coordinate of the requested point (will return layer,
             row, column) if supplied
         local: bool (optional)
@@ -891,59 +891,61 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or ndarray
+            The row number, or an array of row numbers if arrays of points
+            are given
+        col : int or ndarray
+            The column number, or an array of column numbers if arrays of
+            points are given
 
         """
+        scalar = np.isscalar(x) and np.isscalar(y)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+
         # transform x and y to local coordinates
         x, y = super().intersect(x, y, local, forgive)
+        x, y = np.broadcast_arrays(x, y)
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
 
-        # get the cell edges in local coordinates
+        # get the cell edges in local coordinates, the column is the last x
+        # edge to the left of the point and the row is the last y edge
+        # above the point
         xe, ye = self.xyedges
-
-        xcomp = x > xe
-        if np.all(xcomp) or not np.any(xcomp):
-            if forgive:
-                col = np.nan
-            else:
-                raise Exception("x, y point given is outside of the model area")
-        else:
-            col = np.asarray(xcomp).nonzero()[0][-1]
-
-        ycomp = y < ye
-        if np.all(ycomp) or not np.any(ycomp):
-            if forgive:
-                row = np.nan
-            else:
-                raise Exception("x, y point given is outside of the model area")
-        else:
-            row = np.asarray(ycomp).nonzero()[0][-1]
-        if np.any(np.isnan([row, col])):
-            row = col = np.nan
-            if z is not None:
-                return None, row, col
-
-        if z is None:
-            return row, col
-
-        lay = np.nan
-        for layer in range(self.__nlay):
-            if (
-                self.top_botm[layer, row, col]
-                >= z
-                >= self.top_botm[layer + 1, row, col]
-            ):
-                lay = layer
-                break
-
-        if np.any(np.isnan([lay, row, col])):
-            lay = row = col = np.nan
-            if not forgive:
+        col = np.searchsorted(xe, x, side="left") - 1
+        row = np.searchsorted(-ye, -y, side="left") - 1
+        inside = (col >= 0) & (col < self.ncol) & (row >= 0) & (row < self.nrow)
+        if not forgive and not inside.all():
+            raise Exception("x, y point given is outside of the model area")
+
+        lay = None
+        if z is not None:
+            z = np.broadcast_to(np.asarray(z, dtype=float), shape).ravel()
+            top_botm = self.top_botm[:, row[inside], col[inside]]
+            zp = z[inside]
+            inlay = (top_botm[:-1] >= zp) & (zp >= top_botm[1:])
+            found = inlay.any(axis=0)
+            lay = np.full(len(x), -1)
+            lay[inside] = np.where(found, inlay.argmax(axis=0), -1)
+            if scalar and not inside[0]:
+                return None, np.nan, np.nan
+            inside &= lay >= 0
+            if not forgive and not inside.all():
                 raise Exception("point given is outside the model area")
 
-        return lay, row, col
+        if inside.all():
+            result = [row.reshape(shape), col.reshape(shape)]
+            if lay is not None:
+                result.insert(0, lay.reshape(shape))
+        else:
+            result = [
+                np.where(inside, a, np.nan).reshape(shape)
+                for a in ([row, col] if lay is None else [lay, row, col])
+            ]
+        if scalar:
+            return tuple(a[0] for a in result)
+        return tuple(result)
 
     def _cell_vert_list(self, i, j):
         """Get vertices for a single cell or sequence of i, j locations."""
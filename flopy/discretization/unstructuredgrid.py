@@ -3,7 +3,6 @@ import os
 from typing import Union
 
 import numpy as np
-from matplotlib.path import Path
 
 from ..utils.geometry import is_clockwise, transform
 from .grid import CachedData, Grid
@@ -724,13 +723,17 @@ class UnstructuredGrid(Grid):
         When the point is on the edge of two cells, the cell with the lowest
         CELL2D number is returned.
 
+        Cells are looked up with a spatial index of the cells, which is
+        built on the first call and rebuilt after the grid coordinates
+        change.
+
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float, None
+        x : float or array_like
+            The x-coordinate of the requested point, or of several points
+        y : float or array_like
+            The y-coordinate of the requested point, or of several points
+        z : float, array_like or None
             optional, z-coordiante of the requested point
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
@@ -740,51 +743,54 @@ class UnstructuredGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or ndarray
+            The CELL2D number, or an array of CELL2D numbers if arrays of
+            points are given
 
         """
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
+        scalar = np.isscalar(x) and np.isscalar(y)
+        x, y = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x, dtype=float)),
+            np.atleast_1d(np.asarray(y, dtype=float)),
+        )
+        x, y = x.ravel(), y.ravel()
 
         if self.grid_varies_by_layer:
             ncpl = self.nnodes
         else:
             ncpl = self.ncpl[0]
+        ipt, icell2d = self._intersect_cells(x, y, ncpl)
 
-        for icell2d in range(ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if path.contains_point((x, y), radius=radius):
-                    if z is None:
-                        return icell2d
-
-                    for lay in range(self.nlay):
-                        if lay != 0 and not self.grid_varies_by_layer:
-                            icell2d += self.ncpl[lay - 1]
-                        if zv[0, icell2d] >= z >= zv[1, icell2d]:
-                            return icell2d
-
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-
-        raise Exception("point given is outside of the model area")
+        if z is not None:
+            # the point also has to be within the node of one of the layers
+            _, _, zv = self.xyzvertices
+            zp = np.broadcast_to(np.asarray(z, dtype=float), x.shape)[ipt]
+            if self.grid_varies_by_layer:
+                nodes = icell2d[None, :]
+            else:
+                offsets = np.concatenate(([0], np.cumsum(self.ncpl[:-1])))
+                nodes = icell2d[None, :] + offsets[:, None]
+            inlay = (zv[0, nodes] >= zp) & (zp >= zv[1, nodes])
+            found = inlay.any(axis=0)
+            icell2d = nodes[inlay.argmax(axis=0), np.arange(len(ipt))][found]
+            ipt = ipt[found]
+
+        # the lowest cell number of each point
+        ipt, first = np.unique(ipt, return_index=True)
+        if len(ipt) < len(x) and not forgive:
+            raise Exception("point given is outside of the model area")
+
+        if len(ipt) == len(x):
+            result = np.empty(len(x), dtype=int)
+        else:
+            result = np.full(len(x), np.nan)
+        result[ipt] = icell2d[first]
+        if scalar:
+            return result[0].item()
+        return result
 
     @property
     def top_botm(self):
@@ -2,9 +2,8 @@ import copy
 import os
 
 import numpy as np
-from matplotlib.path import Path
 
-from ..utils.geometry import is_clockwise, transform
+from ..utils.geometry import transform
 from .grid import CachedData, Grid
 
 
@@ -286,6 +285,8 @@ class VertexGrid(Grid):
         -------
             list of Polygon objects
         """
+        from matplotlib.path import Path
+
         cache_index = "xyzgrid"
         if (
             cache_index not in self._cache_dict
@@ -351,13 +352,17 @@ class VertexGrid(Grid):
         When the point is on the edge of two cells, the cell with the lowest
         CELL2D number is returned.
 
+        Cells are looked up with a spatial index of the cells, which is
+        built on the first call and rebuilt after the grid coordinates
+        change.
+
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float, None
+        x : float or array_like
+            The x-coordinate of the requested point, or of several points
+        y : float or array_like
+            The y-coordinate of the requested point, or of several points
+        z : float, array_like or None
             optional, z-coordiante of the requested point will return
             (lay, icell2d)
         local: bool (optional)
@@ -368,50 +373,51 @@ class VertexGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or ndarray
+            The CELL2D number, or an array of CELL2D numbers if arrays of
+            points are given
 
         """
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    if z is None:
-                        return icell2d
-
-                    for lay in range(self.nlay):
-                        if (
-                            self.top_botm[lay, icell2d]
-                            >= z
-                            >= self.top_botm[lay + 1, icell2d]
-                        ):
-                            return lay, icell2d
-
-        if forgive:
-            icell2d = np.nan
-            if z is not None:
-                return np.nan, icell2d
-
-            return icell2d
-
-        raise Exception("point given is outside of the model area")
+        scalar = np.isscalar(x) and np.isscalar(y)
+        x, y = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x, dtype=float)),
+            np.atleast_1d(np.asarray(y, dtype=float)),
+        )
+        x, y = x.ravel(), y.ravel()
+        ipt, icell2d = self._intersect_cells(x, y, self.ncpl)
+
+        lay = None
+        if z is not None:
+            # the point also has to be within one of the layers of the cell
+            zp = np.broadcast_to(np.asarray(z, dtype=float), x.shape)[ipt]
+            top_botm = self.top_botm
+            inlay = (top_botm[:-1, icell2d] >= zp) & (zp >= top_botm[1:, icell2d])
+            found = inlay.any(axis=0)
+            lay = inlay.argmax(axis=0)[found]
+            ipt, icell2d = ipt[found], icell2d[found]
+
+        # the lowest cell number of each point
+        ipt, first = np.unique(ipt, return_index=True)
+        if len(ipt) < len(x) and not forgive:
+            raise Exception("point given is outside of the model area")
+
+        if len(ipt) == len(x):
+            result = np.empty(len(x), dtype=int)
+        else:
+            result = np.full(len(x), np.nan)
+        result[ipt] = icell2d[first]
+        if z is not None:
+            layers = result.copy()
+            layers[ipt] = lay[first]
+            if scalar:
+                return layers[0].item(), result[0].item()
+            return layers, result
+        if scalar:
+            return result[0].item()
+        return result
 
     def get_cell_vertices(self, cellid):
         """
@@ -9,10 +9,12 @@ import abc
 import copy
 import os
 import queue as Queue
+import re
 import shutil
 import sys
 import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from shutil import which
@@ -43,6 +45,34 @@ iconst = 1
 # Printout flag. If >= 0 then array values read are printed in listing file.
 iprn = -1
 
+# model updates made by packages that are loaded in a worker thread are
+# collected here and applied to the model afterwards, in name file order
+_load_state = threading.local()
+
+
+def _defer_load_call(method, *args, **kwargs):
+    """Collect a model update made while a package is loaded in a worker
+    thread, returns True if the update is deferred"""
+    calls = getattr(_load_state, "calls", None)
+    if calls is None:
+        return False
+    calls.append((method, args, kwargs))
+    return True
+
+
+def _reads_external_units(fname):
+    """Check if a package file reads data from EXTERNAL units, which are
+    shared file handles that packages must read in name file order"""
+    try:
+        with open(fname, "rb") as f:
+            text = f.read()
+    except OSError:
+        return False
+    text = text.lower()
+    if b"external" not in text:
+        return False
+    return re.search(rb"^[ \t]*external\b", text, re.MULTILINE) is not None
+
 
 def resolve_exe(
     exe_name: Union[str, os.PathLike], forgive: bool = False
@@ -285,7 +315,7 @@ class ModelInterface:
                 val.append(pp.name[0].upper())
         return val
 
-    def _check(self, chk, level=1):
+    def _check(self, chk, level=1, n_workers=1):
         """
         Check model data for common errors.
 
@@ -298,6 +328,10 @@ class ModelInterface:
         summarize : bool
             Boolean flag used to determine if summary of results is written
             to the screen
+        n_workers : int
+            Number of threads used to check packages concurrently. The
+            package results are added to the summary in package order.
+            Default is 1, which checks the packages one at a time.
 
         Returns
         -------
@@ -312,13 +346,26 @@ class ModelInterface:
         """
 
         # check instance for model-level check
-        results = {}
+        packages = [
+            p
+            for p in self.packagelist
+            if chk.package_check_levels.get(p.name[0].lower(), 0) <= level
+        ]
+
+        def check_package(p):
+            return p.check(
+                f=None, verbose=False, level=level - 1, checktype=chk.__class__
+            )
 
-        for p in self.packagelist:
-            if chk.package_check_levels.get(p.name[0].lower(), 0) <= level:
-                results[p.name[0]] = p.check(
-                    f=None, verbose=False, level=level - 1, checktype=chk.__class__
-                )
+        if n_workers > 1:
+            # set up the model grid shared by the package checks before the
+            # packages are checked concurrently
+            self.modelgrid
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                checks = list(executor.map(check_package, packages))
+        else:
+            checks = [check_package(p) for p in packages]
+        results = {p.name[0]: r for p, r in zip(packages, checks)}
 
         # model level checks
         # solver check
@@ -612,6 +659,8 @@ class BaseModel(ModelInterface):
         p : Package object
 
         """
+        if _defer_load_call(self.add_package, p):
+            return
         for idx, u in enumerate(p.unit_number):
             if u != 0:
                 if u in self.package_units or u in self.external_units:
@@ -639,6 +688,82 @@ class BaseModel(ModelInterface):
             print("adding Package: ", p.name[0])
         self.packagelist.append(p)
 
+    def _read_packages(self, packages, ext_unit_dict, n_workers, first=()):
+        """
+        Read package files concurrently.  This method is used internally by
+        FloPy and is not intended for the end user.
+
+        Parameters
+        ----------
+        packages : dict
+            dictionary of functions that load a package, keyed by the unit
+            number of the package file
+        ext_unit_dict : dict
+            dictionary of NamData objects from the name file
+        n_workers : int
+            number of threads reading package files
+        first : list
+            unit numbers of packages that the other packages depend on,
+            these are loaded and added to the model before the other
+            packages are read
+
+        Returns
+        -------
+        loaded : dict
+            dictionary of functions, keyed by unit number, that register a
+            package with the model and return it, or raise the error from
+            loading the package
+
+        """
+
+        def read(load, defer=True):
+            calls = []
+            if defer:
+                _load_state.calls = calls
+            try:
+                package = load()
+                error = None
+            except Exception as e:
+                package = None
+                error = e
+            finally:
+                if defer:
+                    del _load_state.calls
+
+            def register():
+                for method, args, kwargs in calls:
+                    method(*args, **kwargs)
+                if error is not None:
+                    raise error
+                if not defer and package in self.packagelist:
+                    # move the package to its place in name file order
+                    self.packagelist.remove(package)
+                    self.packagelist.append(package)
+                return package
+
+            return register
+
+        loaded = {
+            key: read(load, defer=False)
+            for key, load in packages.items()
+            if key in first
+        }
+        # packages reading EXTERNAL units share file handles, read these in
+        # name file order
+        if any("data" in item.filetype.lower() for item in ext_unit_dict.values()):
+            for key, load in packages.items():
+                if key not in loaded and _reads_external_units(
+                    ext_unit_dict[key].filename
+                ):
+                    loaded[key] = read(load)
+        concurrent = [key for key in packages if key not in loaded]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for key, register in zip(
+                concurrent, executor.map(read, [packages[key] for key in concurrent])
+            ):
+                loaded[key] = register
+        return loaded
+
     def remove_package(self, pname):
         """
         Remove a package from this model
@@ -785,6 +910,10 @@ class BaseModel(ModelInterface):
             The package the output file is attached to, default is None
 
         """
+        if _defer_load_call(
+            self.add_output_file, unit, fname, extension, binflag, package
+        ):
+            return
         add_cbc = False
         if unit > 0:
             add_cbc = True
@@ -1039,6 +1168,8 @@ class BaseModel(ModelInterface):
         binflag : boolean, optional
             Binary or not, default is False
         """
+        if _defer_load_call(self.add_external, fname, unit, binflag, output):
+            return
         if fname in self.external_fnames:
             if self.verbose:
                 print(
@@ -1492,6 +1623,8 @@ class BaseModel(ModelInterface):
         --------
 
         """
+        if _defer_load_call(self.add_pop_key_list, key):
+            return
         if key not in self.pop_key_list:
             self.pop_key_list.append(key)
 
@@ -1500,6 +1633,7 @@ class BaseModel(ModelInterface):
         f: Optional[Union[str, os.PathLike]] = None,
         verbose=True,
         level=1,
+        n_workers=1,
     ):
         """
         Check model data for common errors.
@@ -1517,6 +1651,10 @@ class BaseModel(ModelInterface):
         level : int
             Check method analysis level. If level=0, summary checks are
             performed. If level=1, full checks are performed.
+        n_workers : int, optional
+            Number of threads used to check packages concurrently, the
+            results are summarized in package order. Default is 1, which
+            checks the packages one at a time.
 
         Returns
         -------
@@ -1552,7 +1690,7 @@ class BaseModel(ModelInterface):
         else:
             chk.passed.append("Unit number conflicts")
 
-        return self._check(chk, level)
+        return self._check(chk, level, n_workers)
 
     def plot(self, SelPackList=None, **kwargs):
         """
@@ -117,6 +117,7 @@ class MFTransient:
             self._current_key = transient_key
         if self._current_key not in self._data_storage:
             self.add_transient_key(self._current_key)
+        self._modified = True
 
     def _get_file_entry_prep(self, transient_key=0):
         if isinstance(transient_key, int):
@@ -142,11 +143,13 @@ class MFTransient:
         self._current_key = transient_key
         if transient_key not in self._data_storage:
             self.add_transient_key(transient_key)
+        self._modified = True
 
     def _update_record_prep(self, transient_key=0):
         if isinstance(transient_key, int):
             self._verify_sp(transient_key)
         self._current_key = transient_key
+        self._modified = True
 
     def get_active_key_list(self):
         return sorted(self._data_storage.items(), key=itemgetter(0))
@@ -203,6 +206,8 @@ class MFData(DataInterface):
     ----------
     _current_key : str
         current key defining specific transient dataset to be accessed
+    modified : bool
+        whether the data changed since it was last loaded or written
 
     Methods
     -------
@@ -250,6 +255,8 @@ class MFData(DataInterface):
         self._data_storage = None
         self._data_type = structure.type
         self._keyword = ""
+        # new data has not been written
+        self._modified = True
         if self._simulation_data is not None:
             self.data_dimensions = DataDimensions(dimensions, structure)
             # build a unique path in the simulation dictionary
@@ -294,6 +301,17 @@ class MFData(DataInterface):
     def path(self):
         return self._path
 
+    @property
+    def modified(self):
+        """Whether the data changed since it was last loaded or written.
+        Changes made in place to data returned by get_data are not
+        tracked."""
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified):
+        self._modified = modified
+
     @property
     def array(self):
         kwargs = {"array": True}
@@ -349,6 +367,7 @@ class MFData(DataInterface):
         model = self.model
         if model is not None:
             model._mg_resync = True
+        self._modified = True
 
     @staticmethod
     def _tas_info(tas_str):
@@ -140,6 +140,8 @@ class MFArray(MFMultiDimVar):
             self._get_storage_obj().layer_storage.first_item().binary = value
         else:
             super().__setattr__(name, value)
+            return
+        self._modified = True
 
     def __getitem__(self, k):
         if isinstance(k, int):
@@ -486,6 +488,7 @@ class MFArray(MFMultiDimVar):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         if storage is None:
             self._set_storage_obj(self._new_storage(False, True))
@@ -596,6 +599,7 @@ class MFArray(MFMultiDimVar):
             check_data : bool
                 Verify data prior to storing
         """
+        self._modified = True
         storage = self._get_storage_obj()
         if storage is None:
             self._set_storage_obj(self._new_storage(False, True))
@@ -1657,6 +1661,7 @@ class MFTransientArray(MFArray, MFTransient):
                 Zero-based stress period
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -1706,6 +1711,7 @@ class MFTransientArray(MFArray, MFTransient):
                 Verify data prior to storing
 
         """
+        self._modified = True
         # store each stress period in separate file(s)
         for sp in self._data_storage.keys():
             self._current_key = sp
@@ -1745,6 +1751,7 @@ class MFTransientArray(MFArray, MFTransient):
             check_data : bool
                 Verify data prior to storing
         """
+        self._modified = True
         for sp in self._data_storage.keys():
             self._current_key = sp
             layer_storage = self._get_storage_obj().layer_storage
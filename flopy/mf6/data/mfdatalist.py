@@ -201,6 +201,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         # only store data externally (do not subpackage info)
         if self.structure.construct_package is None:
             storage = self._get_storage_obj()
@@ -244,6 +245,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         # check if data is already stored external
         if (
@@ -1601,6 +1603,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         internally by FloPy and is not intended to the end user.
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -1646,6 +1649,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         self._cache_model_grid = True
         for sp in self._data_storage.keys():
             self._current_key = sp
@@ -1681,6 +1685,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         self._cache_model_grid = True
         for sp in self._data_storage.keys():
             self._current_key = sp
@@ -1,9 +1,12 @@
 import copy
+import hashlib
 import inspect
 import io
 import os
+import re
 import sys
 import warnings
+import weakref
 
 import numpy as np
 import pandas
@@ -52,8 +55,15 @@ class PandasListStorage:
         sets data storage information based on the the dictionary "rec"
     set_internal(internal_data)
         make data storage internal, using "internal_data" as the data
+    shares_data(data) : bool
+        whether the internal data of this storage is the "data" object
     set_external(fname, data)
         make data storage external, with file "fname" and external data "data"
+    set_lazy_data(load_data, *args)
+        defer loading internal data until it is first accessed, when
+        load_data(*args) is called to load it
+    load_lazy_data()
+        load internal data whose loading was deferred
     internal_size : int
         size of the internal data
     has_data : bool
@@ -61,6 +71,7 @@ class PandasListStorage:
     """
 
     def __init__(self):
+        self._lazy_data = None
         self.internal_data = None
         self.fname = None
         self.iprn = None
@@ -74,6 +85,25 @@ class PandasListStorage:
     def __str__(self):
         return self.get_data_str(False)
 
+    @property
+    def internal_data(self):
+        self.load_lazy_data()
+        return self._internal_data
+
+    @internal_data.setter
+    def internal_data(self, internal_data):
+        self._lazy_data = None
+        self._internal_data = internal_data
+
+    def set_lazy_data(self, load_data, *args):
+        self._lazy_data = (load_data, args)
+
+    def load_lazy_data(self):
+        if self._lazy_data is not None:
+            load_data, args = self._lazy_data
+            self._lazy_data = None
+            load_data(*args)
+
     def _get_header_str(self):
         header_list = []
         if self.data_storage_type == DataStorageType.external_file:
@@ -150,6 +180,9 @@ class PandasListStorage:
         self.internal_data = data
         self.fname = fname
 
+    def shares_data(self, data):
+        return self._lazy_data is None and self._internal_data is data
+
     @property
     def internal_size(self):
         if not isinstance(self.internal_data, pandas.DataFrame):
@@ -159,7 +192,10 @@ class PandasListStorage:
 
     def has_data(self):
         if self.data_storage_type == DataStorageType.internal_array:
-            return self.internal_data is not None
+            return (
+                self._lazy_data is not None
+                or self._internal_data is not None
+            )
         else:
             return self.fname is not None
 
@@ -220,11 +256,12 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         self._header_names = None
         self._data_types = None
         self._data_item_names = None
-        self._mg = None
+        self._modelgrid = None
         self._current_key = 0
         self._max_file_size = 1000000000000000
-        if self._model_or_sim.type == "Model":
-            self._mg = self._model_or_sim.modelgrid
+        # data frames that can be shared by stress periods, by content digest
+        self._shared_data = None
+        self._text_cache = None
 
         if data is not None:
             try:
@@ -246,6 +283,14 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                     ex,
                 )
 
+    @property
+    def _mg(self):
+        # model grid is only built when needed, building it requires the
+        # discretization data
+        if self._modelgrid is None and self._model_or_sim.type == "Model":
+            self._modelgrid = self._model_or_sim.modelgrid
+        return self._modelgrid
+
     @property
     def data_type(self):
         """Type of data (DataType) stored in the list"""
@@ -308,9 +353,10 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                             and "cellid_row" in columns
                             and "cellid_column" in columns
                         ):
-                            data["cellid"] = data[
-                                ["cellid_layer", "cellid_row", "cellid_column"]
-                            ].apply(tuple, axis=1)
+                            data["cellid"] = self._cellid_tuples(
+                                data,
+                                ["cellid_layer", "cellid_row", "cellid_column"],
+                            )
                             if not keep_existing:
                                 data = data.drop(
                                     columns=[
@@ -326,17 +372,17 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                         elif "ncpl" in columns:
                             cell_2 = "cellid_ncpl"
                         if cell_2 is not None and "cellid_layer" in columns:
-                            data["cellid"] = data[
-                                ["cellid_layer", cell_2]
-                            ].apply(tuple, axis=1)
+                            data["cellid"] = self._cellid_tuples(
+                                data, ["cellid_layer", cell_2]
+                            )
                             if not keep_existing:
                                 data = data.drop(
                                     columns=["cellid_layer", cell_2]
                                 )
                     elif isinstance(self._mg, UnstructuredGrid):
                         if "cellid_node" in columns:
-                            data["cellid"] = data[["cellid_node"]].apply(
-                                tuple, axis=1
+                            data["cellid"] = self._cellid_tuples(
+                                data, ["cellid_node"]
                             )
                             if not keep_existing:
                                 data = data.drop(columns=["cellid_node"])
@@ -352,6 +398,43 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
 
         return data
 
+    @staticmethod
+    def _cellid_tuples(data, columns):
+        """build cellid tuples from the cellid columns of a DataFrame"""
+        return list(zip(*[data[column].tolist() for column in columns]))
+
+    @staticmethod
+    def _data_digest(data_frame):
+        """digest of the column names, types and values of a DataFrame"""
+        digest = hashlib.blake2b(digest_size=16)
+        for name, column in data_frame.items():
+            values = column.to_numpy()
+            digest.update(f"{name} {values.dtype}".encode())
+            if values.dtype == object:
+                digest.update("\0".join(map(str, values)).encode())
+            else:
+                digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+    def _share_data(self, data_frame):
+        """
+        return a stored DataFrame with the same contents as data_frame if
+        there is one, so identical stress periods share their data,
+        otherwise make data_frame available for sharing
+        """
+        if (
+            self._shared_data is None
+            or not isinstance(data_frame, pandas.DataFrame)
+            or data_frame.shape[0] == 0
+        ):
+            return data_frame
+        digest = self._data_digest(data_frame)
+        shared_frame = self._shared_data.get(digest)
+        if shared_frame is not None and shared_frame.equals(data_frame):
+            return shared_frame
+        self._shared_data[digest] = data_frame
+        return data_frame
+
     def _remove_cellid_fields(self, data):
         """remove cellid fields from data"""
         for data_item in self.structure.data_item_structures:
@@ -661,6 +744,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
 
         """  # (re)build data header
         self._build_data_header()
+        self._modified = True
         if isinstance(data, dict) and not self.has_data():
             MFPandasList.set_record(self, data)
             return
@@ -796,8 +880,10 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             current_data = self._get_dataframe()
             if current_data is not None:
                 data = pandas.concat([current_data, data])
+        data = self._share_data(data)
         if data_storage.data_storage_type == DataStorageType.external_file:
             # store external data until next write
+            self._unshare_external_file(data_storage)
             data_storage.internal_data = data
         else:
             # store data internally
@@ -855,6 +941,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Whether to verify the data
 
         """
+        self._modified = True
         if isinstance(record, dict):
             data_storage = self._get_storage_obj()
             if "filename" in record:
@@ -1016,6 +1103,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         # check if data is already stored external
         if (
@@ -1061,6 +1149,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         # only store data externally (do not subpackage info)
         if self.structure.construct_package is None:
             storage = self._get_storage_obj()
@@ -1119,23 +1208,31 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
 
         Returns
         -------
-        list, str : data from file, next line in file after data
+        str, str : lower case data text from file, including any comments and
+            blank lines, next line in file after data
         """
-        data_lines = []
-        clean_first_line = first_line.strip().lower()
-        if clean_first_line.startswith("end"):
-            return data_lines, fd_data_file.readline()
-        if len(clean_first_line) > 0 and clean_first_line[0] != "#":
-            data_lines.append(clean_first_line)
+        if first_line.strip()[:3].lower() == "end":
+            return "", fd_data_file.readline()
+        # only look for the end of the data here, comments and blank lines
+        # are skipped when the data are parsed
+        data_lines = [f"{first_line.rstrip()}\n"]
         line = fd_data_file.readline()
         while line:
-            line_mod = line.strip().lower()
-            if line_mod.startswith("end"):
-                return data_lines, line
-            if len(line_mod) > 0 and line_mod[0] != "#":
-                data_lines.append(line_mod)
+            if line.lstrip()[:3].lower() == "end":
+                break
+            data_lines.append(line)
             line = fd_data_file.readline()
-        return data_lines, ""
+        return "".join(data_lines).lower(), line
+
+    @staticmethod
+    def _clean_data_lines(file_data):
+        """data lines in file_data without comments and blank lines"""
+        data_lines = []
+        for line in file_data.splitlines():
+            line = line.strip()
+            if len(line) > 0 and line[0] != "#":
+                data_lines.append(line)
+        return data_lines
 
     def _dataframe_check(self, data_frame):
         valid = data_frame.shape[0] > 0
@@ -1186,7 +1283,13 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 fd_data_file.seek(0)
         return None
 
-    def _read_text_data(self, fd_data_file, first_line, external_file=False):
+    def _read_text_data(
+        self,
+        fd_data_file,
+        first_line,
+        external_file=False,
+        block_header=None,
+    ):
         """
         read list data from data file
 
@@ -1199,6 +1302,10 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         external_file : bool
             whether this is an external file
 
+        block_header : MFBlockHeader
+            header of the block containing the data, defaults to the last
+            block header read
+
         Returns
         -------
         DataFrame : file's list data
@@ -1214,7 +1321,16 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         file_data, next_line = self._file_data_to_memory(
             fd_data_file, first_line
         )
-        io_file_data = io.StringIO("\n".join(file_data))
+        text_digest = None
+        if self._shared_data is not None and not external_file:
+            # stress periods with the same text share their data
+            text_digest = hashlib.blake2b(
+                file_data.encode(), digest_size=16
+            ).hexdigest()
+            data_frame = self._shared_data.get(f"text {text_digest}")
+            if data_frame is not None:
+                return data_frame, [True, fd_data_file.readline()]
+        io_file_data = io.StringIO(file_data)
         if external_file:
             data_frame = self._try_pandas_read(io_file_data, fd_data_file.name)
             if data_frame is not None:
@@ -1230,6 +1346,9 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                     return_val = [True, fd_data_file.readline()]
 
         if data_frame is None:
+            io_file_data = io.StringIO(
+                "\n".join(self._clean_data_lines(file_data))
+            )
             # read user formatted data using MFList class
             list_data = MFList(
                 self._simulation_data,
@@ -1242,11 +1361,9 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 self._package,
                 self._block,
             )
-            # start in original location
-            io_file_data.seek(0)
-            return_val = list_data.load(
-                None, io_file_data, self._block.block_headers[-1]
-            )
+            if block_header is None:
+                block_header = self._block.block_headers[-1]
+            return_val = list_data.load(None, io_file_data, block_header)
             rec_array = list_data.get_data()
             if rec_array is not None:
                 data_frame = pandas.DataFrame(rec_array)
@@ -1254,6 +1371,8 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 return_val = [True, fd_data_file.readline()]
             else:
                 data_frame = None
+        if text_digest is not None and data_frame is not None:
+            self._shared_data[f"text {text_digest}"] = data_frame
         return data_frame, return_val
 
     def _save_binary_data(self, fd_data_file, data):
@@ -1266,7 +1385,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             self._current_key,
         )
         file_access.write_binary_file(
-            self._dataframe_to_recarray(data),
+            self._remove_cellid_fields(data),
             fd_data_file,
         )
         data_storage = self._get_storage_obj()
@@ -1402,6 +1521,12 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             return_val = [False, None]
         # else internal
         else:
+            if self._simulation_data.lazy_io and self.repeating:
+                return_val = self._skip_text_data(
+                    data_storage, file_handle, first_line, block_header
+                )
+                if return_val is not None:
+                    return return_val
             # read data into pandas dataframe
             pd_data, return_val = self._read_text_data(
                 file_handle, first_line, False
@@ -1412,6 +1537,55 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             data_storage.set_internal(pd_data)
         return return_val
 
+    def _skip_text_data(
+        self, data_storage, fd_data_file, first_line, block_header
+    ):
+        """skip to the end of the block, the data are read from the file
+        when they are first accessed"""
+        try:
+            offset = fd_data_file.tell()
+        except OSError:
+            return None
+        clean_first_line = first_line.strip()
+        has_data = len(clean_first_line) > 0 and clean_first_line[0] != "#"
+        line = fd_data_file.readline()
+        while line:
+            line_mod = line.strip().lower()
+            if line_mod.startswith("end"):
+                if not has_data:
+                    break
+                file_path = os.path.abspath(fd_data_file.name)
+                data_storage.set_internal(None)
+                data_storage.set_lazy_data(
+                    self._read_lazy_data,
+                    data_storage,
+                    file_path,
+                    offset,
+                    first_line,
+                    block_header,
+                )
+                self._simulation_data.mfpath.add_lazy_data(
+                    file_path, data_storage
+                )
+                return [True, fd_data_file.readline()]
+            if len(line_mod) > 0 and line_mod[0] != "#":
+                has_data = True
+            line = fd_data_file.readline()
+        # no data or no end to the data found, read it now
+        fd_data_file.seek(offset)
+        return None
+
+    def _read_lazy_data(
+        self, data_storage, file_path, offset, first_line, block_header
+    ):
+        with open(file_path, "r") as fd_data_file:
+            fd_data_file.seek(offset)
+            pd_data, return_val = self._read_text_data(
+                fd_data_file, first_line, False, block_header
+            )
+        data_storage.internal_data = pd_data
+        self._simulation_data.mfpath.remove_lazy_data(file_path, data_storage)
+
     def _new_storage(self):
         return {"Data": PandasListStorage()}
 
@@ -1748,78 +1922,94 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             fd_main.write(f"{indent}{indent}{ext_string}")
         if data_storage is None or data_storage.internal_data is None:
             return ""
-        # Loop through data pieces
-        data = self._remove_cellid_fields(data_storage.internal_data)
-        if (
-            data_storage.data_storage_type == DataStorageType.internal_array
-            or not data_storage.binary
-            or fd_data_file is None
-        ):
-            # add spacer column
-            if "leading_space" not in data:
-                data.insert(loc=0, column="leading_space", value="")
-            if "leading_space_2" not in data:
-                data.insert(loc=0, column="leading_space_2", value="")
-
+        # the stored data can be shared by several stress periods, so it is
+        # never modified here
+        stored_data = data_storage.internal_data
         result = ""
-        # if data is internal or has been modified
         if (
-            data_storage.data_storage_type == DataStorageType.internal_array
-            or data is not None
-            or fd_data_file is None
+            data_storage.data_storage_type == DataStorageType.external_file
+            and data_storage.binary
+            and fd_data_file is not None
         ):
-            if (
-                data_storage.data_storage_type == DataStorageType.external_file
-                and data_storage.binary
-                and fd_data_file is not None
+            # write old way using numpy
+            self._save_binary_data(fd_data_file, stored_data)
+        elif stored_data.shape[0] == 0:
+            if fd_data_file is None or not isinstance(
+                fd_data_file, io.TextIOBase
             ):
-                # write old way using numpy
-                self._save_binary_data(fd_data_file, data)
+                result = "\n"
             else:
-                if data.shape[0] == 0:
-                    if fd_data_file is None or not isinstance(
-                        fd_data_file, io.TextIOBase
-                    ):
-                        result = "\n"
-                    else:
-                        # no data, just write empty line
-                        fd_data_file.write("\n")
-                else:
-                    # convert data to 1-based
-                    self._increment_id_fields(data)
-                    # write converted data
-                    float_format = (
-                        f"%{self._simulation_data.reg_format_str[2:-1]}"
-                    )
-                    result = data.to_csv(
-                        fd_data_file,
-                        sep=" ",
-                        header=False,
-                        index=False,
-                        float_format=float_format,
-                        lineterminator="\n",
-                    )
-                    # clean up
-                    data_storage.modified = False
-                    self._decrement_id_fields(data)
-                if (
-                    data_storage.data_storage_type
-                    == DataStorageType.external_file
-                ):
-                    data_storage.internal_data = None
-
-        if data_storage.internal_data is not None:
-            # clean up
-            if "leading_space" in data_storage.internal_data:
-                data_storage.internal_data = data_storage.internal_data.drop(
-                    columns="leading_space"
-                )
-            if "leading_space_2" in data_storage.internal_data:
-                data_storage.internal_data = data_storage.internal_data.drop(
-                    columns="leading_space_2"
+                # no data, just write empty line
+                fd_data_file.write("\n")
+        else:
+            float_format = f"%{self._simulation_data.reg_format_str[2:-1]}"
+            if fd_data_file is None or isinstance(fd_data_file, io.TextIOBase):
+                result = self._get_data_text(stored_data, float_format)
+                if fd_data_file is not None:
+                    fd_data_file.write(result)
+                    result = None
+            else:
+                result = self._get_write_data(stored_data).to_csv(
+                    fd_data_file,
+                    sep=" ",
+                    header=False,
+                    index=False,
+                    float_format=float_format,
+                    lineterminator="\n",
                 )
+            data_storage.modified = False
+        if data_storage.data_storage_type == DataStorageType.external_file:
+            data_storage.internal_data = None
         return result
 
+    def _get_write_data(self, data_frame):
+        """copy of data_frame with the layout written to MODFLOW 6 files"""
+        data = self._remove_cellid_fields(data_frame).copy()
+        # add spacer column
+        if "leading_space" not in data:
+            data.insert(loc=0, column="leading_space", value="")
+        if "leading_space_2" not in data:
+            data.insert(loc=0, column="leading_space_2", value="")
+        # convert data to 1-based
+        self._increment_id_fields(data)
+        return data
+
+    def _get_data_text(self, data_frame, float_format):
+        """
+        data_frame as MODFLOW 6 list text, reusing the text of the last
+        stress period written when it shares the same data
+        """
+        data_text = None
+        if self._text_cache is not None:
+            frame_ref, text_format, text = self._text_cache
+            if frame_ref() is data_frame and text_format == float_format:
+                data_text = text
+        if data_text is None:
+            data_text = self._get_write_data(data_frame).to_csv(
+                None,
+                sep=" ",
+                header=False,
+                index=False,
+                float_format=float_format,
+                lineterminator="\n",
+            )
+        if self._keep_data_text(data_frame):
+            self._text_cache = (weakref.ref(data_frame), float_format, data_text)
+        else:
+            self._text_cache = None
+        return data_text
+
+    def _keep_data_text(self, data_frame):
+        """whether the text of data_frame will be written again"""
+        return False
+
+    def _unshare_external_file(self, data_storage):
+        """
+        give data_storage an external file of its own before its data is
+        changed, if its external file is shared with other data
+        """
+        pass
+
     def _get_file_path(self):
         """
         gets the file path to the data
@@ -1981,6 +2171,7 @@ class MFPandasTransientList(
         )
         self.repeating = True
         self.empty_keys = {}
+        self._shared_data = weakref.WeakValueDictionary()
 
     @property
     def data_type(self):
@@ -2024,6 +2215,7 @@ class MFPandasTransientList(
         internally by FloPy and is not intended to the end user.
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -2064,7 +2256,10 @@ class MFPandasTransientList(
             check_data : bool
                 Verify data prior to storing
         """
+        self._modified = True
         self._cache_model_grid = True
+        # stress periods that share their data also share an external file
+        external_files = {}
         for sp in self._data_storage.keys():
             self._current_key = sp
             storage = self._get_storage_obj()
@@ -2075,6 +2270,11 @@ class MFPandasTransientList(
                 != DataStorageType.external_file
                 or replace_existing_external
             ):
+                data = storage.internal_data
+                if id(data) in external_files:
+                    storage.set_external(external_files[id(data)][1])
+                    storage.binary = binary
+                    continue
                 fname, ext = os.path.splitext(external_file_path)
                 if datautil.DatumUtil.is_int(sp):
                     full_name = f"{fname}_{int(sp) + 1}{ext}"
@@ -2087,8 +2287,40 @@ class MFPandasTransientList(
                     replace_existing_external,
                     check_data,
                 )
+                external_files[id(data)] = (data, full_name)
         self._cache_model_grid = False
 
+    def _unshare_external_file(self, data_storage):
+        fnames = {
+            storage.fname
+            for storage in self._data_storage.values()
+            if storage is not data_storage
+            and storage.data_storage_type == DataStorageType.external_file
+        }
+        if data_storage.fname not in fnames:
+            return
+        # stress periods that share a file get a file named after the
+        # stress period, like store_as_external_file
+        stem, ext = os.path.splitext(data_storage.fname)
+        if datautil.DatumUtil.is_int(self._current_key):
+            suffix = int(self._current_key) + 1
+        else:
+            suffix = self._current_key
+        base = re.sub(r"_\d+$", "", stem)
+        fname = f"{base}_{suffix}{ext}"
+        count = 1
+        while fname in fnames:
+            fname = f"{base}_{suffix}_{count}{ext}"
+            count += 1
+        data_storage.fname = fname
+
+    def _keep_data_text(self, data_frame):
+        if not datautil.DatumUtil.is_int(self._current_key):
+            return False
+        # keep the text while the next stress period shares the data
+        storage = self._data_storage.get(self._current_key + 1)
+        return storage is not None and storage.shares_data(data_frame)
+
     def store_internal(
         self,
         check_data=True,
@@ -2101,6 +2333,7 @@ class MFPandasTransientList(
                 Verify data prior to storing
 
         """
+        self._modified = True
         self._cache_model_grid = True
         for sp in self._data_storage.keys():
             self._current_key = sp
@@ -237,6 +237,7 @@ class MFScalar(mfdata.MFData):
 
     def add_one(self):
         """Adds one if this is an integer scalar"""
+        self._modified = True
         datum_type = self.structure.get_datum_type()
         if datum_type == int or datum_type == np.int32:
             if self._get_storage_obj().get_data() is None:
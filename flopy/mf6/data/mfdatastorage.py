@@ -74,6 +74,13 @@ class LayerStorage:
 
     Methods
     -------
+    set_lazy_data(load_data, *args)
+        defers loading internal data until it is first accessed, when
+        load_data(*args) is called to load it
+    load_lazy_data()
+        loads internal data whose loading was deferred
+    has_internal_data() : bool
+        whether internal data is stored or waiting to be loaded
     get_const_val(layer)
         gets the constant value of a given layer.  data storage type for layer
         must be "internal_constant".
@@ -104,6 +111,7 @@ class LayerStorage:
     ):
         self._data_storage_parent = data_storage
         self._lay_indexes = lay_indexes
+        self._lazy_data = None
         self.internal_data = None
         self.data_const_value = None
         self.data_storage_type = data_storage_type
@@ -116,6 +124,28 @@ class LayerStorage:
         self.iprn = None
         self.binary = False
 
+    @property
+    def internal_data(self):
+        self.load_lazy_data()
+        return self._internal_data
+
+    @internal_data.setter
+    def internal_data(self, internal_data):
+        self._lazy_data = None
+        self._internal_data = internal_data
+
+    def set_lazy_data(self, load_data, *args):
+        self._lazy_data = (load_data, args)
+
+    def load_lazy_data(self):
+        if self._lazy_data is not None:
+            load_data, args = self._lazy_data
+            self._lazy_data = None
+            load_data(*args)
+
+    def has_internal_data(self):
+        return self._lazy_data is not None or self._internal_data is not None
+
     def set_internal_constant(self):
         self.data_storage_type = DataStorageType.internal_constant
 
@@ -690,7 +720,7 @@ class DataStorage:
     def _access_data(self, layer, return_data=False, apply_mult=True):
         layer_check = self._resolve_layer(layer)
         if (
-            self.layer_storage[layer_check].internal_data is None
+            not self.layer_storage[layer_check].has_internal_data()
             and self.layer_storage[layer_check].data_storage_type
             == DataStorageType.internal_array
         ) or (
@@ -730,7 +760,7 @@ class DataStorage:
             if (
                 self.data_structure_type == DataStructureType.ndarray
                 and self.layer_storage[layer_check].data_const_value is None
-                and self.layer_storage[layer_check].internal_data is None
+                and not self.layer_storage[layer_check].has_internal_data()
             ):
                 return None
             if not (layer is None or self.layer_storage.in_shape(layer)):
@@ -765,7 +795,7 @@ class DataStorage:
                         and check_storage.data_storage_type
                         == DataStorageType.internal_constant
                     ) or (
-                        check_storage.internal_data is not None
+                        check_storage.has_internal_data()
                         and check_storage.data_storage_type
                         == DataStorageType.internal_array
                     )
@@ -822,7 +852,7 @@ class DataStorage:
                 if return_data:
                     return self.layer_storage[layer].internal_data
                 else:
-                    return self.layer_storage[layer].internal_data is not None
+                    return self.layer_storage[layer].has_internal_data()
             elif (
                 self.layer_storage[layer].data_storage_type
                 == DataStorageType.internal_constant
@@ -1242,7 +1272,7 @@ class DataStorage:
         for index in self.layer_storage.indexes():
             if (
                 self.layer_storage[index].fname is not None
-                or self.layer_storage[index].internal_data is not None
+                or self.layer_storage[index].has_internal_data()
             ):
                 layer_index.append(index)
         return layer_index
@@ -1,4 +1,6 @@
 import inspect
+import os
+import re
 import sys
 from copy import deepcopy
 
@@ -11,6 +13,10 @@ from ..data.mfstructure import DataType, DatumType, MFDataStructure
 from ..mfbase import MFDataException, VerbosityLevel
 from .mfdatautil import MFComment, convert_data, to_string
 
+# text in an array that is not plain numeric data, like comments, repeat
+# counts and quotes, is left to the tokenizer
+_non_numeric_text = re.compile(r"[^0-9eE+\-.,\s]")
+
 
 class MFFileAccess:
     def __init__(
@@ -642,6 +648,29 @@ class MFFileAccessArray(MFFileAccess):
         if fd is None:
             close_file = True
             fd = self._open_ext_file(fname)
+
+        if data_type == DatumType.double_precision:
+            data_type = np.float64
+        elif data_type == DatumType.integer:
+            data_type = np.int32
+
+        # try to parse plain numeric data in bulk, the tokenizer below
+        # continues with any lines read if that is not possible
+        data_out, lines = self._read_text_data_bulk(
+            fd, data_size, data_type, line_size, close_file
+        )
+        if data_out is not None:
+            data_out = self._resolve_cellid_numbers_from_file(data_out)
+            if close_file:
+                fd.close()
+            return np.reshape(data_out, data_dim), current_size
+
+        lines = iter(lines)
+
+        def readline():
+            line = next(lines, None)
+            return fd.readline() if line is None else line
+
         data_raw = []
         line = " "
         PyListUtil.reset_delimiter_used()
@@ -649,7 +678,7 @@ class MFFileAccessArray(MFFileAccess):
             # data size is not defined, load data until an end of data
             # indicator is found
             while True:
-                line = fd.readline()
+                line = readline()
                 arr_line = PyListUtil.split_data_line(line, True)
                 if line == "" or arr_line[0].upper() == "END":
                     break
@@ -661,7 +690,7 @@ class MFFileAccessArray(MFFileAccess):
                     PyListUtil.reset_delimiter_used()
         else:
             while line != "" and len(data_raw) < data_size:
-                line = fd.readline()
+                line = readline()
                 arr_line = PyListUtil.split_data_line(line, True)
                 if not MFComment.is_comment(arr_line, True):
                     if line_size is not None:
@@ -698,11 +727,6 @@ class MFFileAccessArray(MFFileAccess):
                 self._simulation_data.debug,
             )
 
-        if data_type == DatumType.double_precision:
-            data_type = np.float64
-        elif data_type == DatumType.integer:
-            data_type = np.int32
-
         if data_size < 0:
             data_out = np.fromiter(data_raw, dtype=data_type)
         else:
@@ -715,6 +739,54 @@ class MFFileAccessArray(MFFileAccess):
             data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    @staticmethod
+    def _read_text_data_bulk(fd, data_size, data_type, line_size, whole_file):
+        """
+        Read data_size whitespace or comma delimited numbers from fd and
+        parse them in one pass.
+
+        Returns the data, or None and the lines read from fd if the data
+        contains comments, repeat counts, quotes or other text that needs
+        the tokenizer. Whole files are read at once, otherwise lines are
+        only read until data_size values are found so that fd is left at
+        the end of the data.
+
+        """
+        if data_size < 0 or np.dtype(data_type).kind not in "fi":
+            return None, []
+        if whole_file:
+            text = fd.read()
+            lines = text.splitlines(keepends=True)
+            if _non_numeric_text.search(text) is not None:
+                return None, lines
+            if line_size is not None and any(
+                len(line.replace(",", " ").split()) > line_size for line in lines
+            ):
+                return None, lines
+        else:
+            lines = []
+            count = 0
+            while count < data_size:
+                line = fd.readline()
+                if line == "":
+                    break
+                lines.append(line)
+                if _non_numeric_text.search(line) is not None:
+                    return None, lines
+                ntokens = len(line.replace(",", " ").split())
+                if line_size is not None and ntokens > line_size:
+                    return None, lines
+                count += ntokens
+            text = "".join(lines)
+
+        try:
+            data = np.fromstring(text.replace(",", " "), dtype=data_type, sep=" ")
+        except ValueError:
+            return None, lines
+        if data.size < data_size:
+            return None, lines
+        return data[:data_size], lines
+
     def load_from_package(
         self,
         first_line,
@@ -805,20 +877,22 @@ class MFFileAccessArray(MFFileAccess):
         for dimension in dimensions:
             layer_size *= dimension
 
+        next_line = None
         if aux_var_index is None:
             # loop through the number of layers
             for layer in storage.layer_storage.indexes():
-                self._load_layer(
+                next_line = self._load_layer(
                     layer,
                     layer_size,
                     storage,
                     arr_line,
                     file_handle,
                     layer_shape,
+                    next_line,
                 )
         else:
             # write the aux var to it's unique index
-            self._load_layer(
+            next_line = self._load_layer(
                 (aux_var_index,),
                 layer_size,
                 storage,
@@ -826,13 +900,25 @@ class MFFileAccessArray(MFFileAccess):
                 file_handle,
                 layer_shape,
             )
+        if next_line is not None:
+            return layer_shape, [True, next_line]
         return layer_shape, [False, None]
 
     def _load_layer(
-        self, layer, layer_size, storage, arr_line, file_handle, layer_shape
+        self,
+        layer,
+        layer_size,
+        storage,
+        arr_line,
+        file_handle,
+        layer_shape,
+        next_line=None,
     ):
         di_struct = self.structure.data_item_structures[0]
-        if not di_struct.just_data or datautil.max_tuple_abs_size(layer) > 0:
+        if next_line is not None:
+            # control record already read while skipping the previous layer
+            arr_line = datautil.PyListUtil.split_data_line(next_line)
+        elif not di_struct.just_data or datautil.max_tuple_abs_size(layer) > 0:
             arr_line = self._get_next_data_line(file_handle)
 
         layer_storage = storage.layer_storage[layer]
@@ -929,67 +1015,29 @@ class MFFileAccessArray(MFFileAccess):
                     layer,
                 )
 
-            try:
-                # load variable data from current file
-                if multiplier is not None:
-                    storage.layer_storage[layer].factor = multiplier
-                if print_format is not None:
-                    storage.layer_storage[layer].iprn = print_format
-                data_type = storage.data_dimensions.structure.get_datum_type(
-                    True
-                )
-                data_from_file = self.read_text_data_from_file(
-                    storage.get_data_size(layer),
-                    data_type,
-                    storage.get_data_dimensions(layer),
+            if multiplier is not None:
+                storage.layer_storage[layer].factor = multiplier
+            if print_format is not None:
+                storage.layer_storage[layer].iprn = print_format
+            if self._simulation_data.lazy_io:
+                next_line = self._skip_internal_layer(
                     layer,
-                    storage.layered,
-                    fd=file_handle,
-                )
-            except Exception as ex:
-                type_, value_, traceback_ = sys.exc_info()
-                raise MFDataException(
-                    self.structure.get_model(),
-                    self.structure.get_package(),
-                    self._path,
-                    f"reading data from file {file_handle.name}",
-                    self.structure.name,
-                    inspect.stack()[0][3],
-                    type_,
-                    value_,
-                    traceback_,
-                    None,
-                    self._simulation_data.debug,
-                    ex,
+                    layer_shape,
+                    storage,
+                    file_handle,
+                    multiplier,
+                    print_format,
                 )
-            data_shaped = self._resolve_data_shape(
-                data_from_file[0], layer_shape, storage
+                if next_line is not None:
+                    return next_line
+            self._read_internal_layer(
+                layer,
+                layer_shape,
+                storage,
+                file_handle,
+                multiplier,
+                print_format,
             )
-            try:
-                storage.store_internal(
-                    data_shaped,
-                    layer,
-                    const=False,
-                    multiplier=[multiplier],
-                    print_format=print_format,
-                )
-            except Exception as ex:
-                comment = f'Could not store data: "{data_shaped}"'
-                type_, value_, traceback_ = sys.exc_info()
-                raise MFDataException(
-                    self.structure.get_model(),
-                    self.structure.get_package(),
-                    self._path,
-                    "storing data",
-                    self.structure.name,
-                    inspect.stack()[0][3],
-                    type_,
-                    value_,
-                    traceback_,
-                    comment,
-                    self._simulation_data.debug,
-                    ex,
-                )
         elif arr_line[0].upper() == "OPEN/CLOSE":
             try:
                 storage.process_open_close_line(arr_line, layer)
@@ -1014,6 +1062,132 @@ class MFFileAccessArray(MFFileAccess):
                     ex,
                 )
 
+        return None
+
+    def _skip_internal_layer(
+        self,
+        layer,
+        layer_shape,
+        storage,
+        file_handle,
+        multiplier,
+        print_format,
+    ):
+        # skip to the next control record or keyword, the data are read
+        # from the file when they are first accessed
+        try:
+            offset = file_handle.tell()
+        except OSError:
+            return None
+        line = file_handle.readline()
+        while line != "":
+            clean_line = line.strip()
+            if clean_line[:1].isalpha():
+                file_path = os.path.abspath(file_handle.name)
+                layer_storage = storage.layer_storage[layer]
+                layer_storage.set_lazy_data(
+                    self._read_lazy_layer,
+                    file_path,
+                    offset,
+                    layer,
+                    layer_shape,
+                    storage,
+                    multiplier,
+                    print_format,
+                )
+                self._simulation_data.mfpath.add_lazy_data(
+                    file_path, layer_storage
+                )
+                return clean_line
+            line = file_handle.readline()
+        # no end to the data found, read it now
+        file_handle.seek(offset)
+        return None
+
+    def _read_lazy_layer(
+        self,
+        file_path,
+        offset,
+        layer,
+        layer_shape,
+        storage,
+        multiplier,
+        print_format,
+    ):
+        with open(file_path, "r") as fd:
+            fd.seek(offset)
+            self._read_internal_layer(
+                layer, layer_shape, storage, fd, multiplier, print_format
+            )
+        self._simulation_data.mfpath.remove_lazy_data(
+            file_path, storage.layer_storage[layer]
+        )
+
+    def _read_internal_layer(
+        self,
+        layer,
+        layer_shape,
+        storage,
+        file_handle,
+        multiplier,
+        print_format,
+    ):
+        try:
+            # load variable data from current file
+            data_type = storage.data_dimensions.structure.get_datum_type(True)
+            data_from_file = self.read_text_data_from_file(
+                storage.get_data_size(layer),
+                data_type,
+                storage.get_data_dimensions(layer),
+                layer,
+                storage.layered,
+                fd=file_handle,
+            )
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(
+                self.structure.get_model(),
+                self.structure.get_package(),
+                self._path,
+                f"reading data from file {file_handle.name}",
+                self.structure.name,
+                inspect.stack()[0][3],
+                type_,
+                value_,
+                traceback_,
+                None,
+                self._simulation_data.debug,
+                ex,
+            )
+        data_shaped = self._resolve_data_shape(
+            data_from_file[0], layer_shape, storage
+        )
+        try:
+            storage.store_internal(
+                data_shaped,
+                layer,
+                const=False,
+                multiplier=[multiplier],
+                print_format=print_format,
+            )
+        except Exception as ex:
+            comment = f'Could not store data: "{data_shaped}"'
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(
+                self.structure.get_model(),
+                self.structure.get_package(),
+                self._path,
+                "storing data",
+                self.structure.name,
+                inspect.stack()[0][3],
+                type_,
+                value_,
+                traceback_,
+                comment,
+                self._simulation_data.debug,
+                ex,
+            )
+
     def _is_cellid_or_numeric_index(self):
         if (
             self.structure.data_item_structures[0].numeric_index
@@ -1098,35 +1272,29 @@ class MFFileAccessList(MFFileAccess):
         file_array = np.fromfile(read_file, dtype=header, count=-1)
         if not build_cellid:
             return file_array
-        # build data list for recarray
+        # build data list for recarray, one column at a time
         cellid_size = {}
-        data_list = []
-        for record in file_array:
-            data_record = ()
-            current_cellid_size = 0
-            current_cellid = ()
-            for index, data_item in enumerate(record):
-                if index in ext_cellid_indexes:
-                    current_cellid += (data_item - 1,)
-                    current_cellid_size += 1
-                    rec_len = len(data_record)
-                    if rec_len not in cellid_size:
-                        data_item_struct = self.structure.data_item_structures[
-                            rec_len
-                        ]
-                        cellid_size[rec_len] = (
-                            self._data_dimensions.get_cellid_size(
-                                data_item_struct.name
-                            )
+        columns = []
+        cellid_columns = []
+        for index, name in enumerate(file_array.dtype.names):
+            if index in ext_cellid_indexes:
+                cellid_columns.append((file_array[name] - 1).tolist())
+                rec_len = len(columns)
+                if rec_len not in cellid_size:
+                    data_item_struct = self.structure.data_item_structures[
+                        rec_len
+                    ]
+                    cellid_size[rec_len] = (
+                        self._data_dimensions.get_cellid_size(
+                            data_item_struct.name
                         )
-                    if current_cellid_size == cellid_size[rec_len]:
-                        data_record += (current_cellid,)
-                        current_cellid = ()
-                        current_cellid_size = 0
-                else:
-                    data_record += (data_item,)
-            data_list.append(data_record)
-        return data_list
+                    )
+                if len(cellid_columns) == cellid_size[rec_len]:
+                    columns.append(list(zip(*cellid_columns)))
+                    cellid_columns = []
+            else:
+                columns.append(file_array[name].tolist())
+        return list(zip(*columns))
 
     def write_binary_file(self, data, fname):
         fd = self._open_ext_file(fname, binary=True, write=True)
@@ -1136,6 +1304,37 @@ class MFFileAccessList(MFFileAccess):
 
     def _build_data_array(self, data):
         header, int_cellid_indexes, ext_cellid_indexes = self._get_header()
+        # split data into columns, with cellids split into one column per
+        # cellid index
+        if hasattr(data, "columns"):
+            # pandas dataframe with cellids already split
+            data_columns = [data[name].to_numpy() for name in data.columns]
+        else:
+            data_columns = [data[name] for name in data.dtype.names]
+        columns = []
+        for column in data_columns:
+            if column.dtype == object and len(column) > 0:
+                cellids = np.array(column.tolist())
+                if cellids.ndim == 2:
+                    columns.extend(cellids.T)
+                    continue
+            columns.append(column)
+        if len(columns) != len(header):
+            return self._build_data_array_records(data)
+        data_array = np.empty(len(data), dtype=header)
+        for index, (name, column) in enumerate(
+            zip(data_array.dtype.names, columns)
+        ):
+            if index in ext_cellid_indexes:
+                data_array[name] = np.asarray(column, dtype=np.int64) + 1
+            else:
+                data_array[name] = column
+        return data_array
+
+    def _build_data_array_records(self, data):
+        header, int_cellid_indexes, ext_cellid_indexes = self._get_header()
+        if hasattr(data, "columns"):
+            data = data.itertuples(index=False)
         data_list = []
         for record in data:
             new_record = ()
@@ -7,6 +7,8 @@ mfstructure module.  Contains classes related to package structure
 import ast
 import keyword
 import os
+import threading
+from collections.abc import MutableMapping
 from enum import Enum
 from textwrap import TextWrapper
 
@@ -14,6 +16,10 @@ import numpy as np
 
 from ..mfbase import StructException
 
+# packages may be loaded in worker threads, a structure is built by only one
+# of them
+_build_lock = threading.RLock()
+
 numeric_index_text = (
     "This argument is an index variable, which means that "
     "it should be treated as zero-based when working with "
@@ -1767,6 +1773,9 @@ class MFInputFileStructure:
     get_data_structure(path : string)
         Returns a data structure of it exists, otherwise returns None.  Data
         structure type returned is based on the tuple/list "path"
+    tag_read_as_arrays()
+        Tags this input file structure if it is the READASARRAYS version of
+        a package
 
     See Also
     --------
@@ -1810,9 +1819,23 @@ class MFInputFileStructure:
         self.dfn_list = dfn_file.dfn_list
         self.sub_package = self._sub_package()
 
+    @classmethod
+    def package_structure(cls, dfn_file, path, common, model_file):
+        package_struct = cls(dfn_file, path, common, model_file)
+        package_struct.tag_read_as_arrays()
+        return package_struct
+
     def advanced_package(self):
         return self.has_packagedata and self.has_perioddata
 
+    def tag_read_as_arrays(self):
+        if (
+            self.get_data_structure(("options", "readasarrays"))
+            or self.get_data_structure(("options", "readarraylayer"))
+            or self.get_data_structure(("options", "readarraygrid"))
+        ):
+            self.read_as_arrays = True
+
     def _sub_package(self):
         mfstruct = MFStructure()
         for value in mfstruct.flopy_dict.values():
@@ -1840,6 +1863,62 @@ class MFInputFileStructure:
             return None
 
 
+class MFStructureDict(MutableMapping):
+    """
+    Dictionary of input file structures.  Building an input file structure
+    from its dfn information is deferred until the structure is first
+    accessed, so only the packages that are used are processed.
+
+    Methods
+    -------
+    add_builder : (key : string, builder : callable, *args)
+        Adds an input file structure that is built with builder(*args) the
+        first time it is accessed
+    is_built(key : string) : bool
+        Returns whether the input file structure stored under key has been
+        built
+    """
+
+    def __init__(self):
+        self._struct_objs = {}
+        self._builders = {}
+
+    def add_builder(self, key, builder, *args):
+        self._struct_objs[key] = None
+        self._builders[key] = (builder, args)
+
+    def is_built(self, key):
+        return key in self._struct_objs and key not in self._builders
+
+    def __getitem__(self, key):
+        if key in self._builders:
+            with _build_lock:
+                if key in self._builders:
+                    builder, args = self._builders[key]
+                    self._struct_objs[key] = builder(*args)
+                    del self._builders[key]
+        return self._struct_objs[key]
+
+    def __setitem__(self, key, value):
+        with _build_lock:
+            self._builders.pop(key, None)
+            self._struct_objs[key] = value
+
+    def __delitem__(self, key):
+        with _build_lock:
+            self._builders.pop(key, None)
+            del self._struct_objs[key]
+
+    def __contains__(self, key):
+        return key in self._struct_objs
+
+    def __iter__(self):
+        return iter(self._struct_objs)
+
+    def __len__(self):
+        return len(self._struct_objs)
+
+
 class MFModelStructure:
     """
     Defines the structure of a MF6 model and its packages
@@ -1886,7 +1965,7 @@ class MFModelStructure:
         # add name file structure
         self.model_type = model_type
         self.name_file_struct_obj = None
-        self.package_struct_objs = {}
+        self.package_struct_objs = MFStructureDict()
         self.utl_struct_objs = utl_struct_objs
 
     def add_namefile(self, dfn_file, common):
@@ -1895,8 +1974,13 @@ class MFModelStructure:
         )
 
     def add_package(self, dfn_file, common):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (self.model_type,), common, True
+        self.package_struct_objs.add_builder(
+            dfn_file.package_type,
+            MFInputFileStructure.package_structure,
+            dfn_file,
+            (self.model_type,),
+            common,
+            True,
         )
 
     def get_package_struct(self, package_type):
@@ -1973,9 +2057,6 @@ class MFSimulationStructure:
     get_data_structure(path : string)
         Returns a data structure of it exists, otherwise returns None.  Data
         structure type returned is based on the tuple/list "path"
-    tag_read_as_arrays
-        Searches through all packages and tags any packages with a name that
-        indicates they are the READASARRAYS version of a package.
 
     See Also
     --------
@@ -1990,8 +2071,8 @@ class MFSimulationStructure:
     def __init__(self):
         # initialize
         self.name_file_struct_obj = None
-        self.package_struct_objs = {}
-        self.utl_struct_objs = {}
+        self.package_struct_objs = MFStructureDict()
+        self.utl_struct_objs = MFStructureDict()
         self.model_struct_objs = {}
         self.common = None
         self.model_type = ""
@@ -2052,13 +2133,23 @@ class MFSimulationStructure:
         )
 
     def add_util(self, dfn_file):
-        self.utl_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (), self.common, True
+        self.utl_struct_objs.add_builder(
+            dfn_file.package_type,
+            MFInputFileStructure,
+            dfn_file,
+            (),
+            self.common,
+            True,
         )
 
     def add_package(self, dfn_file, model_file=True):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (), self.common, model_file
+        self.package_struct_objs.add_builder(
+            dfn_file.package_type,
+            MFInputFileStructure.package_structure,
+            dfn_file,
+            (),
+            self.common,
+            model_file,
         )
 
     def store_common(self, dfn_file):
@@ -2108,26 +2199,6 @@ class MFSimulationStructure:
         else:
             return None
 
-    def tag_read_as_arrays(self):
-        for key, package_struct in self.package_struct_objs.items():
-            if (
-                package_struct.get_data_structure(('options', 'readasarrays'))
-                or package_struct.get_data_structure(('options', 'readarraylayer'))
-                or package_struct.get_data_structure(('options', 'readarraygrid'))
-            ):
-                package_struct.read_as_arrays = True
-        for model_key, model_struct in self.model_struct_objs.items():
-            for (
-                key,
-                package_struct,
-            ) in model_struct.package_struct_objs.items():
-                if (
-                    package_struct.get_data_structure(('options', 'readasarrays'))
-                    or package_struct.get_data_structure(('options', 'readarraylayer'))
-                    or package_struct.get_data_structure(('options', 'readarraygrid'))
-                ):
-                    package_struct.read_as_arrays = True
-
 
 class MFStructure:
     """
@@ -2186,8 +2257,8 @@ class MFStructure:
                     MFStructure().flopy_dict["solution_packages"][
                         package.package_abbr
                     ] = entry[1:]
-            # process each package
+            # process each package, package structures are built from
+            # their dfn the first time they are accessed
             self.sim_struct.process_dfn(DfnPackage(package))
-        self.sim_struct.tag_read_as_arrays()
 
         return True
@@ -4,14 +4,20 @@ import copy
 import inspect
 import os
 import sys
+import threading
 import traceback
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from shutil import copyfile
 from typing import Union
 
+# data storages whose data are read on first access may be registered from
+# the threads that load package files
+_lazy_data_lock = threading.Lock()
+
 
 # internal handled exceptions
 class MFInvalidTransientBlockHeaderException(Exception):
@@ -214,6 +220,10 @@ class MFFileMgmt:
 
         self.model_relative_path = {}
 
+        # keys:fully pathed filenames, vals:data storage objects whose
+        # data has not been read from the file yet
+        self.lazy_data_dict = {}
+
         self._last_loaded_sim_path = None
         self._last_loaded_model_relative_path = {}
 
@@ -328,6 +338,15 @@ class MFFileMgmt:
         for key, item in self.model_relative_path.items():
             self._last_loaded_model_relative_path[key] = copy.deepcopy(item)
 
+    def paths_changed(self):
+        """Whether the simulation path or a model path changed since the
+        simulation was last loaded or written.  For internal FloPy use, not
+        intended for end user."""
+        return (
+            self._last_loaded_sim_path != self._sim_path
+            or self._last_loaded_model_relative_path != self.model_relative_path
+        )
+
     def get_model_path(self, key, last_loaded_path=False):
         """Returns the model working path for the model `key`.
 
@@ -374,6 +393,34 @@ class MFFileMgmt:
             new_file_path = MFFilePath(file_path, model_name)
             self.existing_file_dict[file_path] = new_file_path
 
+    def add_lazy_data(self, file_path, storage):
+        """Add a data storage object whose data will be read from file_path
+        when it is first accessed.  For internal FloPy use, not intended for
+        end user."""
+        file_path = os.path.abspath(file_path)
+        with _lazy_data_lock:
+            self.lazy_data_dict.setdefault(file_path, []).append(storage)
+
+    def remove_lazy_data(self, file_path, storage):
+        """Remove a data storage object whose data have been read from
+        file_path.  For internal FloPy use, not intended for end user."""
+        file_path = os.path.abspath(file_path)
+        with _lazy_data_lock:
+            storages = self.lazy_data_dict.get(file_path, [])
+            storages[:] = [item for item in storages if item is not storage]
+            if not storages:
+                self.lazy_data_dict.pop(file_path, None)
+
+    def load_lazy_data(self, file_path):
+        """Read any data that has not been read from file_path yet, for
+        example before the file is overwritten.  For internal FloPy use, not
+        intended for end user."""
+        file_path = os.path.abspath(file_path)
+        with _lazy_data_lock:
+            storages = self.lazy_data_dict.pop(file_path, [])
+        for storage in storages:
+            storage.load_lazy_data()
+
     def set_sim_path(self, path: Union[str, os.PathLike], internal_use=False):
         """
         Set the file path to the simulation files.  Internal use only,
@@ -670,6 +717,31 @@ class PackageContainer:
             load_only_dict[item.lower()] = True
         return load_only_dict
 
+    @staticmethod
+    def _write_required(package, only_modified):
+        # unmodified packages only need to be written if their file is missing
+        return (
+            not only_modified
+            or package.modified
+            or not os.path.isfile(package.get_file_path())
+        )
+
+    @staticmethod
+    def _write_packages(packages, ext_file_action, n_workers=1):
+        if n_workers > 1 and len(packages) > 1:
+            # package files are independent of each other, write them
+            # concurrently
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = [
+                    executor.submit(package.write, ext_file_action=ext_file_action)
+                    for package in packages
+                ]
+            for future in futures:
+                future.result()
+        else:
+            for package in packages:
+                package.write(ext_file_action=ext_file_action)
+
     @staticmethod
     def _in_pkg_list(pkg_list, pkg_type, pkg_name):
         if pkg_type is not None:
@@ -1,7 +1,9 @@
 import inspect
 import os
 import sys
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 
 import numpy as np
@@ -31,6 +33,10 @@ from .mfpackage import MFPackage
 from .utils.mfenums import DiscretizationType
 from .utils.output_util import MF6Output
 
+# child packages loaded by a package that is read in a worker thread are
+# collected here and registered with the model afterwards
+_load_state = threading.local()
+
 
 class MFModel(ModelInterface):
     """
@@ -818,7 +824,7 @@ class MFModel(ModelInterface):
         """Verbose setting for model operations (True/False)"""
         self._verbose = verbose
 
-    def check(self, f=None, verbose=True, level=1):
+    def check(self, f=None, verbose=True, level=1, n_workers=1):
         """
         Check model data for common errors.
 
@@ -841,6 +847,10 @@ class MFModel(ModelInterface):
         level : int
             Check method analysis level. If level=0, summary checks are
             performed. If level=1, full checks are performed.
+        n_workers : int
+            number of threads used to check packages concurrently, the
+            results are summarized in package order. default is 1, which
+            checks the packages one at a time.
 
         Returns
         -------
@@ -857,7 +867,7 @@ class MFModel(ModelInterface):
         # check instance for model-level check
         chk = mf6check(self, f=f, verbose=verbose, level=level)
 
-        return self._check(chk, level)
+        return self._check(chk, level, n_workers)
 
     @staticmethod
     def load_base(
@@ -872,6 +882,7 @@ class MFModel(ModelInterface):
         strict=True,
         model_rel_path=os.curdir,
         load_only=None,
+        n_workers=1,
     ):
         """
         Class method that loads an existing model.
@@ -903,6 +914,11 @@ class MFModel(ModelInterface):
             setting. subpackages, like time series and observations, will also
             load regardless of this setting.
             example list: ['ic', 'maw', 'npf', 'oc', 'my_well_package_1']
+        n_workers : int
+            number of threads used to read package files concurrently. the
+            discretization package is loaded first, the other packages are
+            read concurrently and registered with the model in name file
+            order. default is 1, which loads the packages one at a time.
 
         Returns
         -------
@@ -952,6 +968,7 @@ class MFModel(ModelInterface):
         # load packages
         sim_struct = mfstructure.MFStructure().sim_struct
         instance._ftype_num_dict = {}
+        concurrent_packages = []
         for ftype, fname, pname in packages_ordered:
             ftype_orig = ftype
             ftype = ftype[0:-1].lower()
@@ -983,6 +1000,10 @@ class MFModel(ModelInterface):
                     >= VerbosityLevel.normal.value
                 ):
                     print(f"    loading package {ftype}...")
+                if n_workers > 1 and ftype_orig not in priority_packages:
+                    # read after the discretization package is loaded
+                    concurrent_packages.append((ftype, fname, pname))
+                    continue
                 # load package
                 instance.load_package(ftype, fname, pname, strict, None)
                 sim_data = simulation.simulation_data
@@ -993,6 +1014,8 @@ class MFModel(ModelInterface):
                         sim_data.max_columns_of_data = dis.ncol.get_data()
                         sim_data.max_columns_user_set = False
                         sim_data.max_columns_auto_set = True
+        if concurrent_packages:
+            instance._load_packages(concurrent_packages, strict, n_workers)
         # load referenced packages
         if modelname in instance.simulation_data.referenced_files:
             for ref_file in instance.simulation_data.referenced_files[
@@ -1296,7 +1319,12 @@ class MFModel(ModelInterface):
         else:
             return f",{data_entry}\n"
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        only_modified=False,
+        n_workers=1,
+    ):
         """
         Writes out model's package files.
 
@@ -1306,17 +1334,23 @@ class MFModel(ModelInterface):
             Defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        only_modified : bool
+            Only write packages that changed since they were last loaded or
+            written, or whose files do not exist.
+        n_workers : int
+            Number of threads used to write package files concurrently.
 
         """
-
-        # write name file
-        if (
+        verbose = (
             self.simulation_data.verbosity_level.value
             >= VerbosityLevel.normal.value
-        ):
-            print("    writing model name file...")
+        )
 
-        self.name_file.write(ext_file_action=ext_file_action)
+        # write name file
+        if PackageContainer._write_required(self.name_file, only_modified):
+            if verbose:
+                print("    writing model name file...")
+            self.name_file.write(ext_file_action=ext_file_action)
 
         if not self.simulation_data.max_columns_user_set:
             grid_type = self.get_grid_type()
@@ -1326,13 +1360,13 @@ class MFModel(ModelInterface):
                 self.simulation_data.max_columns_auto_set = True
 
         # write packages
+        packages = []
         for pp in self.packagelist:
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"    writing package {pp._get_pname()}...")
-            pp.write(ext_file_action=ext_file_action)
+            if PackageContainer._write_required(pp, only_modified):
+                if verbose:
+                    print(f"    writing package {pp._get_pname()}...")
+                packages.append(pp)
+        PackageContainer._write_packages(packages, ext_file_action, n_workers)
 
     def get_grid_type(self):
         """
@@ -2078,6 +2112,40 @@ class MFModel(ModelInterface):
         """
         if ref_path is not None:
             fname = os.path.join(ref_path, fname)
+        dict_package_name = self._get_load_package_name(
+            ftype, pname, dict_package_name, parent_package
+        )
+
+        # create package
+        package = self._create_load_package(
+            ftype, fname, dict_package_name, parent_package
+        )
+        try:
+            package.load(strict)
+        except ReadAsArraysException:
+            #  create ReadAsArrays package and load it instead
+            package = self._create_load_package(
+                f"{ftype}a", fname, dict_package_name, parent_package
+            )
+            package.load(strict)
+
+        # register child package with the model
+        children = getattr(_load_state, "children", None)
+        if children is not None:
+            # package is loaded in a worker thread, registered by
+            # _load_packages
+            children.append(package)
+        else:
+            self._package_container.add_package(package)
+        if parent_package is not None:
+            # register child package with the parent package
+            parent_package.add_package(package)
+
+        return package
+
+    def _get_load_package_name(
+        self, ftype, pname, dict_package_name=None, parent_package=None
+    ):
         sim_struct = mfstructure.MFStructure().sim_struct
         if (
             ftype in self.structure.package_struct_objs
@@ -2114,46 +2182,80 @@ class MFModel(ModelInterface):
                     )
         else:
             dict_package_name = ftype
+        return dict_package_name
 
+    def _create_load_package(self, ftype, fname, pname, parent_package):
         # clean up model type text
         model_type = self.structure.model_type
         while datautil.DatumUtil.is_int(model_type[-1]):
             model_type = model_type[0:-1]
 
-        # create package
         package_obj = PackageContainer.package_factory(ftype, model_type)
-        package = package_obj(
+        return package_obj(
             self,
             filename=fname,
-            pname=dict_package_name,
+            pname=pname,
             loading_package=True,
             parent_file=parent_package,
             _internal_package=True,
         )
-        try:
-            package.load(strict)
-        except ReadAsArraysException:
-            #  create ReadAsArrays package and load it instead
-            package_obj = PackageContainer.package_factory(
-                f"{ftype}a", model_type
-            )
-            package = package_obj(
-                self,
-                filename=fname,
-                pname=dict_package_name,
-                loading_package=True,
-                parent_file=parent_package,
-                _internal_package=True,
-            )
-            package.load(strict)
 
-        # register child package with the model
-        self._package_container.add_package(package)
-        if parent_package is not None:
-            # register child package with the parent package
-            parent_package.add_package(package)
+    def _load_packages(self, packages, strict, n_workers):
+        """
+        Loads packages with their package files read concurrently.  This
+        method is used internally by FloPy and is not intended for the end
+        user.
 
-        return package
+        Parameters
+        ----------
+        packages : list
+            list of (file type, file name, package name) tuples
+        strict : bool
+            strict mode when loading the files
+        n_workers : int
+            number of threads reading package files
+
+        """
+        # package objects are created and named in order, so package names
+        # and paths do not depend on which file is read first
+        loads = []
+        for ftype, fname, pname in packages:
+            dict_package_name = self._get_load_package_name(ftype, pname)
+            package = self._create_load_package(
+                ftype, fname, dict_package_name, None
+            )
+            loads.append((ftype, fname, dict_package_name, package))
+
+        def read(package):
+            _load_state.children = []
+            try:
+                package.load(strict)
+                read_as_arrays = False
+            except ReadAsArraysException:
+                read_as_arrays = True
+            finally:
+                children = _load_state.children
+                del _load_state.children
+            return read_as_arrays, children
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(read, [load[-1] for load in loads]))
+
+        # register packages in order, child packages first as when the
+        # packages are loaded one at a time
+        for (ftype, fname, pname, package), (read_as_arrays, children) in zip(
+            loads, results
+        ):
+            if read_as_arrays:
+                #  create ReadAsArrays package and load it instead
+                package = self._create_load_package(
+                    f"{ftype}a", fname, pname, None
+                )
+                package.load(strict)
+                children = []
+            for child in children:
+                self._package_container.add_package(child)
+            self._package_container.add_package(package)
 
     def plot(self, SelPackList=None, **kwargs):
         """
@@ -1366,17 +1366,16 @@ class MFBlock:
                 or (lst_data and dataset.structure.type == DatumType.recarray)
                 and dataset.enabled
             ):
-                if not binary or (
+                # only basic stress package lists without boundnames can be
+                # binary, a list stored as text leaves the other data binary
+                binary_data = binary and not (
                     lst_data
                     and (
                         dataset.data_dimensions.package_dim.boundnames()
                         or not dataset.structure.basic_item
                     )
-                ):
-                    ext = "txt"
-                    binary = False
-                else:
-                    ext = "bin"
+                )
+                ext = "bin" if binary_data else "txt"
                 file_path = f"{base_name}_{dataset.structure.name}.{ext}"
                 replace_existing_external = False
                 if external_data_folder is not None:
@@ -1402,7 +1401,7 @@ class MFBlock:
                     file_path,
                     replace_existing_external=replace_existing_external,
                     check_data=check_data,
-                    binary=binary,
+                    binary=binary_data,
                 )
 
     def set_all_data_internal(self, check_data=True):
@@ -1716,6 +1715,9 @@ class MFPackage(PackageInterface):
         Describes the blocks and data contain in this package
     dimensions : PackageDimension
         Resolves data dimensions for data within this package
+    modified : bool
+        Whether the package or its data changed since the package was last
+        loaded or written
 
     """
 
@@ -1745,6 +1747,8 @@ class MFPackage(PackageInterface):
             self.internal_package = False
         self._data_list = []
         self._package_type = package_type
+        # new packages have not been written
+        self._modified = True
         if self.model_or_sim.type == "Model" and package_type.lower() != "nam":
             self.model_name = self.model_or_sim.name
         else:
@@ -1962,6 +1966,26 @@ class MFPackage(PackageInterface):
             if self._package_type != "nam":
                 self.model_or_sim.update_package_filename(self, fname)
         self._filename = fname
+        self._modified = True
+
+    @property
+    def modified(self):
+        """Whether the package or any of its data changed since the package
+        was last loaded or written."""
+        if self._modified:
+            return True
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if dataset.modified:
+                    return True
+        return False
+
+    @modified.setter
+    def modified(self, modified):
+        self._modified = modified
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                dataset.modified = modified
 
     @property
     def package_type(self):
@@ -2939,6 +2963,8 @@ class MFPackage(PackageInterface):
             raise ReadAsArraysException(err)
         # close file
         fd_input_file.close()
+        # package matches its file
+        self.modified = False
 
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
@@ -3169,6 +3195,9 @@ class MFPackage(PackageInterface):
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
 
+        # read any data not loaded yet before the file is overwritten
+        self.simulation_data.mfpath.load_lazy_data(package_file_path)
+
         # open file
         fd = open(package_file_path, "w")
 
@@ -3189,6 +3218,7 @@ class MFPackage(PackageInterface):
         self._write_blocks(fd, ext_file_action)
 
         fd.close()
+        self.modified = False
 
     def create_package_dimensions(self):
         """Creates a package dimensions object.  For internal FloPy library
@@ -107,7 +107,9 @@ class SimulationDict(dict):
 
         """
         key_path_size = len(key_path)
-        for key, item in self.items():
+        # iterate over a copy, data may be added by packages that are
+        # loaded concurrently
+        for key, item in list(self.items()):
             if key[:key_path_size] == key_path:
                 if key[-1] == key_leaf:
                     # found key_leaf as a key in the dictionary
@@ -439,10 +441,12 @@ class MFSimulationBase:
         When true flopy writes a header to each package file indicating that
         it was created by flopy.
     lazy_io: bool
-        When true flopy only reads external data when the data is requested
-        and only writes external data if the data has changed.  This option
-        automatically overrides the verify_data and auto_set_sizes, turning
-        both off.
+        When true flopy only reads array and stress period data when the
+        data is requested, including data stored internally in package
+        files, and only writes external data if the data has changed.  List
+        data stored internally are only read when requested with use_pandas
+        turned on.  This option automatically overrides the verify_data and
+        auto_set_sizes, turning both off.
     use_pandas: bool
         Load/save data using pandas dataframes (for supported data)
     Examples
@@ -771,6 +775,7 @@ class MFSimulationBase:
         write_headers=True,
         lazy_io=False,
         use_pandas=True,
+        n_workers=1,
     ):
         """
         Load an existing model. Do not call this method directly.  Should only
@@ -810,12 +815,19 @@ class MFSimulationBase:
             When true flopy writes a header to each package file indicating
             that it was created by flopy
         lazy_io: bool
-            When true flopy only reads external data when the data is requested
-            and only writes external data if the data has changed.  This option
-            automatically overrides the verify_data and auto_set_sizes, turning
-            both off.
+            When true flopy only reads array and stress period data when the
+            data is requested, including data stored internally in package
+            files, and only writes external data if the data has changed.
+            List data stored internally are only read when requested with
+            use_pandas turned on.  This option automatically overrides the
+            verify_data and auto_set_sizes, turning both off.
         use_pandas: bool
             Load/save data using pandas dataframes (for supported data)
+        n_workers : int
+            Number of threads used to read the package files of each model
+            concurrently. Packages are registered in name file order
+            regardless of the number of workers. Default is 1, which loads
+            the packages one at a time.
 
         Returns
         -------
@@ -904,6 +916,7 @@ class MFSimulationBase:
                 strict,
                 path,
                 load_only,
+                n_workers,
             )
 
         # load exchange packages and dependent packages
@@ -1049,6 +1062,8 @@ class MFSimulationBase:
                     )
                 sln_package.load(strict)
 
+        # registering the loaded packages does not change the name file
+        instance.name_file.modified = False
         instance.simulation_data.mfpath.set_last_accessed_path()
         if verify_data:
             instance.check()
@@ -1655,7 +1670,11 @@ class MFSimulationBase:
             package.set_all_data_internal(check_data)
 
     def write_simulation(
-        self, ext_file_action=ExtFileAction.copy_relative_paths, silent=False
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        silent=False,
+        only_modified=False,
+        n_workers=1,
     ):
         """
         Write the simulation to files.
@@ -1668,6 +1687,15 @@ class MFSimulationBase:
                 by absolute paths fixed.
             silent : bool
                 Writes out the simulation in silent mode (verbosity_level = 0)
+            only_modified : bool
+                Only write packages that changed since they were last loaded
+                or written, or whose files do not exist.  Changes made in
+                place to data returned by get_data are not detected, use
+                set_data instead.  All packages are written if the simulation
+                or a model path changed.
+            n_workers : int
+                Number of threads used to write package files concurrently.
+                Defaults to 1, which writes the files one at a time.
 
         """
         sim_data = self.simulation_data
@@ -1683,76 +1711,87 @@ class MFSimulationBase:
         saved_verb_lvl = self.simulation_data.verbosity_level
         if silent:
             self.simulation_data.verbosity_level = VerbosityLevel.quiet
-
-        # write simulation name file
-        if (
+        verbose = (
             self.simulation_data.verbosity_level.value
             >= VerbosityLevel.normal.value
-        ):
+        )
+        if self.simulation_data.mfpath.paths_changed():
+            only_modified = False
+
+        if verbose:
             print("writing simulation...")
-            print("  writing simulation name file...")
-        self.name_file.write(ext_file_action=ext_file_action)
+        packages = []
+
+        # write simulation name file
+        if PackageContainer._write_required(self.name_file, only_modified):
+            if verbose:
+                print("  writing simulation name file...")
+            packages.append(self.name_file)
 
         # write TDIS file
-        if (
-            self.simulation_data.verbosity_level.value
-            >= VerbosityLevel.normal.value
-        ):
-            print("  writing simulation tdis package...")
-        self._tdis_file.write(ext_file_action=ext_file_action)
+        if PackageContainer._write_required(self._tdis_file, only_modified):
+            if verbose:
+                print("  writing simulation tdis package...")
+            packages.append(self._tdis_file)
 
         # write solution files
         for solution_file in self._solution_files.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(
-                    f"  writing solution package "
-                    f"{solution_file._get_pname()}..."
-                )
-            solution_file.write(ext_file_action=ext_file_action)
+            if PackageContainer._write_required(solution_file, only_modified):
+                if verbose:
+                    print(
+                        f"  writing solution package "
+                        f"{solution_file._get_pname()}..."
+                    )
+                packages.append(solution_file)
 
         # write exchange files
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            if PackageContainer._write_required(exchange_file, only_modified):
+                packages.append(exchange_file)
 
         # write other packages
         for pp in self._other_files.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"  writing package {pp._get_pname()}...")
-            pp.write(ext_file_action=ext_file_action)
+            if PackageContainer._write_required(pp, only_modified):
+                if verbose:
+                    print(f"  writing package {pp._get_pname()}...")
+                packages.append(pp)
+
+        PackageContainer._write_packages(packages, ext_file_action, n_workers)
 
         # FIX: model working folder should be model name file folder
 
         # write models
         for model in self._models.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
+            if verbose:
                 print(f"  writing model {model.name}...")
-            model.write(ext_file_action=ext_file_action)
+            model.write(
+                ext_file_action=ext_file_action,
+                only_modified=only_modified,
+                n_workers=n_workers,
+            )
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
         if silent:
             self.simulation_data.verbosity_level = saved_verb_lvl
 
-    def set_sim_path(self, path: Union[str, os.PathLike]):
-        """Return a list of output data keys.
+    def set_sim_path(self, path: Union[str, os.PathLike], keep_external=False):
+        """Set the simulation path.
 
         Parameters
         ----------
         path : str
             Relative or absolute path to simulation root folder.
+        keep_external : bool
+            Keep array and list data stored in external files with relative
+            paths external.  The files are copied to the new simulation path
+            as they are, without reading and rewriting their data.  By
+            default all data are stored internally.
 
         """
-        # set all data internal
-        self.set_all_data_internal()
+        if not keep_external:
+            # set all data internal
+            self.set_all_data_internal()
 
         # set simulation path
         self.simulation_data.mfpath.set_sim_path(path, True)
@@ -1761,6 +1800,10 @@ class MFSimulationBase:
             # create new simulation folder
             os.makedirs(path)
 
+        if keep_external:
+            # copy external files to the new path without parsing them
+            self.simulation_data.mfpath.copy_files()
+
     def run_simulation(
         self,
         silent=None,
@@ -150,6 +150,7 @@ class ModflowGwe(MFModel):
         strict=True,
         model_rel_path=curdir,
         load_only=None,
+        n_workers=1,
     ):
         return MFModel.load_base(
             cls,
@@ -163,4 +164,5 @@ class ModflowGwe(MFModel):
             strict,
             model_rel_path,
             load_only,
+            n_workers,
         )
@@ -179,6 +179,7 @@ class ModflowGwf(MFModel):
         strict=True,
         model_rel_path=curdir,
         load_only=None,
+        n_workers=1,
     ):
         return MFModel.load_base(
             cls,
@@ -192,4 +193,5 @@ class ModflowGwf(MFModel):
             strict,
             model_rel_path,
             load_only,
+            n_workers,
         )
@@ -129,6 +129,7 @@ class ModflowPrt(MFModel):
         strict=True,
         model_rel_path=curdir,
         load_only=None,
+        n_workers=1,
     ):
         return MFModel.load_base(
             cls,
@@ -142,4 +143,5 @@ class ModflowPrt(MFModel):
             strict,
             model_rel_path,
             load_only,
+            n_workers,
         )
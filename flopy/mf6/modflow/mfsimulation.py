@@ -62,6 +62,7 @@ class MFSimulation(MFSimulationBase):
         exe_name : str or PathLike, sim_ws : str or PathLike, strict : bool,
         verbosity_level : int, load_only : list, verify_data : bool,
         write_headers : bool, lazy_io : bool, use_pandas : bool,
+        n_workers : int,
         ) : MFSimulation
         a class method that loads a simulation from files
     """
@@ -188,6 +189,7 @@ class MFSimulation(MFSimulationBase):
         write_headers=True,
         lazy_io=False,
         use_pandas=True,
+        n_workers=1,
     ):
         return MFSimulationBase.load(
             cls,
@@ -202,4 +204,5 @@ class MFSimulation(MFSimulationBase):
             write_headers,
             lazy_io,
             use_pandas,
+            n_workers,
         )
@@ -6,6 +6,7 @@ mf module.  Contains the ModflowGlobal, ModflowList, and Modflow classes.
 
 import os
 import warnings
+from functools import partial
 from inspect import getfullargspec
 from pathlib import Path
 from typing import Optional, Union
@@ -636,6 +637,7 @@ class Modflow(BaseModel):
         forgive=False,
         check=True,
         extra_pkgs: Optional[dict] = None,
+        n_workers=1,
     ):
         """
         Load an existing MODFLOW model.
@@ -668,7 +670,11 @@ class Modflow(BaseModel):
         extra_pkgs : dict, optional
             Add custom packages classes to mfnam_packages. Allows for loading models
             with custom packages not contained in the standard flopy distribution.
-
+        n_workers : int, optional
+            Number of threads used to read package files concurrently. DIS and
+            BAS6 are loaded first, the other packages are read concurrently
+            and added to the model in name file order. Default is 1, which
+            loads the packages one at a time.
 
         Returns
         -------
@@ -820,24 +826,34 @@ class Modflow(BaseModel):
             ml.mfpar.set_mult(ml, ext_unit_dict)
             assert ml.pop_key_list.pop() == ext_pkg_d.get("MULT")
 
+        def load_package(item):
+            if "check" in getfullargspec(item.package.load)[0]:
+                return item.package.load(
+                    item.filehandle, ml, ext_unit_dict=ext_unit_dict, check=False
+                )
+            return item.package.load(item.filehandle, ml, ext_unit_dict=ext_unit_dict)
+
+        # read package files concurrently, packages are added to the model in
+        # the loop below
+        loaded = {}
+        if n_workers > 1:
+            packages = {
+                key: partial(load_package, item)
+                for key, item in ext_unit_dict.items()
+                if item.package is not None and item.filetype in load_only
+            }
+            loaded = ml._read_packages(
+                packages, ext_unit_dict, n_workers, first=[bas_key]
+            )
+
         # try loading packages in ext_unit_dict
         for key, item in ext_unit_dict.items():
             if item.package is not None:
                 if item.filetype in load_only:
-                    package_load_args = getfullargspec(item.package.load)[0]
+                    load = loaded.get(key, partial(load_package, item))
                     if forgive:
                         try:
-                            if "check" in package_load_args:
-                                item.package.load(
-                                    item.filehandle,
-                                    ml,
-                                    ext_unit_dict=ext_unit_dict,
-                                    check=False,
-                                )
-                            else:
-                                item.package.load(
-                                    item.filehandle, ml, ext_unit_dict=ext_unit_dict
-                                )
+                            load()
                             files_successfully_loaded.append(item.filename)
                             if ml.verbose:
                                 print(f"   {item.filetype:4s} package load...success")
@@ -848,17 +864,7 @@ class Modflow(BaseModel):
                                 print(f"   {e!s}")
                             files_not_loaded.append(item.filename)
                     else:
-                        if "check" in package_load_args:
-                            item.package.load(
-                                item.filehandle,
-                                ml,
-                                ext_unit_dict=ext_unit_dict,
-                                check=False,
-                            )
-                        else:
-                            item.package.load(
-                                item.filehandle, ml, ext_unit_dict=ext_unit_dict
-                            )
+                        load()
                         files_successfully_loaded.append(item.filename)
                         if ml.verbose:
                             print(f"   {item.filetype:4s} package load...success")
@@ -189,12 +189,12 @@ class ModflowBas(Package):
         """
         chk = self._get_check(f, verbose, level, checktype)
 
-        neighbors = chk.get_neighbors(self.ibound.array)
-        if isinstance(neighbors, np.ndarray):
-            neighbors[np.isnan(neighbors)] = 0  # set neighbors at edges to 0 (inactive)
+        active = self.ibound.array > 0
+        has_neighbor = chk.has_neighbor(active)
+        if has_neighbor is not None:
             chk.values(
                 self.ibound.array,
-                (self.ibound.array > 0) & np.all(neighbors < 1, axis=0),
+                active & ~has_neighbor,
                 "isolated cells in ibound array",
                 "Warning",
             )
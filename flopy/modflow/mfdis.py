@@ -509,15 +509,9 @@ class ModflowDis(Package):
 
         """
         mg = self.parent.modelgrid
-        if np.isscalar(x):
-            r, c = mg.intersect(x, y, local=local)
-        else:
-            r = []
-            c = []
-            for xx, yy in zip(x, y):
-                rr, cc = mg.intersect(xx, yy, local=local)
-                r.append(rr)
-                c.append(cc)
+        r, c = mg.intersect(x, y, local=local)
+        if not np.isscalar(x):
+            r, c = list(r), list(c)
         return r, c
 
     def get_lrc(self, nodes):
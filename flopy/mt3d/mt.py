@@ -1,4 +1,5 @@
 import os
+from functools import partial
 
 import numpy as np
 
@@ -420,6 +421,7 @@ class Mt3dms(BaseModel):
         load_only=None,
         forgive=False,
         modflowmodel=None,
+        n_workers=1,
     ):
         """
         Load an existing model.
@@ -445,6 +447,11 @@ class Mt3dms(BaseModel):
         modflowmodel : flopy.modflow.mf.Modflow, optional
             This is a flopy Modflow model object upon which this Mt3dms
             model is based.
+        n_workers : int, default 1
+            Number of threads used to read package files concurrently. BTN
+            is loaded first, the other packages are read concurrently and
+            added to the model in name file order. The default loads the
+            packages one at a time.
 
         Returns
         -------
@@ -577,15 +584,28 @@ class Mt3dms(BaseModel):
                     "in the ext_unit_dict: " + ",".join(not_found)
                 )
 
+        def load_package(item):
+            return item.package.load(item.filehandle, mt, ext_unit_dict=ext_unit_dict)
+
+        # read package files concurrently, packages are added to the model in
+        # the loop below
+        loaded = {}
+        if n_workers > 1:
+            packages = {
+                key: partial(load_package, item)
+                for key, item in ext_unit_dict.items()
+                if item.package is not None and item.filetype in load_only
+            }
+            loaded = mt._read_packages(packages, ext_unit_dict, n_workers)
+
         # try loading packages in ext_unit_dict
         for key, item in ext_unit_dict.items():
             if item.package is not None:
                 if item.filetype in load_only:
+                    load = loaded.get(key, partial(load_package, item))
                     if forgive:
                         try:
-                            pck = item.package.load(
-                                item.filehandle, mt, ext_unit_dict=ext_unit_dict
-                            )
+                            pck = load()
                             files_successfully_loaded.append(item.filename)
                             if mt.verbose:
                                 print(f"   {pck.name[0]:4s} package load...success")
@@ -597,9 +617,7 @@ class Mt3dms(BaseModel):
                                 )
                             files_not_loaded.append(item.filename)
                     else:
-                        pck = item.package.load(
-                            item.filehandle, mt, ext_unit_dict=ext_unit_dict
-                        )
+                        pck = load()
                         files_successfully_loaded.append(item.filename)
                         if mt.verbose:
                             print(f"   {pck.name[0]:4s} package load...success")
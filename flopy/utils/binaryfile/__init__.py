@@ -9,9 +9,12 @@ important classes that can be accessed by the user.
 
 """
 
+import hashlib
 import os
 import tempfile
 import warnings
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
 from shutil import move
 from typing import Optional, Union
@@ -23,6 +26,7 @@ from flopy.discretization.modeltime import ModelTime
 
 from ..datafile import Header, LayerFile
 from ..gridutil import get_lni
+from ..utl_import import import_optional_dependency
 
 
 class BinaryHeader(Header):
@@ -296,6 +300,178 @@ def get_headfile_precision(filename: Union[str, os.PathLike]):
     return result
 
 
+# version of the sidecar index layout, bump when the stored arrays change
+_INDEX_CACHE_VERSION = 1
+
+
+def _index_cache_path(filename: Path) -> Path:
+    """
+    Path of the sidecar index file for a binary output file.
+    """
+    return filename.with_name(f"{filename.name}.flopyidx")
+
+
+def _index_cache_signature(filename: Path, header_ranges) -> str:
+    """
+    Hash the raw bytes of the given (start, end) byte ranges of a file,
+    normally the first and last record headers.
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for start, end in header_ranges:
+            f.seek(int(start), 0)
+            digest.update(f.read(int(end - start)))
+    return digest.hexdigest()
+
+
+def _read_index_cache(filename: Path, kind: str) -> Optional[dict]:
+    """
+    Read the sidecar index of a binary output file.
+
+    Parameters
+    ----------
+    filename : Path
+        Path of the binary output file (not the sidecar).
+    kind : str
+        Identifies the reader class and options that built the index.
+
+    Returns
+    -------
+    index : dict or None
+        Arrays stored in the sidecar, or None if there is no sidecar or
+        if it does not match the current size, modification time and
+        first and last headers of the file.
+
+    """
+    path = _index_cache_path(filename)
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            index = {key: npz[key] for key in npz.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+    try:
+        stat = filename.stat()
+        if (
+            index["version"].item() != _INDEX_CACHE_VERSION
+            or index["kind"].item() != kind
+            or index["size"].item() != stat.st_size
+            or index["mtime"].item() != stat.st_mtime_ns
+        ):
+            return None
+        signature = _index_cache_signature(filename, index["header_ranges"])
+    except (KeyError, OSError):
+        return None
+    if index["signature"].item() != signature:
+        return None
+    return index
+
+
+def _write_index_cache(filename: Path, kind: str, header_ranges, **arrays):
+    """
+    Write the sidecar index of a binary output file. A warning is issued
+    if the sidecar cannot be written, e.g. in a read-only directory.
+
+    Parameters
+    ----------
+    filename : Path
+        Path of the binary output file (not the sidecar).
+    kind : str
+        Identifies the reader class and options that built the index.
+    header_ranges : array_like
+        (start, end) byte ranges of the first and last headers.
+    **arrays : dict
+        Index arrays to store.
+
+    """
+    header_ranges = np.asarray(header_ranges, dtype=np.int64)
+    path = _index_cache_path(filename)
+    try:
+        stat = filename.stat()
+        signature = _index_cache_signature(filename, header_ranges)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                version=_INDEX_CACHE_VERSION,
+                kind=kind,
+                size=stat.st_size,
+                mtime=stat.st_mtime_ns,
+                header_ranges=header_ranges,
+                signature=signature,
+                **arrays,
+            )
+    except OSError as e:
+        warnings.warn(f"could not write index file {path}: {e}")
+
+
+class _BinaryLayerArray:
+    """
+    Read-only array-like view of the records in a binary layer file,
+    with shape (ntimes, nlay, nrow, ncol). Indexing reads only the records
+    needed, straight from their byte positions in a memory map, so this can
+    back lazy (e.g. dask) arrays. Missing layers are filled with nan.
+
+    Parameters
+    ----------
+    filename : Path
+        Path of the binary layer file.
+    dtype : numpy.dtype
+        Floating point type of the data.
+    shape : tuple of ints
+        (ntimes, nlay, nrow, ncol)
+    ipos : numpy.ndarray
+        Integer array of shape (ntimes, nlay) with the byte position of the
+        data of each record, or -1 if the record is not in the file.
+    nodata : float, optional
+        Values equal to nodata are set to nan.
+
+    """
+
+    def __init__(self, filename, dtype, shape, ipos, nodata=None):
+        self.filename = filename
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(int(n) for n in shape)
+        self.ndim = len(self.shape)
+        self.ipos = ipos
+        self.nodata = nodata
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[...], dtype=dtype)
+
+    def __getitem__(self, key):
+        key = np.index_exp[key]
+        if any(k is Ellipsis for k in key):
+            i = next(i for i, k in enumerate(key) if k is Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:i] + fill + key[i + 1 :]
+        key = key + (slice(None),) * (self.ndim - len(key))
+        index = [np.arange(n)[k] for n, k in zip(self.shape, key)]
+        squeeze = tuple(i for i, idx in enumerate(index) if np.ndim(idx) == 0)
+        itimes, ilays, rows, cols = (np.atleast_1d(idx) for idx in index)
+
+        nrow, ncol = self.shape[2:]
+        nbytes = nrow * ncol * self.dtype.itemsize
+        out = np.full(
+            (len(itimes), len(ilays), len(rows), len(cols)), np.nan, dtype=self.dtype
+        )
+        ipos = self.ipos[np.ix_(itimes, ilays)]
+        if np.any(ipos >= 0):
+            mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+            for it, il in zip(*np.asarray(ipos >= 0).nonzero()):
+                start = ipos[it, il]
+                layer = mm[start : start + nbytes].view(self.dtype)
+                layer = layer.reshape(nrow, ncol)
+                out[it, il] = layer[np.ix_(rows, cols)]
+            del mm
+        if self.nodata is not None:
+            out[out == self.nodata] = np.nan
+        return out.squeeze(axis=squeeze) if squeeze else out
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is a parent class from which concrete
@@ -308,9 +484,14 @@ class BinaryLayerFile(LayerFile):
     headers, which are record arrays of the modflow header information
     (kstp, kper, pertim, totim, text, nrow, ncol, ilay), and long ints
     pointing to the 1st byte of data for the corresponding data arrays.
+
+    If the ``cache_index`` keyword argument is True, the index is saved to
+    a ``<filename>.flopyidx`` sidecar file and reloaded instead of being
+    rebuilt as long as the binary file is unchanged.
     """
 
     def __init__(self, filename: Union[str, os.PathLike], precision, verbose, **kwargs):
+        self.cache_index = kwargs.pop("cache_index", False)
         super().__init__(filename, precision, verbose, **kwargs)
 
     def _build_index(self):
@@ -337,6 +518,74 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
+        if not (self.cache_index and self._load_index_cache()):
+            if not self._build_index_strided(header):
+                self._build_index_scan()
+            if self.cache_index:
+                self._save_index_cache()
+        self.file.seek(0, 0)
+
+        self.nlay = np.max(self.recordarray["ilay"])
+
+        # provide headers as a pandas frame
+        self.headers = pd.DataFrame(self.recordarray, index=self.iposarray)
+        self.headers["text"] = (
+            self.headers["text"].str.decode("ascii", "strict").str.strip()
+        )
+
+    def _index_cache_kind(self):
+        text = self.text.decode().strip().upper()
+        return f"{type(self).__name__}:{self.precision}:{text}"
+
+    def _load_index_cache(self):
+        """
+        Set the index from the sidecar index file.
+
+        Returns
+        -------
+        success : bool
+            False if the sidecar is missing or stale.
+
+        """
+        index = _read_index_cache(self.filename, self._index_cache_kind())
+        if index is None or index["recordarray"].dtype != self.header_dtype:
+            return False
+        self.recordarray = index["recordarray"]
+        self.iposarray = index["iposarray"]
+        self.times = list(index["times"])
+        kstpkper = index["kstpkper"]
+        self.kstpkper = list(zip(kstpkper[:, 0], kstpkper[:, 1]))
+        return True
+
+    def _save_index_cache(self):
+        """
+        Save the index to the sidecar index file.
+
+        """
+        if len(self.iposarray) == 0:
+            return
+        hdrbytes = self.header_dtype.itemsize
+        header_ranges = [
+            (self.iposarray[0] - hdrbytes, self.iposarray[0]),
+            (self.iposarray[-1] - hdrbytes, self.iposarray[-1]),
+        ]
+        kstpkper = np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2)
+        _write_index_cache(
+            self.filename,
+            self._index_cache_kind(),
+            header_ranges,
+            recordarray=self.recordarray,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.recordarray["totim"].dtype),
+            kstpkper=kstpkper,
+        )
+
+    def _build_index_scan(self):
+        """
+        Build the recordarray and iposarray by reading each header in turn
+        and seeking past its data. This works for any file layout.
+
+        """
         ipos = 0
         while ipos < self.totalbytes:
             header = self._get_header()
@@ -360,13 +609,65 @@ class BinaryLayerFile(LayerFile):
         # self.recordarray contains a recordarray of all the headers.
         self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
         self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nlay = np.max(self.recordarray["ilay"])
 
-        # provide headers as a pandas frame
-        self.headers = pd.DataFrame(self.recordarray, index=self.iposarray)
-        self.headers["text"] = (
-            self.headers["text"].str.decode("ascii", "strict").str.strip()
+    def _build_index_strided(self, header):
+        """
+        Build the recordarray and iposarray from a memory-mapped view of the
+        file, assuming every record has the same size as the first one.
+
+        Parameters
+        ----------
+        header : numpy.void
+            The first header in the file.
+
+        Returns
+        -------
+        success : bool
+            False if records vary in size or text, in which case nothing is
+            set and the file must be indexed with :meth:`_build_index_scan`.
+
+        """
+        hdrbytes = self.header_dtype.itemsize
+        stride = hdrbytes + int(self.get_databytes(header))
+        if self.totalbytes % stride != 0:
+            return False
+        nrecords = self.totalbytes // stride
+
+        # view each record as a header followed by opaque data bytes
+        record_dtype = np.dtype(
+            {
+                "names": ["header"],
+                "formats": [self.header_dtype],
+                "offsets": [0],
+                "itemsize": stride,
+            }
+        )
+        try:
+            records = np.memmap(
+                self.filename, dtype=record_dtype, mode="r", shape=(nrecords,)
+            )
+            recordarray = np.array(records["header"])
+        except (OSError, ValueError):
+            return False
+        finally:
+            records = None
+
+        # check that the assumed layout holds for every record
+        if np.any(self.get_databytes(recordarray) + hdrbytes != stride):
+            return False
+        if not np.all(np.char.find(recordarray["text"], self.text.upper()) >= 0):
+            return False
+
+        totim = recordarray["totim"]
+        newtime = np.ones(nrecords, dtype=bool)
+        newtime[1:] = totim[1:] != totim[:-1]
+        self.times = list(totim[newtime])
+        self.kstpkper = list(
+            zip(recordarray["kstp"][newtime], recordarray["kper"][newtime])
         )
+        self.recordarray = recordarray
+        self.iposarray = np.arange(nrecords, dtype=np.int64) * stride + hdrbytes
+        return True
 
     def get_databytes(self, header):
         """
@@ -435,25 +736,264 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = header["ilay"] - 1  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = self.iposarray[irec].item()
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        nbytes = self.realtype(1).nbytes
+        cell_offsets = (kij[:, 1] * self.ncol + kij[:, 2]) * nbytes
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
+        # time row of each record, looked up once instead of per cell
+        rec_itim = self._get_record_time_indices(result[:, 0])
+        rec_ilay = self.recordarray["ilay"] - 1
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.asarray(result[:, 0] == header["totim"]).nonzero()[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
+        for k in np.unique(kij[:, 0]):
+            stations = np.asarray(kij[:, 0] == k).nonzero()[0]
+            irecs = np.asarray(rec_ilay == k).nonzero()[0]
+            irecs = irecs[rec_itim[irecs] >= 0]
+            if irecs.size == 0:
+                continue
+            offsets = self.iposarray[irecs, None] + cell_offsets[None, stations]
+            values = self._read_values_at(offsets)
+            result[rec_itim[irecs, None], stations[None, :] + 1] = values
         return result
 
+    def _get_record_positions(self):
+        """
+        Get the byte position of the data of each record by time and layer.
+
+        Returns
+        -------
+        ipos : numpy.ndarray
+            Integer array of shape (ntimes, nlay), -1 where a layer was
+            not saved for a time.
+
+        """
+        times = np.array(self.times, dtype=self.realtype)
+        rec_itim = self._get_record_time_indices(times)
+        rec_ilay = self.recordarray["ilay"] - 1
+        ipos = np.full((len(times), self.nlay), -1, dtype=np.int64)
+        found = rec_itim >= 0
+        ipos[rec_itim[found], rec_ilay[found]] = self.iposarray[found]
+        return ipos
+
+    def as_dask(self, chunks=None, nodata=None):
+        """
+        Get all of the data in the file as a lazily loaded dask array.
+        Records are only read when the chunks that contain them are
+        computed, so reductions can stream through files that are larger
+        than memory.
+
+        Parameters
+        ----------
+        chunks : int, tuple or dict, optional
+            Chunk sizes, in any form accepted by dask.array.from_array.
+            Default is one time per chunk, i.e. (1, nlay, nrow, ncol).
+        nodata : float, optional
+            Values equal to nodata are set to nan.
+
+        Returns
+        -------
+        data : dask.array.Array
+            Array of shape (ntimes, nlay, nrow, ncol).
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> hmax = hdobj.as_dask(nodata=1e30).max(axis=0).compute()
+
+        """
+        da = import_optional_dependency(
+            "dask.array", error_message="as_dask() requires dask."
+        )
+        databytes = self.nrow * self.ncol * self.realtype(1).nbytes
+        if np.any(self.get_databytes(self.recordarray) != databytes):
+            raise ValueError("lazy arrays require records of shape (nrow, ncol)")
+        shape = (len(self.times), self.nlay, self.nrow, self.ncol)
+        if chunks is None:
+            chunks = (1,) + shape[1:]
+        array = _BinaryLayerArray(
+            self.filename,
+            self.realtype,
+            shape,
+            self._get_record_positions(),
+            nodata=nodata,
+        )
+        return da.from_array(array, chunks=chunks, asarray=False, fancy=False)
+
+    def to_xarray(self, chunks=None, nodata=None):
+        """
+        Get all of the data in the file as a lazily loaded xarray
+        DataArray backed by dask (see :meth:`as_dask`).
+
+        Parameters
+        ----------
+        chunks : int, tuple or dict, optional
+            Chunk sizes, in any form accepted by dask.array.from_array.
+            Default is one time per chunk.
+        nodata : float, optional
+            Values equal to nodata are set to nan.
+
+        Returns
+        -------
+        data : xarray.DataArray
+            DataArray with dimensions (time, layer, row, column). The time
+            coordinate holds totim, with kstp and kper as zero-based
+            auxiliary coordinates. Layer, row and column are zero-based.
+
+        """
+        xr = import_optional_dependency(
+            "xarray", error_message="to_xarray() requires xarray."
+        )
+        data = self.as_dask(chunks=chunks, nodata=nodata)
+        kstpkper = np.array(self.get_kstpkper(), dtype=int).reshape(-1, 2)
+        return xr.DataArray(
+            data,
+            dims=("time", "layer", "row", "column"),
+            coords={
+                "time": np.array(self.times),
+                "kstp": ("time", kstpkper[:, 0]),
+                "kper": ("time", kstpkper[:, 1]),
+                "layer": np.arange(self.nlay),
+                "row": np.arange(self.nrow),
+                "column": np.arange(self.ncol),
+            },
+            name=self.text.decode().strip().lower(),
+            attrs={"filename": str(self.filename)},
+        )
+
+    def _iter_data(self, mflay=None, chunk_records=None):
+        """
+        Iterate over the data in the file in time order, reading records
+        sequentially in blocks of chunk_records records.
+
+        Falls back to reading one time at a time with get_data if records
+        vary in size or the records of a time are not stored together.
+
+        """
+        nbytes = self.realtype(1).nbytes
+        databytes = self.nrow * self.ncol * nbytes
+        times = np.array(self.times, dtype=self.realtype)
+        rec_itim = self._get_record_time_indices(times)
+        if (
+            np.any(self.get_databytes(self.recordarray) != databytes)
+            or np.any(rec_itim < 0)
+            or np.any(np.diff(rec_itim) < 0)
+        ):
+            yield from super()._iter_data(mflay=mflay, chunk_records=chunk_records)
+            return
+
+        rec_ilay = self.recordarray["ilay"] - 1
+        if mflay is None:
+            irecs = np.arange(len(self.recordarray))
+            shape = (self.nlay, self.nrow, self.ncol)
+        else:
+            irecs = np.asarray(rec_ilay == mflay).nonzero()[0]
+            shape = (self.nrow, self.ncol)
+        if chunk_records is None:
+            stride = databytes + self.header_dtype.itemsize
+            chunk_records = max(1, 2**26 // stride)
+
+        data = None
+        itim = -1
+        for i0 in range(0, len(irecs), chunk_records):
+            recs = irecs[i0 : i0 + chunk_records]
+            start = self.iposarray[recs[0]]
+            buffer = None
+            if mflay is None or self.nlay == 1:
+                # selected records are adjacent, so read them in one go
+                buffer = np.empty(
+                    self.iposarray[recs[-1]] + databytes - start, np.uint8
+                )
+                self.file.seek(start, 0)
+                if self.file.readinto(buffer) < buffer.size:
+                    raise EOFError
+            for irec in recs:
+                if buffer is None:
+                    self.file.seek(self.iposarray[irec], 0)
+                    values = binaryread(
+                        self.file, self.realtype, shape=(self.nrow, self.ncol)
+                    )
+                else:
+                    offset = self.iposarray[irec] - start
+                    values = buffer[offset : offset + databytes].view(self.realtype)
+                    values = values.reshape(self.nrow, self.ncol)
+                if rec_itim[irec] != itim:
+                    if data is not None:
+                        yield self.times[itim], data
+                    itim = rec_itim[irec]
+                    data = np.full(shape, np.nan, dtype=self.realtype)
+                if mflay is None:
+                    data[rec_ilay[irec]] = values
+                else:
+                    data[:] = values
+        if data is not None:
+            yield self.times[itim], data
+
+    def _get_record_time_indices(self, times):
+        """
+        Map each record to the row of a time series result with the same
+        simulation time.
+
+        Parameters
+        ----------
+        times : numpy.ndarray
+            Time column of the result array.
+
+        Returns
+        -------
+        itim : numpy.ndarray
+            Row index for each record in recordarray, or -1 if the record
+            time is not in times.
+
+        """
+        order = np.argsort(times, kind="stable")
+        sorted_times = times[order]
+        totim = self.recordarray["totim"].astype(times.dtype)
+        pos = np.searchsorted(sorted_times, totim, side="right") - 1
+        pos = np.clip(pos, 0, max(len(times) - 1, 0))
+        itim = np.full(len(totim), -1, dtype=np.int64)
+        if len(times) > 0:
+            found = sorted_times[pos] == totim
+            itim[found] = order[pos[found]]
+        return itim
+
+    def _read_values_at(self, offsets):
+        """
+        Read single values at arbitrary byte offsets in the file.
+
+        The file is memory-mapped and the values are gathered with one
+        fancy index; if the file cannot be mapped, the offsets are read
+        in ascending order with seek/read pairs instead.
+
+        Parameters
+        ----------
+        offsets : numpy.ndarray
+            Integer array of byte offsets.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Array of values with the same shape as offsets.
+
+        """
+        dtype = np.dtype(self.realtype)
+        try:
+            mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        except (OSError, ValueError):
+            mm = None
+        if mm is not None:
+            byte_index = offsets[..., None] + np.arange(dtype.itemsize)
+            values = mm[byte_index].view(dtype)[..., 0]
+            del mm
+            return values
+
+        flat = offsets.ravel()
+        order = np.argsort(flat, kind="stable")
+        values = np.empty(flat.shape, dtype=dtype)
+        for iv in order:
+            self.file.seek(int(flat[iv]), 0)
+            values[iv] = binaryread(self.file, self.realtype)[0]
+        return values.reshape(offsets.shape)
+
 
 class HeadFile(BinaryLayerFile):
     """
@@ -476,6 +1016,10 @@ class HeadFile(BinaryLayerFile):
         which enables automatic detection of precision.
     verbose : bool
         Toggle logging output. Default is False.
+    cache_index : bool
+        Save the record index to a ``<filename>.flopyidx`` sidecar file and
+        reuse it instead of rescanning the file while it is unchanged.
+        Default is False.
 
     Examples
     --------
@@ -596,7 +1140,9 @@ class HeadFile(BinaryLayerFile):
         # if we rewrote the original file, reinitialize
         if inplace:
             move(target, filename)
-            super().__init__(filename, self.precision, self.verbose)
+            super().__init__(
+                filename, self.precision, self.verbose, cache_index=self.cache_index
+            )
 
 
 class UcnFile(BinaryLayerFile):
@@ -613,6 +1159,10 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a ``<filename>.flopyidx`` sidecar file and
+        reuse it instead of rescanning the file while it is unchanged.
+        Default is False.
 
     Attributes
     ----------
@@ -683,6 +1233,10 @@ class HeadUFile(BinaryLayerFile):
         enables precision to be automatically detected.
     verbose : bool
         Toggle logging output. Default is False.
+    cache_index : bool
+        Save the record index to a ``<filename>.flopyidx`` sidecar file and
+        reuse it instead of rescanning the file while it is unchanged.
+        Default is False.
 
     Notes
     -----
@@ -847,6 +1401,18 @@ class CellBudgetFile:
         values are 'single' or 'double'. Default is 'single'.
     verbose : bool
         Toggle logging output. Default is False.
+    cache_index : bool
+        Save the record index to a ``<filename>.flopyidx`` sidecar file and
+        reuse it instead of rescanning the file while it is unchanged.
+        Default is False.
+    cache_size : int
+        Maximum total size, in bytes, of records kept in a least recently
+        used cache by get_record and get_data. Cached records are returned
+        as read-only arrays. Default is 0, which disables the cache.
+    memmap : bool
+        Return list-style records (imeth 2, 5 and 6) as read-only views
+        into a memory map of the file instead of reading them into memory.
+        Default is False.
 
     Examples
     --------
@@ -890,6 +1456,12 @@ class CellBudgetFile:
         self.paknamlist_from = []
         self.paknamlist_to = []
         self.compact = True  # compact budget file flag
+        self.cache_index = kwargs.pop("cache_index", False)
+        self.cache_size = kwargs.pop("cache_size", 0)
+        self.memmap = kwargs.pop("memmap", False)
+        self._record_cache = OrderedDict()
+        self._record_cache_nbytes = 0
+        self._mmap = None
         self.dis = None
         self.modelgrid = None
         if "model" in kwargs.keys():
@@ -907,6 +1479,12 @@ class CellBudgetFile:
             args = ",".join(kwargs.keys())
             raise Exception(f"LayerFile error: unrecognized kwargs: {args}")
 
+        if precision == "auto" and self.cache_index:
+            # skip precision detection if a valid sidecar index knows it
+            index = _read_index_cache(self.filename, type(self).__name__)
+            if index is not None:
+                precision = index["precision"].item()
+
         if precision == "auto":
             success = self._set_precision("single")
             if not success:
@@ -1054,6 +1632,105 @@ class CellBudgetFile:
         """
         Build the ordered dictionary, which maps the header information
         to the position in the binary file.
+        """
+        if not (self.cache_index and self._load_index_cache()):
+            self._build_index_scan()
+            if self.cache_index:
+                self._save_index_cache()
+        self.nper = self.recordarray["kper"].max()
+
+        # provide headers as a pandas frame
+        self.headers = pd.DataFrame(self.recordarray, index=self.iposarray)
+        # remove irrelevant columns
+        cols = self.headers.columns.to_list()
+        unique_imeth = self.headers["imeth"].unique()
+        if unique_imeth.max() == 0:
+            drop_cols = cols[cols.index("imeth") :]
+        elif 6 not in unique_imeth:
+            drop_cols = cols[cols.index("modelnam") :]
+        else:
+            drop_cols = []
+        if drop_cols:
+            self.headers.drop(columns=drop_cols, inplace=True)
+        for name in self.headers.columns:
+            dtype = self.header_dtype[name]
+            if np.issubdtype(dtype, bytes):  # convert to str
+                self.headers[name] = (
+                    self.headers[name].str.decode("ascii", "strict").str.strip()
+                )
+
+    def _index_cache_kind(self):
+        return type(self).__name__
+
+    def _load_index_cache(self):
+        """
+        Set the index from the sidecar index file.
+
+        Returns
+        -------
+        success : bool
+            False if the sidecar is missing, stale or was written for a
+            different precision.
+
+        """
+        index = _read_index_cache(self.filename, self._index_cache_kind())
+        if index is None or index["recordarray"].dtype != self.header_dtype:
+            return False
+        self.recordarray = index["recordarray"]
+        self.iposheader = index["iposheader"]
+        self.iposarray = index["iposarray"]
+        self.times = list(index["times"])
+        kstpkper = index["kstpkper"]
+        self.kstpkper = list(zip(kstpkper[:, 0], kstpkper[:, 1]))
+        self.textlist = list(index["textlist"])
+        self.imethlist = list(index["imethlist"])
+        self.paknamlist_from = list(index["paknamlist_from"])
+        self.paknamlist_to = list(index["paknamlist_to"])
+        self.nrow, self.ncol, self.nlay = index["shape"]
+        self.compact = index["compact"].item()
+        self.totalbytes = index["size"].item()
+        self.recorddict = {
+            tuple(header): ipos
+            for header, ipos in zip(self.recordarray, self.iposarray)
+        }
+        return True
+
+    def _save_index_cache(self):
+        """
+        Save the index to the sidecar index file.
+
+        """
+        # times in old-style budget files depend on the dis passed in
+        if len(self.iposarray) == 0 or not self.compact:
+            return
+        header_ranges = [
+            (self.iposheader[0], self.iposarray[0]),
+            (self.iposheader[-1], self.iposarray[-1]),
+        ]
+        kstpkper = np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2)
+        _write_index_cache(
+            self.filename,
+            self._index_cache_kind(),
+            header_ranges,
+            precision="single" if self.realtype == np.float32 else "double",
+            recordarray=self.recordarray,
+            iposheader=self.iposheader,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.realtype),
+            kstpkper=kstpkper,
+            textlist=np.array(self.textlist, dtype="S16"),
+            imethlist=np.array(self.imethlist, dtype=np.int32),
+            paknamlist_from=np.array(self.paknamlist_from, dtype="S16"),
+            paknamlist_to=np.array(self.paknamlist_to, dtype="S16"),
+            shape=np.array([self.nrow, self.ncol, self.nlay], dtype=np.int32),
+            compact=self.compact,
+        )
+
+    def _build_index_scan(self):
+        """
+        Build the index by reading each header in turn and skipping over
+        its data.
+
         """
         # read first record
         header = self._get_header()
@@ -1152,27 +1829,6 @@ class CellBudgetFile:
         self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
         self.iposheader = np.array(self.iposheader, dtype=np.int64)
         self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
-
-        # provide headers as a pandas frame
-        self.headers = pd.DataFrame(self.recordarray, index=self.iposarray)
-        # remove irrelevant columns
-        cols = self.headers.columns.to_list()
-        unique_imeth = self.headers["imeth"].unique()
-        if unique_imeth.max() == 0:
-            drop_cols = cols[cols.index("imeth") :]
-        elif 6 not in unique_imeth:
-            drop_cols = cols[cols.index("modelnam") :]
-        else:
-            drop_cols = []
-        if drop_cols:
-            self.headers.drop(columns=drop_cols, inplace=True)
-        for name in self.headers.columns:
-            dtype = self.header_dtype[name]
-            if np.issubdtype(dtype, bytes):  # convert to str
-                self.headers[name] = (
-                    self.headers[name].str.decode("ascii", "strict").str.strip()
-                )
 
     def _skip_record(self, header):
         """
@@ -1493,6 +2149,7 @@ class CellBudgetFile:
         paknam=None,
         paknam2=None,
         full3D=False,
+        stacked=False,
     ) -> Union[list, np.ndarray]:
         """
         Get data from the binary budget file.
@@ -1521,6 +2178,13 @@ class CellBudgetFile:
             If true, then return the record as a three dimensional numpy
             array, even for those list-style records written as part of a
             'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+        stacked : boolean
+            If true, then return the selected records as a single array
+            stacked along a new first axis, read in one pass through the
+            file. For example, get_data(text='STORAGE', stacked=True)
+            returns all times of one term. Records must be arrays of the
+            same shape, so list-style records require full3D.
+            (Default is False.)
 
         Returns
         -------
@@ -1532,6 +2196,9 @@ class CellBudgetFile:
             array of size (nlay, nrow, ncol) for those list-style
             'COMPACT BUDGET' records written by MODFLOW.
 
+            If stacked is True, then a single array with the records
+            stacked along the first axis is returned instead of a list.
+
         See Also
         --------
 
@@ -1598,11 +2265,48 @@ class CellBudgetFile:
                 "get_data() missing 1 required argument: 'kstpkper', 'totim', "
                 "'idx', or 'text'"
             )
-        return [
-            self.get_record(idx, full3D=full3D)
-            for idx, t in enumerate(select_indices)
-            if t
-        ]
+        indices = np.asarray(select_indices).nonzero()[0]
+        if stacked:
+            return self._get_stacked_records(indices, full3D=full3D)
+        return [self.get_record(idx, full3D=full3D) for idx in indices]
+
+    def _get_stacked_records(self, indices, full3D=False):
+        """
+        Read records into a single array stacked along the first axis.
+
+        Array records (imeth 0 and 1) are read straight into the stacked
+        array in file order, other records are read with get_record.
+
+        """
+        header = self.recordarray[indices]
+        shapes = set(zip(np.abs(header["nlay"]), header["nrow"], header["ncol"]))
+        if len(indices) > 0 and np.isin(header["imeth"], (0, 1)).all():
+            if len(shapes) > 1:
+                raise ValueError("records with different shapes cannot be stacked")
+            shape = shapes.pop()
+            data = np.empty((len(indices),) + shape, dtype=self.realtype)
+            for i, idx in enumerate(indices):
+                key = (int(idx), full3D)
+                if key in self._record_cache:
+                    data[i] = self.get_record(idx, full3D=full3D)
+                    continue
+                self.file.seek(self.iposarray[idx], 0)
+                if self.file.readinto(data[i]) < data[i].nbytes:
+                    raise EOFError
+            return data
+
+        records = [self.get_record(idx, full3D=full3D) for idx in indices]
+        if any(not isinstance(rec, np.ndarray) for rec in records):
+            raise ValueError("only array records can be stacked")
+        if len({rec.shape for rec in records}) > 1 or any(
+            rec.dtype.names is not None for rec in records
+        ):
+            raise ValueError(
+                "records with different shapes cannot be stacked, try full3D=True"
+            )
+        if any(isinstance(rec, np.ma.MaskedArray) for rec in records):
+            return np.ma.stack(records)
+        return np.stack(records)
 
     def get_ts(self, idx, text=None, times=None):
         """
@@ -1783,6 +2487,35 @@ class CellBudgetFile:
         Examples
         --------
 
+        """
+        if self.cache_size <= 0:
+            return self._read_record(idx, full3D=full3D)
+
+        key = (int(np.ravel(idx)[0]), full3D)
+        record = self._record_cache.get(key)
+        if record is not None:
+            self._record_cache.move_to_end(key)
+            return record
+
+        record = self._read_record(idx, full3D=full3D)
+        arrays = record if isinstance(record, list) else [record]
+        nbytes = 0
+        for array in arrays:
+            array.setflags(write=False)
+            nbytes += array.nbytes
+        if nbytes <= self.cache_size:
+            self._record_cache[key] = record
+            self._record_cache_nbytes += nbytes
+            while self._record_cache_nbytes > self.cache_size:
+                _, evicted = self._record_cache.popitem(last=False)
+                evicted = evicted if isinstance(evicted, list) else [evicted]
+                self._record_cache_nbytes -= sum(a.nbytes for a in evicted)
+        return record
+
+    def _read_record(self, idx, full3D=False):
+        """
+        Read a single data record from the budget file, see get_record.
+
         """
         # idx must be an ndarray, so if it comes in as an integer then convert
         if np.isscalar(idx):
@@ -1823,7 +2556,7 @@ class CellBudgetFile:
                 else:
                     s += f"a numpy recarray of size ({nlist}, 2)"
                 print(s)
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = self._read_list(dtype, nlist)
             if full3D:
                 return self.__create3D(data)
             else:
@@ -1873,7 +2606,7 @@ class CellBudgetFile:
                 l.append((auxname.decode("ascii").strip(), self.realtype))
             dtype = np.dtype(l)
             nlist = binaryread(self.file, np.int32)[0]
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = self._read_list(dtype, nlist)
             if full3D:
                 if self.verbose:
                     s += f"a list array of shape ({nlay}, {nrow}, {ncol})"
@@ -1896,7 +2629,7 @@ class CellBudgetFile:
                 l.append((auxname.decode("ascii").strip(), self.realtype))
             dtype = np.dtype(l)
             nlist = binaryread(self.file, np.int32)[0]
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = self._read_list(dtype, nlist)
             if self.verbose:
                 if full3D:
                     s += f"a list array of shape ({nlay}, {nrow}, {ncol})"
@@ -1917,6 +2650,29 @@ class CellBudgetFile:
         # should not reach this point
         return
 
+    def _read_list(self, dtype, nlist):
+        """
+        Read nlist list entries at the current file position. If memmap is
+        True, a read-only view into a memory map of the file is returned.
+
+        """
+        if not self.memmap:
+            return binaryread(self.file, dtype, shape=(nlist,))
+        if self._mmap is None:
+            self._mmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        offset = self.file.tell()
+        if offset + nlist * dtype.itemsize > self._mmap.size:
+            raise EOFError
+        return np.ndarray(shape=(nlist,), dtype=dtype, buffer=self._mmap, offset=offset)
+
+    def clear_cache(self):
+        """
+        Remove all records from the record cache.
+
+        """
+        self._record_cache.clear()
+        self._record_cache_nbytes = 0
+
     def __create3D(self, data):
         """
         Convert a dictionary of {node: q, ...} into a numpy masked array.
@@ -2057,6 +2813,8 @@ class CellBudgetFile:
         Close the file handle
         """
         self.file.close()
+        self.clear_cache()
+        self._mmap = None
 
     def reverse(self, filename: Optional[os.PathLike] = None):
         """
@@ -2206,4 +2964,11 @@ class CellBudgetFile:
         # if we rewrote the original file, reinitialize
         if inplace:
             move(target, filename)
-            self.__init__(filename, self.precision, self.verbose)
+            self.__init__(
+                filename,
+                self.precision,
+                self.verbose,
+                cache_index=self.cache_index,
+                cache_size=self.cache_size,
+                memmap=self.memmap,
+            )
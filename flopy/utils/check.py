@@ -1,3 +1,4 @@
+import hashlib
 import os
 from typing import Optional, Union
 from warnings import warn
@@ -629,6 +630,95 @@ class check:
                 ]
             )
 
+    def get_neighbor_csr(self):
+        """
+        Returns the connections between the model cells in compressed sparse
+        row (CSR) format. The connections are computed once for the model
+        grid and shared by the checks of all packages of the model.
+
+        Returns
+        -------
+        csr : tuple of two 1-D arrays, or None
+            (indptr, indices), where indices[indptr[n]:indptr[n + 1]] are
+            the zero-based node numbers of the neighbors of node n. For a
+            structured grid the neighbors are in k-1, k+1, i-1, i+1, j-1,
+            j+1 order. None is returned for an unstructured grid without a
+            DISU package.
+        """
+        if self.structured:
+            key = tuple(self.model.modelgrid.shape)
+        elif "DISU" in self.model.get_package_list():
+            # the connections are identified by their values, so a changed
+            # or replaced DISU package does not use the connections cached
+            # for another one
+            iac = self.model.disu.iac.array
+            ja = self.model.disu.ja.array
+            digest = hashlib.blake2b(iac.tobytes(), digest_size=16)
+            digest.update(ja.tobytes())
+            key = (iac.size, digest.hexdigest())
+        else:
+            # if no disu, we can't define neighbours for this ugrid
+            return None
+        cached = getattr(self.model, "_neighbor_csr", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if self.structured:
+            nk, ni, nj = key
+            nnodes = nk * ni * nj
+            itype = np.int32 if 6 * nnodes < np.iinfo(np.int32).max else np.int64
+            nodes = np.arange(nnodes, dtype=itype).reshape(key)
+            neighbors = np.full((6, *key), -1, dtype=itype)
+            neighbors[0, 1:] = nodes[:-1]  # k-1
+            neighbors[1, :-1] = nodes[1:]  # k+1
+            neighbors[2, :, 1:] = nodes[:, :-1]  # i-1
+            neighbors[3, :, :-1] = nodes[:, 1:]  # i+1
+            neighbors[4, :, :, 1:] = nodes[:, :, :-1]  # j-1
+            neighbors[5, :, :, :-1] = nodes[:, :, 1:]  # j+1
+            neighbors = neighbors.reshape(6, nnodes).T
+            valid = neighbors >= 0
+            indices = neighbors[valid]
+            counts = valid.sum(axis=1)
+        else:
+            # the first connection of each node is the node itself
+            diagonal = np.ones(ja.size, dtype=bool)
+            diagonal[np.cumsum(iac) - iac] = False
+            indices = ja[diagonal] - 1
+            counts = iac - 1
+        indptr = np.zeros(counts.size + 1, dtype=indices.dtype)
+        np.cumsum(counts, out=indptr[1:])
+        csr = (indptr, indices)
+        self.model._neighbor_csr = (key, csr)
+        return csr
+
+    def has_neighbor(self, a):
+        """
+        Returns True for the cells that have at least one neighbor where a
+        is True.
+
+        Parameters
+        ----------
+        a : boolean array of the model cells, in layer, row, column order
+            for a structured grid and node order for an unstructured grid.
+
+        Returns
+        -------
+        has_neighbor : boolean array, or None
+            Array of the same shape as a. None is returned if the
+            neighbors of the cells are not defined.
+        """
+        csr = self.get_neighbor_csr()
+        if csr is None:
+            return None
+        indptr, indices = csr
+        values = np.asarray(a, dtype=bool).ravel()[indices]
+        starts = indptr[:-1]
+        connected = starts < indptr[1:]
+        result = np.zeros(starts.size, dtype=bool)
+        if values.size > 0:
+            result[connected] = np.logical_or.reduceat(values, starts[connected])
+        return result.reshape(np.shape(a))
+
     def get_neighbors(self, a):
         """
         For a structured grid, this returns the 6 neighboring values for each
@@ -652,45 +742,28 @@ class check:
             for an unstructured grid, as described above. Nan is returned for
             values at edges.
         """
+        if isinstance(a, Util3d):
+            a = a.array
         if self.structured:
             nk, ni, nj = a.shape
-            tmp = np.empty((nk + 2, ni + 2, nj + 2), dtype=float)
-            tmp[:, :, :] = np.nan
-            tmp[1:-1, 1:-1, 1:-1] = a[:, :, :]
-            neighbors = np.vstack(
-                [
-                    tmp[0:-2, 1:-1, 1:-1].ravel(),  # k-1
-                    tmp[2:, 1:-1, 1:-1].ravel(),  # k+1
-                    tmp[1:-1, 0:-2, 1:-1].ravel(),  # i-1
-                    tmp[1:-1, 2:, 1:-1].ravel(),  # i+1
-                    tmp[1:-1, 1:-1, :-2].ravel(),  # j-1
-                    tmp[1:-1, 1:-1, 2:].ravel(),  # j+1
-                ]
-            )
-            return neighbors.reshape(6, nk, ni, nj)
-        else:
-            if "DISU" in self.model.get_package_list():
-                disu = self.model.disu
-                neighbors = disu._neighboring_nodes
-                if isinstance(a, Util3d):
-                    a = a.array
-                pad_value = int(-1e9)
-                n_max = np.max(disu.iac.array) - 1  # -1 for self, removed below
-                arr_neighbors = [
-                    np.pad(
-                        a[n - 1],
-                        (0, n_max - n.size),
-                        "constant",
-                        constant_values=(0, pad_value),
-                    )
-                    for n in neighbors
-                ]
-                arr_neighbors = np.where(arr_neighbors == -1e9, np.nan, arr_neighbors)
-                neighbors = arr_neighbors.T
-            else:
-                # if no disu, we can't define neighbours for this ugrid
-                neighbors = None
+            neighbors = np.full((6, nk, ni, nj), np.nan)
+            neighbors[0, 1:] = a[:-1]  # k-1
+            neighbors[1, :-1] = a[1:]  # k+1
+            neighbors[2, :, 1:] = a[:, :-1]  # i-1
+            neighbors[3, :, :-1] = a[:, 1:]  # i+1
+            neighbors[4, :, :, 1:] = a[:, :, :-1]  # j-1
+            neighbors[5, :, :, :-1] = a[:, :, 1:]  # j+1
             return neighbors
+        csr = self.get_neighbor_csr()
+        if csr is None:
+            return None
+        indptr, indices = csr
+        counts = np.diff(indptr)
+        nodes = np.repeat(np.arange(counts.size), counts)
+        position = np.arange(indices.size) - indptr[nodes]
+        neighbors = np.full((counts.max(initial=0), counts.size), np.nan)
+        neighbors[position, nodes] = np.asarray(a).ravel()[indices]
+        return neighbors
 
 
 def _fmt_string_list(array, float_format="{}"):
@@ -603,6 +603,134 @@ class LayerFile:
         rv[rv == nodata] = np.nan
         return rv
 
+    def reduce(
+        self,
+        ops=("min", "max", "mean"),
+        mflay=None,
+        threshold=None,
+        nodata=None,
+        chunk_records=None,
+    ):
+        """
+        Compute per-cell statistics over all times in the file without
+        loading all of the data at once. Records are read in time order
+        and accumulated in place, so peak memory is a few arrays the size
+        of one time.
+
+        Parameters
+        ----------
+        ops : str or list of str
+            Statistics to compute. Accepted values are 'min', 'max', 'sum',
+            'mean', 'count' (number of times with data), 'exceedance_count'
+            (number of times with values greater than threshold) and
+            'first_exceedance' (first time, totim, with a value greater
+            than threshold). Nan and nodata values are ignored.
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        threshold : float
+            Threshold for 'exceedance_count' and 'first_exceedance'.
+        nodata : float
+            Values equal to nodata are ignored. (Default is None.)
+        chunk_records : int
+            Number of records to read at a time, for files that support
+            buffered reading. Default is about 64 MB worth of records.
+
+        Returns
+        -------
+        result : dict
+            Dictionary of numpy arrays keyed by op. Arrays have size
+            (nlay, nrow, ncol) if mflay is None or (nrow, ncol) if mflay
+            is specified. Cells without data are nan for 'min', 'max',
+            'mean' and 'first_exceedance'.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> stats = hdobj.reduce(["max", "first_exceedance"], threshold=10.)
+
+        """
+        if isinstance(ops, str):
+            ops = [ops]
+        valid_ops = (
+            "min",
+            "max",
+            "sum",
+            "mean",
+            "count",
+            "exceedance_count",
+            "first_exceedance",
+        )
+        for op in ops:
+            if op not in valid_ops:
+                raise ValueError(f"unknown op '{op}', expected one of {valid_ops}")
+        exceed = {"exceedance_count", "first_exceedance"}.intersection(ops)
+        if exceed and threshold is None:
+            raise ValueError(f"threshold must be provided for {sorted(exceed)}")
+
+        acc = {}
+        for totim, data in self._iter_data(mflay=mflay, chunk_records=chunk_records):
+            if nodata is not None:
+                data[data == nodata] = np.nan
+            if not acc:
+                shape = data.shape
+                acc["min"] = np.full(shape, np.nan, dtype=data.dtype)
+                acc["max"] = np.full(shape, np.nan, dtype=data.dtype)
+                acc["sum"] = np.zeros(shape, dtype=np.float64)
+                acc["count"] = np.zeros(shape, dtype=np.int64)
+                acc["exceedance_count"] = np.zeros(shape, dtype=np.int64)
+                acc["first_exceedance"] = np.full(shape, np.nan, dtype=np.float64)
+            valid = ~np.isnan(data)
+            if "min" in ops:
+                np.fmin(acc["min"], data, out=acc["min"])
+            if "max" in ops:
+                np.fmax(acc["max"], data, out=acc["max"])
+            if "sum" in ops or "mean" in ops:
+                np.add(acc["sum"], data, out=acc["sum"], where=valid)
+            acc["count"] += valid
+            if exceed:
+                above = data > threshold
+                acc["exceedance_count"] += above
+                first = above & np.isnan(acc["first_exceedance"])
+                acc["first_exceedance"][first] = totim
+
+        if not acc:
+            raise ValueError("no data in file")
+        result = {}
+        for op in ops:
+            if op == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result[op] = acc["sum"] / acc["count"]
+            else:
+                result[op] = acc[op]
+        return result
+
+    def _iter_data(self, mflay=None, chunk_records=None):
+        """
+        Iterate over the data in the file in time order.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included.
+        chunk_records : int
+            Number of records to read at a time. Not used here, but may be
+            used by subclasses that read records in buffered blocks.
+
+        Yields
+        ------
+        totim : float
+            The simulation time.
+        data : numpy array
+            Array that may be modified by the caller, of size
+            (nlay, nrow, ncol) if mflay is None or (nrow, ncol) otherwise.
+
+        """
+        for totim in self.times:
+            yield totim, self.get_data(totim=totim, mflay=mflay)
+
     def _read_data(self, shp):
         """
         Read data from file
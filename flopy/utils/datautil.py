@@ -1,5 +1,6 @@
 import os
 import shlex
+import threading
 
 import numpy as np
 
@@ -105,6 +106,14 @@ class DatumUtil:
         return None
 
 
+class _SplitState(threading.local):
+    # delimiter detection state of PyListUtil.split_data_line, kept per
+    # thread so that files can be read concurrently
+    delimiter_used = None
+    line_num = 0
+    consistent_delim = False
+
+
 class PyListUtil:
     """
     Class contains miscellaneous methods to work with and compare python lists
@@ -165,9 +174,7 @@ class PyListUtil:
     }
     quote_list = {"'", '"'}
     delimiter_list = {",": 1}
-    delimiter_used = None
-    line_num = 0
-    consistent_delim = False
+    _split_state = _SplitState()
 
     def __init__(self, path=None, max_error=0.01):
         self.max_error = max_error
@@ -299,21 +306,22 @@ class PyListUtil:
 
     @staticmethod
     def reset_delimiter_used():
-        PyListUtil.delimiter_used = None
-        PyListUtil.line_num = 0
-        PyListUtil.consistent_delim = True
+        PyListUtil._split_state.delimiter_used = None
+        PyListUtil._split_state.line_num = 0
+        PyListUtil._split_state.consistent_delim = True
 
     @staticmethod
     def split_data_line(line, external_file=False, delimiter_conf_length=15):
-        if PyListUtil.line_num > delimiter_conf_length and PyListUtil.consistent_delim:
+        state = PyListUtil._split_state
+        if state.line_num > delimiter_conf_length and state.consistent_delim:
             # consistent delimiter has been found.  continue using that
             # delimiter without doing further checks
-            if PyListUtil.delimiter_used is None:
+            if state.delimiter_used is None:
                 comment_split = line.split("#", 1)
                 clean_line = comment_split[0].strip().split()
             else:
                 comment_split = line.split("#", 1)
-                clean_line = comment_split[0].strip().split(PyListUtil.delimiter_used)
+                clean_line = comment_split[0].strip().split(state.delimiter_used)
                 if len(comment_split) > 1:
                     clean_line.append("#")
                     clean_line.append(comment_split[1].strip())
@@ -360,15 +368,14 @@ class PyListUtil:
 
             if max_split_type is not None and max_split_size > 1:
                 clean_line = max_split_list
-                if PyListUtil.line_num == 0:
-                    PyListUtil.delimiter_used = max_split_type
+                if state.line_num == 0:
+                    state.delimiter_used = max_split_type
                 elif (
-                    PyListUtil.delimiter_used != max_split_type
-                    or max_split_type == "combo"
+                    state.delimiter_used != max_split_type or max_split_type == "combo"
                 ):
-                    PyListUtil.consistent_delim = False
+                    state.consistent_delim = False
             if max_split_size > 1:
-                PyListUtil.line_num += 1
+                state.line_num += 1
 
         arr_fixed_line = []
         index = 0
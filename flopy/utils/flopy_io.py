@@ -12,6 +12,10 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
+# older numpy reads integers from float text with a warning instead of
+# raising, so integer lists are not parsed in bulk there
+_loadtxt_rejects_float_text = np.lib.NumpyVersion(np.__version__) >= "1.23.0"
+
 
 def _fmt_string(array, float_format="{}"):
     """
@@ -381,6 +385,87 @@ def get_url_text(url, error_msg=None):
         return
 
 
+def _read_list_block(lines, dtype, free, length=10):
+    """
+    Parse the rows of a list in bulk.
+
+    Parameters
+    ----------
+    lines : list of str
+        one line of text for each row of the list
+    dtype : np.dtype
+        record dtype of the list, with integer and float fields
+    free : bool
+        whether the lines are free format, otherwise each field is
+        length characters wide
+    length : int
+        width of the fields of fixed format lines (default is 10)
+
+    Returns
+    -------
+    data : np.ndarray or None
+        structured array with a row for each line, or None if the lines
+        can not be parsed in bulk, for example when a line has fewer values
+        than there are fields, a fixed format field has more than one
+        value or a value does not match (or does not fit) its field type
+
+    """
+    ncol = len(dtype.names)
+    parse_dtype = []
+    for name in dtype.names:
+        kind = dtype[name].kind
+        if kind in "iu":
+            if not _loadtxt_rejects_float_text:
+                return None
+            # integers that do not fit the field are rejected by numpy
+            parse_dtype.append((name, dtype[name]))
+        elif kind == "f":
+            parse_dtype.append((name, np.float64))
+        else:
+            return None
+    if not free:
+        # view the fixed width fields of the lines as a block of bytes and
+        # parse them with a space after each field, blank fields are zero
+        line_len = ncol * length
+        text = "".join(line.rstrip().ljust(line_len)[:line_len] for line in lines)
+        if not text.isascii():
+            return None
+        fields = np.full((len(lines), ncol, length + 1), ord(" "), np.uint8)
+        fields[:, :, :length] = np.frombuffer(
+            text.encode("ascii"), dtype=np.uint8
+        ).reshape(len(lines), ncol, length)
+        fields[(fields == ord(" ")).all(axis=2), length - 1] = ord("0")
+        lines = fields.reshape(len(lines), -1).tobytes().decode("ascii")
+        lines = [
+            lines[pos : pos + ncol * (length + 1)]
+            for pos in range(0, len(lines), ncol * (length + 1))
+        ]
+        # each field holds exactly one value
+        comments = None
+        usecols = None
+    else:
+        text = "".join(lines)
+        if "," in text:
+            lines = [line.replace(",", " ") for line in lines]
+        # numpy is faster without comments to check for
+        comments = [flag for flag in (";", "#", "!!") if flag in text] or None
+        usecols = range(ncol)
+    try:
+        data = np.loadtxt(
+            lines,
+            dtype=parse_dtype,
+            comments=comments,
+            usecols=usecols,
+            ndmin=1,
+        )
+    except ValueError:
+        return None
+    if data.shape[0] != len(lines):
+        # blank or comment lines
+        return None
+    return data
+
+
 def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     """
     Read a list and allow for open/close, binary, external, sfac, etc.
@@ -478,26 +563,31 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
         ra = ra.view(np.recarray)
 
     # else, read ascii
-    else:
-        for ii in range(nlist):
-            # first line was already read
-            if ii != 0:
-                line = file_handle.readline()
-
-            if model.free_format_input:
-                # whitespace separated
-                t = line_parse(line)
-                if len(t) < ncol:
-                    t = t + (ncol - len(t)) * [0.0]
+    elif nlist > 0:
+        # first line was already read
+        lines = [line] + [file_handle.readline() for ii in range(nlist - 1)]
+        data = _read_list_block(lines, ra.dtype, model.free_format_input)
+        if data is not None:
+            for name in ra.dtype.names:
+                ra[name][:nlist] = data[name]
+        else:
+            # parse one line at a time, also reports the row that can not
+            # be converted
+            for ii, line in enumerate(lines):
+                if model.free_format_input:
+                    # whitespace separated
+                    t = line_parse(line)
+                    if len(t) < ncol:
+                        t = t + (ncol - len(t)) * [0.0]
+                    else:
+                        t = t[:ncol]
+                    t = tuple(t)
+                    ra[ii] = t
                 else:
-                    t = t[:ncol]
-                t = tuple(t)
-                ra[ii] = t
-            else:
-                # fixed format
-                t = read_fixed_var(line, ncol=ncol)
-                t = tuple(t)
-                ra[ii] = t
+                    # fixed format
+                    t = read_fixed_var(line, ncol=ncol)
+                    t = tuple(t)
+                    ra[ii] = t
 
     # scale the data and check
     for column_name in sfac_columns:
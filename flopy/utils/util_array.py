@@ -17,6 +17,10 @@ from ..datbase import DataInterface, DataType
 from ..utils.binaryfile import BinaryHeader
 from ..utils.flopy_io import line_parse
 
+# characters of plain integer and floating point values
+_integer_chars = b"0123456789+- \t\r\n"
+_numeric_chars = _integer_chars + b"eE."
+
 
 class ArrayFormat:
     """
@@ -2472,37 +2476,12 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, "r")
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError("Util2d.load_txt(): no data found")
-            if npl == "free":
-                if "," in line:
-                    line = line.replace(",", " ")
-                if "*" in line:  # use slower method for these types of lines
-                    for item in line.split():
-                        if "*" in item:
-                            num, val = item.split("*")
-                            # repeat val num times
-                            items += int(num) * [val]
-                        else:
-                            items.append(item)
-                else:
-                    items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos : pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+        if npl == "free":
+            data = Util2d._load_txt_free(file_in, num_items, dtype)
+        else:
+            data = Util2d._load_txt_fixed(file_in, num_items, dtype, npl, width)
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError(
                 f"Util2d.load_txt(): expected array size {num_items}, "
@@ -2510,6 +2489,146 @@ class Util2d(DataInterface):
             )
         return data.reshape(shape)
 
+    @staticmethod
+    def _is_numeric_text(text, dtype):
+        """Whether text only holds characters of whitespace separated values
+        of dtype, other text is left to the item by item reader"""
+        if isinstance(text, str):
+            if not text.isascii():
+                return False
+            text = text.encode("ascii")
+        if np.dtype(dtype).kind in "iu":
+            # older numpy reads integers from float text with a warning
+            return not text.translate(None, _integer_chars)
+        return not text.translate(None, _numeric_chars)
+
+    @staticmethod
+    def _parse_rows(lines, dtype):
+        """Parse lines with the same number of whitespace separated values
+        in bulk, returns None if they are not all values of dtype"""
+        if not Util2d._is_numeric_text("".join(lines), dtype):
+            return None
+        try:
+            data = np.loadtxt(lines, dtype=dtype, comments=None, ndmin=2)
+        except ValueError:
+            return None
+        return data.ravel()
+
+    @staticmethod
+    def _parse_txt(text, dtype, num_items):
+        """Parse whitespace separated values from text in bulk, returns
+        None if text does not hold exactly num_items values of dtype"""
+        if num_items == 0:
+            return np.empty(0, dtype=dtype)
+        if not Util2d._is_numeric_text(text, dtype):
+            return None
+        integer = np.dtype(dtype).kind in "iu"
+        try:
+            # numpy wraps integers that do not fit dtype, so read them as
+            # int64 (which saturates) and check their range
+            data = np.fromstring(text, dtype=np.int64 if integer else dtype, sep=" ")
+        except ValueError:
+            return None
+        if data.size != num_items:
+            return None
+        if integer:
+            info = np.iinfo(dtype)
+            limits = np.iinfo(np.int64)
+            if (data < max(info.min, limits.min + 1)).any() or (
+                data > min(info.max, limits.max - 1)
+            ).any():
+                return None
+            data = data.astype(dtype)
+        return data
+
+    @staticmethod
+    def _load_txt_free(file_in, num_items, dtype):
+        """Read num_items values from a FREE format array"""
+        lines = []
+        line_sizes = set()
+        nread = 0
+        while nread < num_items:
+            line = file_in.readline()
+            if len(line) == 0:
+                raise ValueError("Util2d.load_txt(): no data found")
+            if "," in line:
+                line = line.replace(",", " ")
+            if "*" in line:  # use slower method for these types of lines
+                items = []
+                for item in line.split():
+                    if "*" in item:
+                        num, val = item.split("*")
+                        # repeat val num times
+                        items += int(num) * [val]
+                    else:
+                        items.append(item)
+            else:
+                items = line.split()
+            nread += len(items)
+            if nread > num_items:
+                # values after the end of the array are not used
+                items = items[: len(items) - nread + num_items]
+                line = " ".join(items)
+            elif "*" in line:
+                line = " ".join(items)
+            if items:
+                lines.append(line)
+                line_sizes.add(len(items))
+        data = None
+        if len(line_sizes) == 1:
+            data = Util2d._parse_rows(lines, dtype)
+        if data is None:
+            text = "\n".join(lines)
+            data = Util2d._parse_txt(text, dtype, num_items)
+            if data is None:
+                # let numpy report the item that can not be converted
+                data = np.fromiter(text.split(), dtype=dtype, count=num_items)
+        return data
+
+    @staticmethod
+    def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+        """Read num_items values from an array with npl fields of width
+        characters per line, blank fields are skipped"""
+        line_len = npl * width
+        data = []
+        nread = 0
+        while nread < num_items:
+            # each line holds at most npl values, so all of these lines
+            # are needed to fill the array
+            nlines = -(-(num_items - nread) // npl)
+            lines = [file_in.readline() for _ in range(nlines)]
+            if "" in lines:
+                raise ValueError("Util2d.load_txt(): no data found")
+            text = "".join(
+                line.rstrip("\r\n").ljust(line_len)[:line_len] for line in lines
+            )
+            block = None
+            if text.isascii():
+                # view the block as fixed width fields and parse them with a
+                # space after each field, so values that touch are split
+                fields = np.full((nlines * npl, width + 1), ord(" "), np.uint8)
+                fields[:, :width] = np.frombuffer(
+                    text.encode("ascii"), dtype=np.uint8
+                ).reshape(-1, width)
+                nvalues = int((fields != ord(" ")).any(axis=1).sum())
+                block = Util2d._parse_txt(fields.tobytes(), dtype, nvalues)
+            if block is None:
+                # slow path, strip and convert the fields one at a time
+                items = []
+                for line in lines:
+                    for pos in range(0, line_len, width):
+                        item = line[pos : pos + width].strip()
+                        if item:
+                            items.append(item)
+                count = min(len(items), num_items - nread)
+                block = np.fromiter(items, dtype=dtype, count=count)
+            block = block[: num_items - nread]
+            data.append(block)
+            nread += block.size
+        if len(data) == 1:
+            return data[0]
+        return np.concatenate(data)
+
     @staticmethod
     def write_txt(shape, file_out, data, fortran_format="(FREE)", python_format=None):
         if fortran_format.upper() == "(FREE)" and python_format is None:
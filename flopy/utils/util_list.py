@@ -247,19 +247,22 @@ class MfList(DataInterface, DataListInterface):
             mxact = max(mxact, self.get_itmp(kper))
         return mxact
 
+    def __use_free(self):
+        if self.list_free_format is not None:
+            return self.list_free_format
+        use_free = True
+        if self.package.parent.has_package("bas6"):
+            use_free = self.package.parent.bas6.ifrefm
+        # mt3d list data is fixed format
+        if "mt3d" in self.package.parent.version.lower():
+            use_free = False
+        return use_free
+
     @property
     def fmt_string(self):
         """Returns a C-style fmt string for numpy savetxt that corresponds to
         the dtype"""
-        if self.list_free_format is not None:
-            use_free = self.list_free_format
-        else:
-            use_free = True
-            if self.package.parent.has_package("bas6"):
-                use_free = self.package.parent.bas6.ifrefm
-            # mt3d list data is fixed format
-            if "mt3d" in self.package.parent.version.lower():
-                use_free = False
+        use_free = self.__use_free()
         fmts = []
         for field in self.dtype.descr:
             vtype = field[1][1].lower()
@@ -747,7 +750,26 @@ class MfList(DataInterface, DataListInterface):
             d = np.array(d, dtype=dtype2)
             d.tofile(f)
         else:
-            np.savetxt(f, d, fmt=self.fmt_string, delimiter="")
+            text = self.__totext(d)
+            if hasattr(f, "write"):
+                f.write(text)
+            else:
+                with open(f, "w") as fw:
+                    fw.write(text)
+
+    def __totext(self, data):
+        """Format a recarray as text lines with fmt_string, the records are
+        built from whole columns instead of numpy records"""
+        fmt = self.fmt_string + "\n"
+        # free format writes real values with %s, as str() of numpy reals
+        use_free = self.__use_free()
+        columns = []
+        for name in data.dtype.names:
+            column = data[name]
+            if use_free and column.dtype.kind == "f":
+                column = column.astype(str)
+            columns.append(column.tolist())
+        return "".join([fmt % rec for rec in zip(*columns)])
 
     def check_kij(self):
         names = self.dtype.names
@@ -978,6 +1000,45 @@ class MfList(DataInterface, DataListInterface):
         >>> ml = flopy.modflow.Modflow.load('test.nam')
         >>> v = ml.wel.stress_period_data.to_array(kper=1)
 
+        """
+        arrays = self.to_array_all(kpers=[kper], mask=mask)
+        return {name: arr[0] for name, arr in arrays.items()}
+
+    def to_array_all(self, kpers=None, mask=False, names=None):
+        """
+        Convert stress period boundary condition (MfList) data for several
+        stress periods to stacked numpy arrays
+
+        Parameters
+        ----------
+        kpers : list of int
+            MODFLOW zero-based stress period numbers to return. (default is
+            None, which returns all stress periods of the model)
+        mask : boolean
+            return arrays with np.nan instead of zero
+        names : list of str
+            MfList dtype names to return. (default is None, which returns
+            all of them)
+        Returns
+        -------
+        out : dict of numpy.ndarrays
+            Dictionary of 4-D numpy arrays, with shape
+            (len(kpers), nlay, nrow, ncol), containing the stress period
+            data for the selected stress periods. Unstructured data have
+            shape (len(kpers), nlay * ncpl). The dictionary keys are the
+            MfList dtype names for the stress period data ('cond', 'flux',
+            'bhead', etc.).
+
+        See Also
+        --------
+        to_array
+
+        Examples
+        --------
+        >>> import flopy
+        >>> ml = flopy.modflow.Modflow.load('test.nam')
+        >>> v = ml.wel.stress_period_data.to_array_all(kpers=[0, 1])
+
         """
         i0 = 3
         unstructured = False
@@ -989,70 +1050,79 @@ class MfList(DataInterface, DataListInterface):
                 i0 = 1
                 unstructured = True
 
-        arrays = {}
-        for name in self.dtype.names[i0:]:
-            if not self.dtype.fields[name][0] == object:
-                if unstructured:
-                    arr = np.zeros((self._model.nlay * self._model.ncpl,))
-                else:
-                    arr = np.zeros(
-                        (self._model.nlay, self._model.nrow, self._model.ncol)
-                    )
-                arrays[name] = arr.copy()
-
-        # if this kper is not found
-        if kper not in self.data.keys():
-            kpers = list(self.data.keys())
-            kpers.sort()
-            # if this kper is before the first entry,
-            # (maybe) mask and return
-            if kper < kpers[0]:
-                if mask:
-                    for name, arr in arrays.items():
-                        arrays[name][:] = np.nan
-                return arrays
-            # find the last kper
-            else:
+        if unstructured:
+            shape = (self._model.nlay * self._model.ncpl,)
+            index_names = ["node"]
+        else:
+            shape = (self._model.nlay, self._model.nrow, self._model.ncol)
+            index_names = ["k", "i", "j"]
+        if kpers is None:
+            kpers = range(self._model.nper)
+        kpers = list(kpers)
+        names = [
+            name
+            for name in self.dtype.names[i0:]
+            if not self.dtype.fields[name][0] == object
+            and (names is None or name in names)
+        ]
+
+        # collect the records of each stress period, data are reused by
+        # the stress periods that follow until they are replaced
+        data_kpers = sorted(self.data.keys())
+        records = []
+        iper = []
+        loaded = {}
+        for n, kper in enumerate(kpers):
+            if kper not in self.data.keys():
+                # if this kper is before the first entry, there are no entries
+                if kper < data_kpers[0]:
+                    continue
+                # find the last kper
                 kper = self.__find_last_kper(kper)
-
-        sarr = self.data[kper]
-        if isinstance(sarr, str):
-            sarr = self.__fromfile(sarr)
-
-        if np.isscalar(sarr):
+            if kper not in loaded:
+                sarr = self.data[kper]
+                if isinstance(sarr, str):
+                    sarr = self.__fromfile(sarr)
+                if np.isscalar(sarr) and sarr != 0:
+                    raise ValueError(
+                        "MfList: expected no entries for period "
+                        f"{kper} but found {sarr}"
+                    )
+                loaded[kper] = sarr
+            sarr = loaded[kper]
             # if there are no entries for this kper
-            if sarr == 0:
-                if mask:
-                    for name, arr in arrays.items():
-                        arrays[name][:] = np.nan
-                return arrays
-            raise ValueError(
-                f"MfList: expected no entries for period {kper} but found {sarr}"
-            )
+            if np.isscalar(sarr) or len(sarr) == 0:
+                continue
+            records.append(sarr)
+            iper.append(np.full(len(sarr), n))
+
+        # flattened index of each record in the stacked arrays
+        size = len(kpers) * int(np.prod(shape))
+        if records:
+            index = [np.concatenate(iper)]
+            for name in index_names:
+                index.append(np.concatenate([sarr[name] for sarr in records]))
+            cells = np.ravel_multi_index(index, (len(kpers), *shape))
+        else:
+            cells = np.empty(0, dtype=int)
+        cnt = np.zeros(size, dtype=float)
+        np.add.at(cnt, cells, 1.0)
 
-        for name, arr in arrays.items():
-            if unstructured:
-                cnt = np.zeros((self._model.nlay * self._model.ncpl,), dtype=float)
-            else:
-                cnt = np.zeros(
-                    (self._model.nlay, self._model.nrow, self._model.ncol), dtype=float
-                )
-            for rec in sarr:
-                if unstructured:
-                    arr[rec["node"]] += rec[name]
-                    cnt[rec["node"]] += 1.0
-                else:
-                    arr[rec["k"], rec["i"], rec["j"]] += rec[name]
-                    cnt[rec["k"], rec["i"], rec["j"]] += 1.0
+        arrays = {}
+        for name in names:
+            arr = np.zeros(size, dtype=float)
+            if records:
+                values = np.concatenate([sarr[name] for sarr in records])
+                np.add.at(arr, cells, values)
             # average keys that should not be added
             if name not in ("cond", "flux"):
                 idx = cnt > 0.0
                 arr[idx] /= cnt[idx]
+            arr = arr.reshape((len(kpers), *shape))
             if mask:
-                arr = np.ma.masked_where(cnt == 0.0, arr)
-                arr[cnt == 0.0] = np.nan
-
-            arrays[name] = arr.copy()
+                arr = np.ma.masked_where(cnt.reshape(arr.shape) == 0.0, arr)
+                arr[cnt.reshape(arr.shape) == 0.0] = np.nan
+            arrays[name] = arr
         return arrays
 
     @property
@@ -1060,20 +1130,16 @@ class MfList(DataInterface, DataListInterface):
         return dict(self.masked_4D_arrays_itr())
 
     def masked_4D_arrays_itr(self):
-        nper = self._model.nper
-
-        # get the first kper array to extract array shape and names
-        arrays_kper_0 = self.to_array(kper=0, mask=True)
-        shape_per_spd = next(iter(arrays_kper_0.values())).shape
-
-        for name in arrays_kper_0.keys():
-            ma = np.zeros((nper, *shape_per_spd))
-            for kper in range(nper):
-                # If new_arrays is not None, overwrite arrays
-                if new_arrays := self.to_array(kper=kper, mask=True):
-                    arrays = new_arrays
-                ma[kper] = arrays[name]
-            yield name, ma
+        # one field at a time, so only one 4D array is held in memory
+        i0 = 3
+        if "node" in self.dtype.names:
+            if "i" not in self.dtype.names and "j" not in self.dtype.names:
+                i0 = 1
+        for name in self.dtype.names[i0:]:
+            if self.dtype.fields[name][0] == object:
+                continue
+            ma = self.to_array_all(mask=True, names=[name])[name]
+            yield name, np.asarray(ma)
 
     @property
     def array(self):
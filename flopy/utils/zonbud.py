@@ -1,6 +1,6 @@
 import copy
 import os
-from itertools import groupby
+from itertools import groupby, pairwise
 from typing import Union
 
 import numpy as np
@@ -32,6 +32,13 @@ class ZoneBudget:
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    n_workers : int
+        Number of worker processes used to compute the budget. The times
+        are split into contiguous blocks that are computed by separate
+        processes, each with its own handle on the cell budget file.
+        Default is 1, which computes the budget in this process. The
+        budget is always computed in this process if cbc_obj was created
+        with model, dis or modelgrid information.
 
     Returns
     -------
@@ -55,6 +62,7 @@ class ZoneBudget:
         totim=None,
         aliases=None,
         verbose=False,
+        n_workers=1,
         **kwargs,
     ):
         from .binaryfile import CellBudgetFile
@@ -191,6 +199,11 @@ class ZoneBudget:
             n for n in self.record_names if n not in internal_flow_terms
         ]
 
+        # Zone index of each cell and cell strides of the face flow axes
+        self._zoneidx = np.searchsorted(self.allzones, izone).ravel()
+        self._strides = (self.nrow * self.ncol, self.ncol, 1)
+        self._face_incidence = {}
+
         # Initialize budget recordarray
         array_list = []
         if self.kstpkper is not None:
@@ -207,95 +220,21 @@ class ZoneBudget:
                 array_list.append(recordarray)
         self._budget = np.concatenate(array_list, axis=0)
 
-        # Update budget record array
-        if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                if verbose:
-                    s = (
-                        "Computing the budget for"
-                        " time step {} in stress period {}".format(kk[0] + 1, kk[1] + 1)
-                    )
-                    print(s)
-                self._compute_budget(kstpkper=kk)
-        elif self.totim is not None:
-            for t in self.totim:
-                if verbose:
-                    s = f"Computing the budget for time {t}"
-                    print(s)
-                self._compute_budget(totim=t)
-
-    def _compute_budget(self, kstpkper=None, totim=None):
-        """
-        Creates a budget for the specified zone array. This function only
-        supports the use of a single time step/stress period or time.
-
-        Parameters
-        ----------
-        kstpkper : tuple
-            Tuple of kstp and kper to compute budget for (default is None).
-        totim : float
-            Totim to compute budget for (default is None).
-
-        Returns
-        -------
-        None
-
-        """
-        # Initialize an array to track where the constant head cells
-        # are located.
-        ich = np.zeros(self.cbc_shape, self.int_type)
-        swiich = np.zeros(self.cbc_shape, self.int_type)
-
-        if "CONSTANT HEAD" in self.record_names:
-            """
-            C-----CONSTANT-HEAD FLOW -- DON'T ACCUMULATE THE CELL-BY-CELL VALUES FOR
-            C-----CONSTANT-HEAD FLOW BECAUSE THEY MAY INCLUDE PARTIALLY CANCELING
-            C-----INS AND OUTS.  USE CONSTANT-HEAD TERM TO IDENTIFY WHERE CONSTANT-
-            C-----HEAD CELLS ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF
-            C-----FLOW.  STORE CONSTANT-HEAD LOCATIONS IN ICH ARRAY.
-            """
-            chd = self.cbc.get_data(
-                text="CONSTANT HEAD", full3D=True, kstpkper=kstpkper, totim=totim
-            )[0]
-            ich[np.ma.where(chd != 0.0)] = 1
-        if "FLOW RIGHT FACE" in self.record_names:
-            self._accumulate_flow_frf("FLOW RIGHT FACE", ich, kstpkper, totim)
-        if "FLOW FRONT FACE" in self.record_names:
-            self._accumulate_flow_fff("FLOW FRONT FACE", ich, kstpkper, totim)
-        if "FLOW LOWER FACE" in self.record_names:
-            self._accumulate_flow_flf("FLOW LOWER FACE", ich, kstpkper, totim)
-        if "SWIADDTOCH" in self.record_names:
-            swichd = self.cbc.get_data(
-                text="SWIADDTOCH", full3D=True, kstpkper=kstpkper, totim=totim
-            )[0]
-            swiich[swichd != 0] = 1
-        if "SWIADDTOFRF" in self.record_names:
-            self._accumulate_flow_frf("SWIADDTOFRF", swiich, kstpkper, totim)
-        if "SWIADDTOFFF" in self.record_names:
-            self._accumulate_flow_fff("SWIADDTOFFF", swiich, kstpkper, totim)
-        if "SWIADDTOFLF" in self.record_names:
-            self._accumulate_flow_flf("SWIADDTOFLF", swiich, kstpkper, totim)
-
-        # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
-        # ACCUMULATE THE FLOW BY ZONE
-        # iterate over remaining items in the list
-        for recname in self.ssst_record_names:
-            self._accumulate_flow_ssst(recname, kstpkper, totim)
-
-        # Compute mass balance terms
-        self._compute_mass_balance(kstpkper, totim)
-
-        return
+        # Update budget record array; the workers reopen the budget file
+        # by name, so a file read with model or dis information (used for
+        # the times of non-compact files) is computed in this process
+        parallel = self.cbc.dis is None and self.cbc.modelgrid is None
+        if n_workers > 1 and len(array_list) > 1 and parallel:
+            self._compute_budgets_parallel(n_workers, aliases, verbose=verbose)
+        else:
+            self._compute_budgets(verbose=verbose)
 
-    def _add_empty_record(self, recordarray, recname, kstpkper=None, totim=None):
+    def _get_time(self, kstpkper=None, totim=None):
         """
-        Build an empty records based on the specified flow direction and
-        record name for the given list of zones.
+        Get the simulation time and time step/stress period of a budget.
 
         Parameters
         ----------
-        recordarray :
-        recname :
         kstpkper : tuple
             Tuple of kstp and kper to compute budget for (default is None).
         totim : float
@@ -303,7 +242,7 @@ class ZoneBudget:
 
         Returns
         -------
-        recordarray : np.recarray
+        totim, kstpkper : float, tuple
 
         """
         if kstpkper is not None:
@@ -316,12 +255,7 @@ class ZoneBudget:
                 kstpkper = self.cbc_kstpkper[self.cbc_times.index(totim)]
             else:
                 kstpkper = (0, 0)
-
-        row = [totim, kstpkper[0], kstpkper[1], recname]
-        row += [0.0 for _ in self._zonenamedict.values()]
-        recs = np.array(tuple(row), dtype=recordarray.dtype)
-        recordarray = np.append(recordarray, recs)
-        return recordarray
+        return totim, kstpkper
 
     def _initialize_budget_recordarray(self, kstpkper=None, totim=None):
         """
@@ -337,6 +271,7 @@ class ZoneBudget:
 
         Returns
         -------
+        recordarray : np.recarray
 
         """
 
@@ -349,711 +284,389 @@ class ZoneBudget:
         ]
         dtype_list += [(n, self.float_type) for n in self._zonenamedict.values()]
         dtype = np.dtype(dtype_list)
-        recordarray = np.array([], dtype=dtype)
-
-        # Add "from" records
-        if "STORAGE" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "FROM_STORAGE", kstpkper, totim
-            )
-        if "CONSTANT HEAD" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "FROM_CONSTANT_HEAD", kstpkper, totim
-            )
-        for recname in self.ssst_record_names:
-            if recname != "STORAGE":
-                recordarray = self._add_empty_record(
-                    recordarray, "FROM_" + "_".join(recname.split()), kstpkper, totim
-                )
-
-        for z, n in self._zonenamedict.items():
-            if z == 0 and 0 not in self.allzones:
-                continue
-            else:
-                recordarray = self._add_empty_record(
-                    recordarray, "FROM_" + "_".join(n.split()), kstpkper, totim
-                )
-        recordarray = self._add_empty_record(recordarray, "TOTAL_IN", kstpkper, totim)
 
-        # Add "out" records
-        if "STORAGE" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "TO_STORAGE", kstpkper, totim
-            )
-        if "CONSTANT HEAD" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "TO_CONSTANT_HEAD", kstpkper, totim
-            )
-        for recname in self.ssst_record_names:
-            if recname != "STORAGE":
-                recordarray = self._add_empty_record(
-                    recordarray, "TO_" + "_".join(recname.split()), kstpkper, totim
-                )
-
-        for z, n in self._zonenamedict.items():
-            if z == 0 and 0 not in self.allzones:
-                continue
-            else:
-                recordarray = self._add_empty_record(
-                    recordarray, "TO_" + "_".join(n.split()), kstpkper, totim
-                )
-        recordarray = self._add_empty_record(recordarray, "TOTAL_OUT", kstpkper, totim)
-
-        recordarray = self._add_empty_record(recordarray, "IN-OUT", kstpkper, totim)
-        recordarray = self._add_empty_record(
-            recordarray, "PERCENT_DISCREPANCY", kstpkper, totim
-        )
+        recnames = []
+        for direction in ("FROM_", "TO_"):
+            if "STORAGE" in self.record_names:
+                recnames.append(direction + "STORAGE")
+            if "CONSTANT HEAD" in self.record_names:
+                recnames.append(direction + "CONSTANT_HEAD")
+            for recname in self.ssst_record_names:
+                if recname != "STORAGE":
+                    recnames.append(direction + "_".join(recname.split()))
+            for n in self._zonenamedict.values():
+                recnames.append(direction + "_".join(n.split()))
+            recnames.append("TOTAL_IN" if direction == "FROM_" else "TOTAL_OUT")
+        recnames += ["IN-OUT", "PERCENT_DISCREPANCY"]
+
+        totim, kstpkper = self._get_time(kstpkper, totim)
+        recordarray = np.zeros(len(recnames), dtype=dtype)
+        recordarray["totim"] = totim
+        recordarray["time_step"] = kstpkper[0]
+        recordarray["stress_period"] = kstpkper[1]
+        recordarray["name"] = recnames
         return recordarray
 
-    @staticmethod
-    def _filter_circular_flow(fz, tz, f):
+    def _get_face_incidence(self, axis):
         """
+        Get the faces between cells in different zones along an axis and
+        the zone pairs they connect, sorted by zone pair.
+
+        The incidence only depends on the zone array, so it is computed
+        once and reused for all times.
 
         Parameters
         ----------
-        fz
-        tz
-        f
+        axis : int
+            Axis of the face flow term, 0 for layers, 1 for rows and 2
+            for columns.
 
         Returns
         -------
+        faces : ndarray
+            Flat index of the cell on the lower side of each face.
+        order : ndarray
+            Sort order of the positive and negative face flows, which are
+            concatenated, by (from zone, to zone) pair.
+        starts : ndarray
+            Start of each zone pair in the sorted face flows.
+        fromzone, tozone : ndarray
+            Zone indices of each zone pair.
+
+        """
+        if axis in self._face_incidence:
+            return self._face_incidence[axis]
+
+        zoneidx = self._zoneidx.reshape(self.cbc_shape)
+        lower = [slice(None)] * 3
+        upper = [slice(None)] * 3
+        lower[axis] = slice(None, -1)
+        upper[axis] = slice(1, None)
+        cells = np.arange(zoneidx.size).reshape(self.cbc_shape)
+        za = zoneidx[tuple(lower)].ravel()
+        zb = zoneidx[tuple(upper)].ravel()
+        boundary = za != zb
+        faces = cells[tuple(lower)].ravel()[boundary]
+        za, zb = za[boundary], zb[boundary]
+
+        # positive face flows go from the lower to the upper cell and
+        # negative face flows from the upper to the lower cell
+        nzones = len(self.allzones)
+        pairs = np.concatenate((za * nzones + zb, zb * nzones + za))
+        order = np.argsort(pairs, kind="stable")
+        pairs, starts = np.unique(pairs[order], return_index=True)
+        incidence = (faces, order, starts, pairs // nzones, pairs % nzones)
+        self._face_incidence[axis] = incidence
+        return incidence
+
+    def _get_record(self, recname, kstpkper=None, totim=None, full3D=False):
+        """
+        Get the first record with a record name for a time, or None if
+        the record is not saved for the time.
+
+        """
+        data = self.cbc.get_data(
+            text=recname, kstpkper=kstpkper, totim=totim, full3D=full3D
+        )
+        if len(data) == 0:
+            return None
+        return data[0]
 
+    def _compute_budgets(self, verbose=False):
         """
-        e = np.equal(fz, tz)
-        fz = fz[np.logical_not(e)]
-        tz = tz[np.logical_not(e)]
-        f = f[np.logical_not(e)]
-        return fz, tz, f
+        Compute the budget for the specified zone array for all times.
 
-    def _update_budget_fromfaceflow(self, fz, tz, f, kstpkper=None, totim=None):
-        """
+        Flows between zones are summed for all times at once from the
+        faces between cells in different zones, which are only found
+        once. Constant-head and source/sink/storage terms are summed by
+        zone for each time.
 
         Parameters
         ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
+        verbose : bool
+            Print the time step of each budget that is computed.
 
         Returns
         -------
+        None
 
         """
+        if self.kstpkper is not None:
+            times = [{"kstpkper": kk} for kk in self.kstpkper]
+        else:
+            times = [{"totim": t} for t in self.totim]
+        ntimes = len(times)
+        nzones = len(self.allzones)
 
-        # No circular flow within zones
-        fz, tz, f = self._filter_circular_flow(fz, tz, f)
-
-        if len(f) == 0:
-            return
-
-        # Inflows
-        idx = tz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["FROM_" + self._zonenamedict[z] for z in fzi]
-        colnames = [self._zonenamedict[z] for z in tzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper, totim)
-
-        # Outflows
-        idx = fz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["TO_" + self._zonenamedict[z] for z in tzi]
-        colnames = [self._zonenamedict[z] for z in fzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper, totim)
-        return
-
-    def _update_budget_fromssst(self, fz, tz, f, kstpkper=None, totim=None):
-        """
+        recnames = list(self._budget["name"][: len(self._budget) // ntimes])
+        rows = {n: i for i, n in enumerate(recnames)}
+        zonenames = ["_".join(n.split()) for n in self._zonenamedict.values()]
+        from_rows = np.array([rows["FROM_" + n] for n in zonenames])
+        to_rows = np.array([rows["TO_" + n] for n in zonenames])
+        budget = np.zeros((ntimes, len(recnames), nzones))
 
-        Parameters
-        ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
+        # INTERNAL FLOW TERMS ARE USED TO CALCULATE FLOW BETWEEN ZONES.
+        # CONSTANT-HEAD TERMS ARE USED TO IDENTIFY WHERE CONSTANT-HEAD CELLS
+        # ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF FLOW.
+        # SWIADDTO--- terms are used by the SWI2 groundwater flow process.
+        face_terms = [
+            (
+                "CONSTANT HEAD",
+                ("FLOW LOWER FACE", "FLOW FRONT FACE", "FLOW RIGHT FACE"),
+            ),
+            ("SWIADDTOCH", ("SWIADDTOFLF", "SWIADDTOFFF", "SWIADDTOFRF")),
+        ]
+        face_terms = [
+            (
+                chname,
+                [(axis, n) for axis, n in enumerate(names) if n in self.record_names],
+            )
+            for chname, names in face_terms
+        ]
 
-        Returns
-        -------
+        # face flows across zone boundaries for all times
+        face_flows = {}
+        for _, terms in face_terms:
+            for axis, recname in terms:
+                faces = self._get_face_incidence(axis)[0]
+                face_flows[recname] = np.zeros((len(faces), ntimes))
+
+        for itime, kwargs in enumerate(times):
+            if verbose:
+                if "kstpkper" in kwargs:
+                    kk = kwargs["kstpkper"]
+                    print(
+                        "Computing the budget for"
+                        f" time step {kk[0] + 1} in stress period {kk[1] + 1}"
+                    )
+                else:
+                    print(f"Computing the budget for time {kwargs['totim']}")
+            for chname, terms in face_terms:
+                # C-----CONSTANT-HEAD FLOW -- DON'T ACCUMULATE THE CELL-BY-CELL
+                # C-----VALUES FOR CONSTANT-HEAD FLOW BECAUSE THEY MAY INCLUDE
+                # C-----PARTIALLY CANCELING INS AND OUTS.  USE CONSTANT-HEAD
+                # C-----TERM TO IDENTIFY WHERE CONSTANT-HEAD CELLS ARE AND THEN
+                # C-----USE FACE FLOWS TO DETERMINE THE AMOUNT OF FLOW.
+                ich = np.zeros(self._zoneidx.size, dtype=bool)
+                if chname in self.record_names:
+                    chd = self._get_record(chname, full3D=True, **kwargs)
+                    if chd is not None:
+                        ich = np.ma.filled(chd != 0.0, False).ravel()
+                for axis, recname in terms:
+                    data = self._get_record(recname, **kwargs)
+                    if data is None:
+                        continue
+                    data = np.ma.filled(data, 0.0).ravel()
+                    self._accumulate_constant_head(budget[itime], rows, data, ich, axis)
+                    # Don't include CH to CH flow (can occur if CHTOCH
+                    # option is used)
+                    faces = self._get_face_incidence(axis)[0]
+                    upper = faces + self._strides[axis]
+                    q = data[faces]
+                    q[ich[faces] & ich[upper]] = 0.0
+                    face_flows[recname][:, itime] = q
+
+            # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
+            # ACCUMULATE THE FLOW BY ZONE
+            for recname in self.ssst_record_names:
+                self._accumulate_flow_ssst(budget[itime], rows, recname, kwargs)
+
+        # COMPUTE FLOW BETWEEN ZONES ACROSS FACES. FLOW IS SUMMED FOR EACH
+        # (FROM ZONE, TO ZONE) PAIR FOR ALL TIMES AT ONCE.
+        for _, terms in face_terms:
+            for axis, recname in terms:
+                _, order, starts, fz, tz = self._get_face_incidence(axis)
+                if len(starts) == 0:
+                    continue
+                q = face_flows.pop(recname)
+                q = np.concatenate((np.maximum(q, 0.0), np.maximum(-q, 0.0)))
+                flows = np.add.reduceat(q[order], starts, axis=0).T
 
-        """
-        if len(f) == 0:
-            return
-        self._update_budget_recordarray(fz, tz, f, kstpkper, totim)
-        return
+                # Inflows
+                idx = self.allzones[tz] != 0
+                budget[:, from_rows[fz[idx]], tz[idx]] += flows[:, idx]
 
-    def _update_budget_recordarray(
-        self, rownames, colnames, fluxes, kstpkper=None, totim=None
-    ):
-        """
-        Update the budget record array with the flux for the specified
-        flow direction (in/out), record name, and column.
+                # Outflows
+                idx = self.allzones[fz] != 0
+                budget[:, to_rows[tz[idx]], fz[idx]] += flows[:, idx]
 
-        Parameters
-        ----------
-        rownames
-        colnames
-        fluxes
-        kstpkper
-        totim
+        # Compute mass balance terms
+        isin = np.array([n.startswith("FROM_") for n in recnames])
+        isout = np.array([n.startswith("TO_") for n in recnames])
+        intot = budget[:, isin].sum(axis=1)
+        outot = budget[:, isout].sum(axis=1)
+        budget[:, rows["TOTAL_IN"]] = intot
+        budget[:, rows["TOTAL_OUT"]] = outot
+        budget[:, rows["IN-OUT"]] = np.abs(intot - outot)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            budget[:, rows["PERCENT_DISCREPANCY"]] = np.abs(
+                100 * (intot - outot) / ((intot + outot) / 2.0)
+            )
 
-        Returns
-        -------
-        None
+        for j, n in enumerate(self._zonenamedict.values()):
+            self._budget[n] = budget[:, :, j].ravel()
 
+    def _compute_budgets_parallel(self, n_workers, aliases=None, verbose=False):
         """
-        try:
-            if kstpkper is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.asarray(
-                        (self._budget["time_step"] == kstpkper[0])
-                        & (self._budget["stress_period"] == kstpkper[1])
-                        & (self._budget["name"] == rn)
-                    ).nonzero()
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.asarray(
-                        (self._budget["totim"] == totim) & (self._budget["name"] == rn)
-                    ).nonzero()
-                    self._budget[cn][rowidx] += flux
-
-        except Exception as e:
-            print(e)
-            raise
-        return
+        Compute the budget for all times with a pool of worker processes.
 
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
-        """
+        The times are split into contiguous blocks, the budget of each
+        block is computed by a separate ZoneBudget in a worker process
+        and the blocks are merged in time order.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        n_workers : int
+            Number of worker processes.
+        aliases : dict
+            Zone aliases, see ZoneBudget.
+        verbose : bool
+            Print the time step of each budget that is computed.
 
         Returns
         -------
+        None
 
         """
-        try:
-            if self.ncol >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
-                # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
-                # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
-                # 1ST, CALCULATE FLOW BETWEEN NODE J,I,K AND J-1,I,K
-
-                k, i, j = np.asarray(
-                    self.izone[:, :, 1:] > self.izone[:, :, :-1]
-                ).nonzero()
+        from concurrent.futures import ProcessPoolExecutor
 
-                # Adjust column values to account for the starting position of "nz"
-                j += 1
-
-                # Define the zone to which flow is going
-                nz = self.izone[k, i, j]
-
-                # Define the zone from which flow is coming
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-
-                # Get the face flow
-                q = data[k, i, jl]
-
-                # Get indices with positive flow face values (out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # Get indices with negative flow face values (into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzl[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # FLOW BETWEEN NODE J,I,K AND J+1,I,K
-                k, i, j = np.asarray(
-                    self.izone[:, :, :-1] > self.izone[:, :, 1:]
-                ).nonzero()
-
-                # Define the zone from which flow is coming
-                nz = self.izone[k, i, j]
-
-                # Define the zone to which flow is going
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-
-                # Get the face flow
-                q = data[k, i, j]
-
-                # Get indices with positive flow face values (out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzr[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # Get indices with negative flow face values (into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[j > 0], i[j > 0], j[j > 0]
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-                nz = self.izone[k, i, j]
-                q = data[k, i, jl]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi[tzi != 0]]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[j < self.ncol - 1],
-                    i[j < self.ncol - 1],
-                    j[j < self.ncol - 1],
+        if self.kstpkper is not None:
+            times, key = self.kstpkper, "kstpkper"
+        else:
+            times, key = self.totim, "totim"
+        n_workers = min(n_workers, len(times))
+        bounds = np.linspace(0, len(times), n_workers + 1).astype(int)
+        precision = "single" if self.cbc.realtype == np.float32 else "double"
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(
+                    _compute_zone_budget,
+                    self.cbc.filename,
+                    precision,
+                    self.izone,
+                    aliases=aliases,
+                    verbose=verbose,
+                    **{key: list(times[i0:i1])},
                 )
-                nz = self.izone[k, i, j]
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+                for i0, i1 in pairwise(bounds)
+            ]
+            budgets = [future.result() for future in futures]
+        self._budget = np.concatenate(budgets, axis=0)
 
-        except Exception as e:
-            print(e)
-            raise
-
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
+    def _accumulate_constant_head(self, budget, rows, data, ich, axis):
         """
+        Accumulate the flow to and from constant-head cells along an axis
+        by the zone of the constant-head cell.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        budget : ndarray
+            Budget of a single time of shape (nrecords, nzones).
+        rows : dict
+            Budget row of each record name.
+        data : ndarray
+            Flat face flow array.
+        ich : ndarray
+            Flat boolean array, True for constant-head cells.
+        axis : int
+            Axis of the face flow term.
 
         Returns
         -------
+        None
 
         """
-        try:
-            if self.nrow >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW FRONT FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
-                k, i, j = np.asarray(
-                    self.izone[:, 1:, :] < self.izone[:, :-1, :]
-                ).nonzero()
-                i += 1
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I+1,K.
-                k, i, j = np.asarray(
-                    self.izone[:, :-1, :] < self.izone[:, 1:, :]
-                ).nonzero()
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[i > 0], i[i > 0], j[i > 0]
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[i < self.nrow - 1],
-                    i[i < self.nrow - 1],
-                    j[i < self.nrow - 1],
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
-        """
+        cells = np.asarray(ich).nonzero()[0]
+        if len(cells) == 0:
+            return
+        nzones = len(self.allzones)
+        stride = self._strides[axis]
+        position = np.unravel_index(cells, self.cbc_shape)[axis]
+        flow_to = np.zeros(nzones)
+        flow_from = np.zeros(nzones)
+
+        # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
+        # face between the previous cell and the constant-head cell
+        ch = cells[position > 0]
+        ch = ch[~ich[ch - stride]]
+        q = data[ch - stride]
+        zoneidx = self._zoneidx[ch]
+        flow_to += np.bincount(zoneidx, np.maximum(q, 0.0), minlength=nzones)
+        flow_from += np.bincount(zoneidx, np.maximum(-q, 0.0), minlength=nzones)
+
+        # face between the constant-head cell and the next cell
+        ch = cells[position < self.cbc_shape[axis] - 1]
+        ch = ch[~ich[ch + stride]]
+        q = data[ch]
+        zoneidx = self._zoneidx[ch]
+        flow_from += np.bincount(zoneidx, np.maximum(q, 0.0), minlength=nzones)
+        flow_to += np.bincount(zoneidx, np.maximum(-q, 0.0), minlength=nzones)
+
+        if "TO_CONSTANT_HEAD" in rows:
+            budget[rows["TO_CONSTANT_HEAD"]] += flow_to
+        if "FROM_CONSTANT_HEAD" in rows:
+            budget[rows["FROM_CONSTANT_HEAD"]] += flow_from
+
+    def _accumulate_flow_ssst(self, budget, rows, recname, kwargs):
+        """
+        Accumulate a source/sink or storage term by zone.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        budget : ndarray
+            Budget of a single time of shape (nrecords, nzones).
+        rows : dict
+            Budget row of each record name.
+        recname : str
+            Record name of the term.
+        kwargs : dict
+            kstpkper or totim of the budget.
 
         Returns
         -------
+        None
 
         """
-        try:
-            if self.nlay >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW LOWER FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
-                k, i, j = np.asarray(
-                    self.izone[1:, :, :] < self.izone[:-1, :, :]
-                ).nonzero()
-                k += 1
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K+1
-                k, i, j = np.asarray(
-                    self.izone[:-1, :, :] < self.izone[1:, :, :]
-                ).nonzero()
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[k > 0], i[k > 0], j[k > 0]
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[k < self.nlay - 1],
-                    i[k < self.nlay - 1],
-                    j[k < self.nlay - 1],
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        except Exception as e:
-            print(e)
-            raise
-
-    def _accumulate_flow_ssst(self, recname, kstpkper, totim):
-        # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
-        # ACCUMULATE THE FLOW BY ZONE
-
-        imeth = self.imeth[recname]
-
-        data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)
-        if len(data) == 0:
+        data = self._get_record(recname, **kwargs)
+        if data is None:
             # Empty data, can occur during the first time step of a transient
             # model when storage terms are zero and not in the cell-budget
             # file.
             return
-        else:
-            data = data[0]
 
+        imeth = self.imeth[recname]
         if imeth == 2 or imeth == 5:
             # LIST
-            qin = np.ma.zeros((self.nlay * self.nrow * self.ncol), self.float_type)
-            qout = np.ma.zeros((self.nlay * self.nrow * self.ncol), self.float_type)
-            for [node, q] in zip(data["node"], data["q"]):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
-            qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
-            qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
+            cells = data["node"] - 1
+            q = np.asarray(data["q"])
         elif imeth == 0 or imeth == 1:
             # FULL 3-D ARRAY
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
+            cells = np.arange(self._zoneidx.size)
+            q = np.ma.filled(data, 0.0).ravel()
         elif imeth == 3:
             # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
             rlay, rdata = data[0], data[1]
-            data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
+            cells = (rlay.ravel() - 1) * self.nrow * self.ncol + np.arange(rlay.size)
+            q = rdata.ravel()
         elif imeth == 4:
             # 1-LAYER ARRAY THAT DEFINES LAYER 1
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            r, c = np.asarray(data > 0).nonzero()
-            qin[0, r, c] = data[r, c]
-            r, c = np.asarray(data < 0).nonzero()
-            qout[0, r, c] = data[r, c]
+            cells = np.arange(data.size)
+            q = np.ma.filled(data, 0.0).ravel()
         else:
             # Should not happen
             raise Exception(f'Unrecognized "imeth" for {recname} record: {imeth}')
 
-        # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("FROM_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("TO_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-    def _compute_mass_balance(self, kstpkper, totim):
-        # Returns a record array with total inflow, total outflow,
-        # and percent error summed by column.
-        skipcols = ["time_step", "stress_period", "totim", "name"]
-
-        # Compute inflows
-        recnames = self.get_record_names()
-        innames = [n for n in recnames if n.startswith("FROM_")]
-        outnames = [n for n in recnames if n.startswith("TO_")]
-        if kstpkper is not None:
-            rowidx = np.asarray(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.isin(self._budget["name"], innames)
-            ).nonzero()
-        elif totim is not None:
-            rowidx = np.asarray(
-                (self._budget["totim"] == totim)
-                & np.isin(self._budget["name"], innames)
-            ).nonzero()
-        a = _numpyvoid2numeric(self._budget[list(self._zonenamedict.values())][rowidx])
-        intot = np.array(a.sum(axis=0))
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["TOTAL_IN"] * len(tz))
-        self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
-
-        # Compute outflows
-        if kstpkper is not None:
-            rowidx = np.asarray(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.isin(self._budget["name"], outnames)
-            ).nonzero()
-        elif totim is not None:
-            rowidx = np.asarray(
-                (self._budget["totim"] == totim)
-                & np.isin(self._budget["name"], outnames)
-            ).nonzero()
-        a = _numpyvoid2numeric(self._budget[list(self._zonenamedict.values())][rowidx])
-        outot = np.array(a.sum(axis=0))
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["TOTAL_OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, outot, kstpkper, totim)
-
-        # Compute IN-OUT
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        f = intot - outot
-        fz = np.array(["IN-OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Compute percent discrepancy
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["PERCENT_DISCREPANCY"] * len(tz))
-        in_minus_out = intot - outot
-        in_plus_out = intot + outot
-        f = 100 * in_minus_out / (in_plus_out / 2.0)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        # flows in zone 0 are not accumulated
+        nzones = len(self.allzones)
+        zoneidx = self._zoneidx[cells]
+        qin = np.bincount(zoneidx, np.maximum(q, 0.0), minlength=nzones)
+        qout = np.bincount(zoneidx, np.maximum(-q, 0.0), minlength=nzones)
+        qin[self.allzones == 0] = 0.0
+        qout[self.allzones == 0] = 0.0
+        name = "_".join(recname.split())
+        budget[rows["FROM_" + name]] += qin
+        budget[rows["TO_" + name]] += qout
 
     def get_model_shape(self):
         """Get model shape
@@ -2170,6 +1783,17 @@ class ZoneFile6:
         return zon
 
 
+def _compute_zone_budget(filename, precision, izone, **kwargs):
+    """
+    Compute the budget record array of a ZoneBudget in a worker process.
+
+    """
+    from .binaryfile import CellBudgetFile
+
+    with CellBudgetFile(filename, precision=precision) as cbc:
+        return ZoneBudget(cbc, izone, **kwargs)._budget
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric